@@ -1,8 +1,7 @@
-from time import sleep
 from schema import dab_response_validator
 from dab_tester import YesNoQuestion, Default_Validations
 from util.enforcement_manager import EnforcementManager
-import jsons
+from dab_client import response_data
 
 def launch(test_result, durationInMs=0,expectedLatencyMs=0):
     try:
@@ -10,10 +9,9 @@ def launch(test_result, durationInMs=0,expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response  = jsons.loads(test_result.response)
+    response  = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(5)
     return YesNoQuestion(test_result, "App started?") and Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def launch_with_content(test_result, durationInMs=0,expectedLatencyMs=0):
@@ -23,10 +21,9 @@ def launch_with_content(test_result, durationInMs=0,expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response  = jsons.loads(test_result.response)
+    response  = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(5)
     return YesNoQuestion(test_result, "App started with playback?") and Default_Validations(test_result, durationInMs, expectedLatencyMs)
     
 def exit(test_result, durationInMs=0,expectedLatencyMs=0):
@@ -35,10 +32,9 @@ def exit(test_result, durationInMs=0,expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response  = jsons.loads(test_result.response)
+    response  = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(5)
     return YesNoQuestion(test_result, "App exited?") and Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def list(test_result, durationInMs=0,expectedLatencyMs=0):
@@ -47,12 +43,11 @@ def list(test_result, durationInMs=0,expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response  = jsons.loads(test_result.response)
+    response  = response_data(test_result.response)
     if response['status'] != 200:
         return False
     for application in response['applications']:
         EnforcementManager().add_supported_application(application['appId'])
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def get_state(test_result, durationInMs=0,expectedLatencyMs=0):
@@ -61,10 +56,9 @@ def get_state(test_result, durationInMs=0,expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response  = jsons.loads(test_result.response)
+    response  = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def install(test_result, durationInMs=0, expectedLatencyMs=0):
@@ -73,10 +67,9 @@ def install(test_result, durationInMs=0, expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response = jsons.loads(test_result.response)
+    response = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def uninstall(test_result, durationInMs=0, expectedLatencyMs=0):
@@ -85,10 +78,9 @@ def uninstall(test_result, durationInMs=0, expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response = jsons.loads(test_result.response)
+    response = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def clear_data(test_result, durationInMs=0, expectedLatencyMs=0):
@@ -97,10 +89,9 @@ def clear_data(test_result, durationInMs=0, expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response = jsons.loads(test_result.response)
+    response = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def install_from_appstore(test_result, durationInMs=0, expectedLatencyMs=0):
@@ -109,8 +100,7 @@ def install_from_appstore(test_result, durationInMs=0, expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response = jsons.loads(test_result.response)
+    response = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
\ No newline at end of file
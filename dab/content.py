@@ -1,6 +1,5 @@
-from time import sleep
 from dab_tester import YesNoQuestion, Default_Validations
-import jsons
+from dab_client import response_data
 from schema import dab_response_validator
 
 def open(test_result, durationInMs=0,expectedLatencyMs=0):
@@ -9,10 +8,9 @@ def open(test_result, durationInMs=0,expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response  = jsons.loads(test_result.response)
+    response  = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def search(test_result, durationInMs=0,expectedLatencyMs=0):
@@ -21,10 +19,9 @@ def search(test_result, durationInMs=0,expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response = jsons.loads(test_result.response)
+    response = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def recommendations(test_result, durationInMs=0,expectedLatencyMs=0):
@@ -33,8 +30,7 @@ def recommendations(test_result, durationInMs=0,expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response  = jsons.loads(test_result.response)
+    response  = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
@@ -1,7 +1,6 @@
 from schema import dab_response_validator
-from time import sleep
 from dab_tester import YesNoQuestion, Default_Validations
-import jsons
+from dab_client import response_data
 
 def info(test_result, durationInMs=0,expectedLatencyMs=0):
     try:
@@ -9,8 +8,7 @@ def info(test_result, durationInMs=0,expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response  = jsons.loads(test_result.response)
+    response  = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
\ No newline at end of file
@@ -1,12 +1,20 @@
 from schema import dab_response_validator
-from time import sleep
-from dab_tester import YesNoQuestion, Default_Validations
+from dab_tester import YesNoQuestion, Default_Validations, Settle
+from util.test_scheduler import PASSIVE_KEYS
 from util.enforcement_manager import EnforcementManager
 import json
+from dab_client import response_data
+
+KEY_SETTLE = 1  # seconds for the UI to finish reacting to a key before the next test presses another
 
 class KeyList:
     key_list = []
 
+def _settle_after_key(request):
+    # Volume and mute keys move nothing on screen; nothing to let finish
+    if request.get('keyCode') not in PASSIVE_KEYS:
+        Settle(KEY_SETTLE, f"UI reacts to {request.get('keyCode')}")
+
 def key_press(test_result, durationInMs=0, expectedLatencyMs=None):
     try:
         dab_response_validator.validate_dab_response_schema(test_result.response)
@@ -14,7 +22,7 @@ def key_press(test_result, durationInMs=0, expectedLatencyMs=None):
         print("Schema error:", error)
         return False
     request = json.loads(test_result.request)
-    response  = json.loads(test_result.response)
+    response  = response_data(test_result.response)
     # No list available, assuming everything is required.
     if len(KeyList.key_list) <=0:
         if response['status'] != 200:
@@ -26,7 +34,7 @@ def key_press(test_result, durationInMs=0, expectedLatencyMs=None):
         else:
             if response['status'] != 501:
                 return False
-    sleep(1)
+    _settle_after_key(request)
 
     # Remove YesNoQuestion → directly validate
     if isinstance(expectedLatencyMs, int):
@@ -41,7 +49,7 @@ def long_key_press(test_result, durationInMs=0, expectedLatencyMs=None):
         print("Schema error:", error)
         return False
     request = json.loads(test_result.request)
-    response  = json.loads(test_result.response)
+    response  = response_data(test_result.response)
     # No list available, assuming everything is required.
     if len(KeyList.key_list) <=0:
         if response['status'] != 200:
@@ -54,7 +62,7 @@ def long_key_press(test_result, durationInMs=0, expectedLatencyMs=None):
             if response['status'] != 501:
                 return False
 
-    sleep(1)
+    _settle_after_key(request)
     # Remove YesNoQuestion → directly validate
     if isinstance(expectedLatencyMs, int):
         return Default_Validations(test_result, durationInMs, expectedLatencyMs)
@@ -67,12 +75,11 @@ def list(test_result, durationInMs=0, expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response  = json.loads(test_result.response)
+    response  = response_data(test_result.response)
     if response['status'] != 200:
         return False
     if len(response['keyCodes']) <=0:
         return False
     KeyList.key_list = response['keyCodes']
     EnforcementManager().add_supported_keys(KeyList.key_list)
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
@@ -1,10 +1,10 @@
 # dab/output.py
 from schema import dab_response_validator
-from time import sleep
 from dab_tester import YesNoQuestion, Default_Validations
 from util.output_image_handler import save_output_image
 from logger import LOGGER  # ← add this import
-import jsons, os
+from dab_client import response_data
+import os
 
 def image(test_result, durationInMs=0, expectedLatencyMs=0):
     # 1) Schema validation
@@ -16,7 +16,7 @@ def image(test_result, durationInMs=0, expectedLatencyMs=0):
 
     # 2) Parse response
     try:
-        response = jsons.loads(test_result.response) if isinstance(test_result.response, str) else test_result.response
+        response = response_data(test_result.response)
     except Exception as e:
         LOGGER.warn(f"Schema error: Could not parse JSON: {e}")
         return False
@@ -1,6 +1,5 @@
-from time import sleep
 from dab_tester import YesNoQuestion, Default_Validations
-import jsons
+from dab_client import response_data
 from schema import dab_response_validator
 from util.enforcement_manager import EnforcementManager
 from logger import LOGGER
@@ -13,7 +12,7 @@ def restart(test_result, durationInMs=0,expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response  = jsons.loads(test_result.response)
+    response  = response_data(test_result.response)
     if response['status'] != 200:
         return False
     LOGGER.info("system/restart issued. Device will reboot; subsequent preflight health-check will wait for readiness.")
@@ -25,10 +24,9 @@ def settings_get(test_result, durationInMs=0,expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response  = jsons.loads(test_result.response)
+    response  = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def settings_set(test_result, durationInMs=0,expectedLatencyMs=0):
@@ -37,15 +35,14 @@ def settings_set(test_result, durationInMs=0,expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response = jsons.loads(test_result.response)
+    response = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def settings_list(test_result, durationInMs=0, expectedLatencyMs=0):
     try:
-        response = jsons.loads(test_result.response)
+        response = response_data(test_result.response)
     except Exception as error:
         LOGGER.warn(f"system/settings/list: JSON parse error: {error}")
         try:
@@ -87,7 +84,6 @@ def settings_list(test_result, durationInMs=0, expectedLatencyMs=0):
             test_result.logs.extend([line1, line2])
 
     # Proceed with your existing timing/latency validations
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def start_log_collection(test_result, durationInMs=0, expectedLatencyMs=0):
@@ -96,10 +92,9 @@ def start_log_collection(test_result, durationInMs=0, expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response = jsons.loads(test_result.response)
+    response = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def stop_log_collection(test_result, durationInMs=0, expectedLatencyMs=0):
@@ -108,10 +103,9 @@ def stop_log_collection(test_result, durationInMs=0, expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response = jsons.loads(test_result.response)
+    response = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def setup_skip(test_result, durationInMs=0, expectedLatencyMs=0):
@@ -120,10 +114,9 @@ def setup_skip(test_result, durationInMs=0, expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response = jsons.loads(test_result.response)
+    response = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def power_mode_get(test_result, durationInMs=0, expectedLatencyMs=0):
@@ -132,10 +125,9 @@ def power_mode_get(test_result, durationInMs=0, expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response = jsons.loads(test_result.response)
+    response = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
 
 def power_mode_set(test_result, durationInMs=0, expectedLatencyMs=0):
@@ -144,8 +136,7 @@ def power_mode_set(test_result, durationInMs=0, expectedLatencyMs=0):
     except Exception as error:
         print("Schema error:", error)
         return False
-    response = jsons.loads(test_result.response)
+    response = response_data(test_result.response)
     if response['status'] != 200:
         return False
-    sleep(0.1)
     return Default_Validations(test_result, durationInMs, expectedLatencyMs)
@@ -1,12 +1,19 @@
-from dab_client import DabClient
+from dab_client import DabClient, response_data
 from schema import dab_response_validator
 from util.enforcement_manager import EnforcementManager
 from util.enforcement_manager import ValidateCode
-from time import sleep
 import json
 import re
 import types
 from logger import LOGGER  # <— use the shared singleton logger
+from util import clock
+
+APP_STATE_TIMEOUT = 5     # seconds an app may take to reach the state a launch/exit asked for
+VOICE_SET_TIMEOUT = 5     # seconds a voice/set may take to show in voice/list
+LOGS_COLLECT_SETTLE = 10  # seconds of logs to collect between start-collection and the stop under test
+CHECK_POLL_INTERVAL = 0.25
+CHECK_POLL_BACKOFF = 1.5
+CHECK_POLL_MAX_INTERVAL = 1.0
 
 class DabChecker:
     def __init__(self, dab_tester):
@@ -336,7 +343,7 @@ class DabChecker:
         if code == 0:
             self.logger.ok(f"Received a valid response from '{dab_topic}'.")
             try:
-                response = json.loads(dab_response)
+                response = response_data(dab_response)
             except Exception as e:
                 self.logger.warn(f"Response payload from '{dab_topic}' was not valid JSON: {e}")
                 return None
@@ -624,8 +631,8 @@ class DabChecker:
         dab_precheck_body = json.dumps({"voiceSystem": voice_assistant}, indent = 4)
 
         self.__execute_cmd(device_id, dab_precheck_topic, dab_precheck_body)
-        sleep(5)
-        validate_result, precheck_log = self.__check_voice_set(device_id, dab_precheck_body)
+        validate_result, precheck_log = self.__poll_check(
+            lambda: self.__check_voice_set(device_id, dab_precheck_body), VOICE_SET_TIMEOUT)
 
         if validate_result:
             prechecker_log = f"\nvoice system {request_voice_system} is enabled on this device. Ongoing...\n"
@@ -723,8 +730,8 @@ class DabChecker:
 
         self.logger.info("Start logs collection.")
         dab_response = self.__execute_cmd(device_id, dab_precheck_topic, dab_precheck_body)
-        self.logger.info(f"Waiting for 10 sec after start log-collection")
-        sleep(10)
+        # Nothing to poll: stop-collection needs some logs to have been collected first
+        self.dab_tester.settle(LOGS_COLLECT_SETTLE, "logs collect after start-collection")
         if dab_response:
             prechecker_log = f"\nlogs collection is started on this device. Ongoing...\n"
             validate_code = ValidateCode.SUPPORT
@@ -792,15 +799,31 @@ class DabChecker:
             else:
                 expected_state = 'STOPPED'
 
-        validate_result = False
-        actual_state = 'UNKNOWN'
-
-        dab_response = self.__execute_cmd(device_id, dab_check_topic, dab_check_body)
-        if dab_response and 'state' in dab_response:
-            actual_state = dab_response['state']
-            validate_result = True if actual_state == expected_state else False
-
-        checker_log = f"\napplication {appId} State, Expected: {expected_state}, Actual: {actual_state}\n"
+        def read_state():
+            actual_state = 'UNKNOWN'
+            dab_response = self.__execute_cmd(device_id, dab_check_topic, dab_check_body)
+            if dab_response and 'state' in dab_response:
+                actual_state = dab_response['state']
+            checker_log = f"\napplication {appId} State, Expected: {expected_state}, Actual: {actual_state}\n"
+            return actual_state == expected_state, checker_log
+
+        # The app may still be getting there when the launch/exit answers; poll instead of sleeping
+        return self.__poll_check(read_state, APP_STATE_TIMEOUT)
+
+    def __poll_check(self, check, timeout):
+        """Repeat check() -> (result, log) until the result is true or timeout seconds have passed."""
+        deadline = clock.monotonic() + timeout
+        interval = CHECK_POLL_INTERVAL
+        polls = 1
+        start = clock.monotonic()
+        validate_result, checker_log = check()
+        while not validate_result and clock.monotonic() < deadline:
+            clock.sleep(min(interval, max(0.0, deadline - clock.monotonic())), "checker poll")
+            interval = min(interval * CHECK_POLL_BACKOFF, CHECK_POLL_MAX_INTERVAL)
+            validate_result, checker_log = check()
+            polls += 1
+        if polls > 1:
+            self.logger.info(f"[check] {'met' if validate_result else 'not met'} after {clock.monotonic() - start:.1f}s ({polls} poll(s)).")
         return validate_result, checker_log
 
     def __check_system_settings_set(self, device_id, dab_request_body):
@@ -1,34 +1,484 @@
-from time import sleep
-from threading import Lock
+from time import perf_counter_ns
+import asyncio
+from threading import Lock, Event, Condition, local
+from collections import OrderedDict, deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from paho.mqtt.properties import Properties
-from paho.mqtt.packettypes import PacketTypes 
+from paho.mqtt.packettypes import PacketTypes
 import paho.mqtt.client as mqtt
 import json
 import uuid
-from logger import LOGGER 
+from logger import LOGGER
+from util import clock
 
 METRICS_TIMES = 5
+REQUEST_TIMEOUT = 90  # seconds to wait for a DAB response
+METRICS_TIMEOUT = 30  # seconds to wait for telemetry metrics
+SUBACK_TIMEOUT = 5    # seconds to wait for the per-device response subscription to be acknowledged
+PUBLISH_MARKS_MAX = 256  # publish-acknowledged marks kept for requests whose reply has not been matched yet
+MIN_REQUEST_TIMEOUT = 5        # seconds; no operation is given up on sooner than this
+EXPECTED_LATENCY_MARGIN = 3    # timeout = expected latency x margin (capped at REQUEST_TIMEOUT unless the expectation exceeds it)
+OBSERVED_LATENCY_MARGIN = 4    # timeout = slowest recent reply on this device x margin
+OBSERVED_SAMPLES = 20          # recent latencies kept per operation
+OBSERVED_MIN_SAMPLES = 3       # replies needed before observations tighten an operation's timeout
+DISCOVERY_CACHE_TTL = 10       # seconds a discovery answer is trusted before the device is rediscovered
+# Operations that take the device off the bus; sending one drops its cached discovery answer
+REBOOT_OPERATIONS = ("system/restart", "system/factory-reset", "system/network-reset")
+TRANSPORT_LOST = 101           # status of a request whose broker connection dropped before the reply arrived
+CONNECT_TIMEOUT = 10           # seconds connect() waits for the CONNACK
+RECONNECT_MIN_DELAY = 1        # seconds; paho doubles the delay after each failed reconnect...
+RECONNECT_MAX_DELAY = 30       # ...up to this
+SESSION_EXPIRY = 300           # seconds the broker keeps our subscriptions across a dropped connection
+# Operations answered by a stream of replies; these arrive on the telemetry connection
+STREAMED_OPERATIONS = ("system/logs/stop-collection",)
+CHUNK_QUEUE_MAX = 64           # streamed replies buffered for the active request; further ones are dropped until the reader catches up
 
-class DabClient:
+class RequestTiming:
+    """
+    perf_counter_ns marks for one request: when it was handed to paho, when paho reported
+    the publish done (PUBACK at QoS 1, socket write at QoS 0), and when the reply reached
+    the paho receive callback.
+    """
+    def __init__(self):
+        self.published_ns = None
+        self.acked_ns = None
+        self.received_ns = None
+
+    @property
+    def latency_ms(self):
+        # Request → response time on the wire, without lock hand-off or validation overhead
+        if self.published_ns is None or self.received_ns is None:
+            return None
+        return round((self.received_ns - self.published_ns) / 1e6, 3)
+
+    def as_dict(self):
+        return {
+            "published_ns": self.published_ns,
+            "acked_ns": self.acked_ns,
+            "received_ns": self.received_ns,
+            "latency_ms": self.latency_ms,
+        }
+
+class DabResponse(str):
+    """
+    A DAB reply as it arrived: the payload text (so it can be used anywhere a response
+    string was used before), the raw bytes in .raw, and the JSON body in .data, which is
+    decoded on first access and then shared by every reader.
+    """
+    def __new__(cls, payload=b""):
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        raw = bytes(payload or b"")
+        response = super().__new__(cls, raw.decode("utf-8", errors="replace"))
+        response.raw = raw
+        response.timing = None
+        response._parsed = False
+        response._data = None
+        return response
+
+    def __getnewargs__(self):
+        # copy/pickle rebuild from the raw bytes
+        return (self.raw,)
+
+    @property
+    def data(self):
+        # Parsed body, or None when the payload is not valid JSON
+        if not self._parsed:
+            try:
+                self._data = json.loads(self.raw)
+            except Exception:
+                self._data = None
+            self._parsed = True
+        return self._data
+
+def response_data(response):
+    """
+    Parsed body of a response. Reuses the cached parse of a DabResponse; plain JSON text
+    (older callers, stored results) is decoded as before. Raises ValueError if it is not JSON.
+    """
+    if isinstance(response, DabResponse):
+        if response.data is None:
+            raise ValueError("Response payload is not valid JSON")
+        return response.data
+    if isinstance(response, (dict, list)):
+        return response
+    return json.loads(response)
+
+class TransportLost(Exception):
+    """The broker connection dropped while a request was in flight (or it could not be sent)."""
+    pass
+
+def status_of(response_dic):
+    # DAB status of a parsed response, or -1 when it carries none
+    try:
+        return response_dic['status']
+    except:
+        return -1
+
+class TimeoutPolicy:
+    """
+    How long to wait for each DAB operation. The ceiling for an operation comes from its
+    expected latency (see seed() / expect()); once a few replies have been seen on this
+    device the timeout is tightened towards what the device actually takes. Operations
+    with no expectation fall back to the default passed to timeout_for().
+    """
+    def __init__(self):
+        self.__expected_ms = {}
+        self.__observed_ms = {}
+        self.__lock = Lock()
+
+    def seed(self, test_cases):
+        # Take the expected latencies of a test table (topic, body, validator, expected_latency_ms, ...)
+        for test_case in test_cases:
+            try:
+                self.expect(test_case[0], test_case[3])
+            except Exception:
+                continue
+
+    def expect(self, operation, expected_latency_ms):
+        if not isinstance(operation, str) or isinstance(expected_latency_ms, bool):
+            return
+        if not isinstance(expected_latency_ms, (int, float)) or expected_latency_ms <= 0:
+            return
+        with self.__lock:
+            # Several cases share an operation (e.g. system/settings/set); keep the most generous one
+            self.__expected_ms[operation] = max(expected_latency_ms, self.__expected_ms.get(operation, 0))
+
+    def observe(self, operation, latency_ms):
+        if latency_ms is None:
+            return
+        with self.__lock:
+            samples = self.__observed_ms.setdefault(operation, deque(maxlen=OBSERVED_SAMPLES))
+            samples.append(latency_ms)
+
+    def timeout_for(self, operation, default=None):
+        """Seconds to wait for a reply to operation."""
+        default = REQUEST_TIMEOUT if default is None else default
+        with self.__lock:
+            expected_ms = self.__expected_ms.get(operation)
+            samples = list(self.__observed_ms.get(operation, ()))
+
+        if expected_ms is None:
+            ceiling = default
+            floor = MIN_REQUEST_TIMEOUT
+        else:
+            expected_s = expected_ms / 1000
+            ceiling = max(MIN_REQUEST_TIMEOUT, min(expected_s * EXPECTED_LATENCY_MARGIN, max(default, expected_s)))
+            # A reply within the expected latency must never be cut off
+            floor = max(MIN_REQUEST_TIMEOUT, expected_s)
+
+        if len(samples) < OBSERVED_MIN_SAMPLES:
+            return ceiling
+        observed = max(samples) / 1000 * OBSERVED_LATENCY_MARGIN
+        return min(ceiling, max(floor, observed))
+
+class LivenessTracker:
+    """
+    When each device last answered a request successfully (2xx, any operation). A device
+    becomes suspect again when it is sent a reboot operation, a request to it times out or
+    fails with 5xx, or the control connection drops.
+    """
     def __init__(self):
+        self.__seen = {}
         self.__lock = Lock()
-        self.__lock.acquire()
+
+    def seen(self, device_id):
+        with self.__lock:
+            self.__seen[device_id] = clock.monotonic()
+
+    def suspect(self, device_id=None):
+        # Forget the last proof of life of device_id (of every device when None)
+        with self.__lock:
+            if device_id is None:
+                self.__seen.clear()
+            else:
+                self.__seen.pop(device_id, None)
+
+    def age(self, device_id):
+        # Seconds since device_id last answered successfully, or None
+        with self.__lock:
+            seen = self.__seen.get(device_id)
+        return None if seen is None else clock.monotonic() - seen
+
+    def alive_within(self, device_id, ttl):
+        age = self.age(device_id)
+        return age is not None and age <= ttl
+
+class ChunkQueue:
+    """
+    Bounded, thread-safe queue of the parsed replies streamed back for the active request.
+    open() makes a streamed request the active one and drops whatever was left from the previous one;
+    replies to any other request are not accepted, so memory stays at most maxsize chunks.
+    put() runs on the paho network thread and never waits: a chunk that finds the queue full is dropped.
+    """
+    def __init__(self, maxsize=CHUNK_QUEUE_MAX):
+        self.__chunks = deque()
+        self.__maxsize = maxsize
+        self.__cond = Condition()
+        self.__correlation_id = None
+        self.__topic = None
+
+    def open(self, correlation_id, topic):
+        with self.__cond:
+            self.__chunks.clear()
+            self.__correlation_id = correlation_id
+            self.__topic = topic
+            self.__cond.notify_all()
+
+    def accepts(self, correlation_id, topic):
+        # Tagged replies match on correlation ID; untagged ones on the active request's response topic
+        with self.__cond:
+            if correlation_id is not None:
+                return correlation_id == self.__correlation_id
+            return topic == self.__topic
+
+    def put(self, chunk, correlation_id, topic):
+        """
+        Queue a chunk of the active request without waiting.
+        Returns False if it was dropped: another request became active, or the queue is full.
+        """
+        with self.__cond:
+            active = correlation_id == self.__correlation_id if correlation_id is not None else topic == self.__topic
+            if not active or len(self.__chunks) >= self.__maxsize:
+                return False
+            self.__chunks.append(chunk)
+            self.__cond.notify_all()
+            return True
+
+    def get(self, timeout=None):
+        """Next chunk, waiting up to timeout seconds (None = forever, 0 = don't wait). None if there is none."""
+        with self.__cond:
+            if not self.__cond.wait_for(lambda: self.__chunks, timeout=timeout):
+                return None
+            chunk = self.__chunks.popleft()
+            self.__cond.notify_all()
+            return chunk
+
+    def iter(self, idle_timeout=None):
+        """
+        Iterate over the chunks as they arrive. Stops after a chunk reporting remainingChunks 0,
+        or when nothing arrives for idle_timeout seconds.
+        """
+        while True:
+            chunk = self.get(idle_timeout)
+            if chunk is None:
+                return
+            yield chunk
+            if isinstance(chunk, dict) and chunk.get("remainingChunks") == 0:
+                return
+
+    def __iter__(self):
+        return self.iter()
+
+    def __len__(self):
+        with self.__cond:
+            return len(self.__chunks)
+
+class DabClient:
+    def __init__(self):
+        # Two connections, each with its own paho network thread:
+        #   control   - requests and their single replies (dab/_response/dab/<device>/#)
+        #   telemetry - metrics listeners, streamed replies such as log chunks, and discovery
+        # so a flood on one plane never queues behind, or in front of, the other.
         self.__client = mqtt.Client("mqtt5_client",protocol=mqtt.MQTTv5)
+        self.__telemetry = mqtt.Client("mqtt5_client_telemetry",protocol=mqtt.MQTTv5)
+        for client in (self.__client, self.__telemetry):
+            client.on_subscribe = self.__on_subscribe
+            client.on_connect = self.__on_connect
+            client.on_disconnect = self.__on_disconnect
+        self.__client.on_publish = self.__on_publish
+        self.__connected = Event()
+        self.__telemetry_connected = Event()
+        self.__has_connected = set()
+        # Topics registered through add_topic_listener(), restored after a reconnect without session
+        self.__listener_topics = set()
+        self.__publish_marks = OrderedDict()
+        # Response filters whose subscription is live for this session, per connection
+        self.__subscribed_filters = set()
+        self.__subscribe_lock = Lock()
+        # Recent (connection, mid) SUBACKs; bounded, as listener and discovery SUBACKs are never waited for
+        self.__subacks = deque(maxlen=PUBLISH_MARKS_MAX)
+        self.__suback_cond = Condition()
+        # In-flight requests keyed by MQTT5 CorrelationData, kept in publish order
+        self.__pending = OrderedDict()
+        self.__pending_lock = Lock()
+        # Result of the last request() made by each calling thread
+        self.__last = local()
         self.__metrics_count = 0
-        self.__response_chunks = []
+        self.__metrics_state = False
+        self.__metrics_event = Event()
+        # Streamed replies (e.g. log chunks) of the most recently submitted STREAMED_OPERATIONS request
+        self.__response_chunks = ChunkQueue()
+        self.timeouts = TimeoutPolicy()
+        self.liveness = LivenessTracker()
+        # deviceId -> (discovery entry, monotonic time it answered); see discover_devices()
+        self.__discovered = {}
+        self.__discovered_lock = Lock()
+        self.discovery_ttl = DISCOVERY_CACHE_TTL
 
     def __on_message(self, client, userdata, message):
-        self.__response_dic = json.loads(message.payload)
-        self.__response_chunks.append(self.__response_dic)
-        if self.__lock.locked():
-            self.__lock.release()
-        try:
-            self.__code = self.__response_dic['status']
-        except:
-            self.__code = -1
+        received_ns = perf_counter_ns()
+        # Routing needs only the MQTT properties. The body is parsed here, once, for the DAB status
+        # (liveness) and for streamed chunks; DabResponse caches that parse for whoever reads it next
+        response = DabResponse(message.payload)
+
+        correlation_id = self.__correlation_of(message)
+        with self.__pending_lock:
+            future = self.__match_pending(correlation_id, message.topic)
+            if future is not None and future.mid is not None:
+                future.timing.acked_ns = self.__publish_marks.pop(future.mid, None)
+        is_chunk = self.__response_chunks.accepts(correlation_id, message.topic)
+
+        if is_chunk and response.data is not None:
+            if not self.__response_chunks.put(response.data, correlation_id, message.topic):
+                logger = getattr(self, "logger", LOGGER)
+                logger.warn(f"Dropped a chunk on '{message.topic}': {CHUNK_QUEUE_MAX} chunks of that request are still unread.")
+        if future is not None:
+            future.timing.received_ns = received_ns
+            response.timing = future.timing
+            self.timeouts.observe(future.operation, future.timing.latency_ms)
+            self.__note_liveness(future.device_id, status_of(response.data))
+            # An AsyncDabClient caller that timed out has already cancelled the future
+            if not future.done():
+                future.set_result(response)
+        elif not is_chunk:
+            logger = getattr(self, "logger", LOGGER)
+            logger.info(f"Ignoring a response on '{message.topic}' that matches no pending request.")
+
+    def __note_liveness(self, device_id, status):
+        if isinstance(status, int) and 200 <= status < 300:
+            self.liveness.seen(device_id)
+        elif isinstance(status, int) and status >= 500:
+            self.liveness.suspect(device_id)
+
+    @staticmethod
+    def __correlation_of(message):
+        properties = getattr(message, "properties", None)
+        correlation_data = getattr(properties, "CorrelationData", None)
+        if not correlation_data:
+            return None
+        if isinstance(correlation_data, (bytes, bytearray)):
+            return correlation_data.decode("utf-8", errors="replace")
+        return str(correlation_data)
+
+    def __match_pending(self, correlation_id, topic):
+        # Must be called with __pending_lock held. Removes and returns the matched future.
+        if correlation_id is not None:
+            # Tagged reply: only its own request may take it (late replies to timed-out requests are dropped).
+            return self.__pending.pop(correlation_id, None)
+        # Bridges that do not echo CorrelationData: hand the reply to the oldest request on that topic.
+        for pending_id, future in self.__pending.items():
+            if future.response_topic == topic:
+                del self.__pending[pending_id]
+                return future
+        return None
+
+    def __on_publish(self, client, userdata, mid):
+        acked_ns = perf_counter_ns()
+        with self.__pending_lock:
+            self.__publish_marks[mid] = acked_ns
+            while len(self.__publish_marks) > PUBLISH_MARKS_MAX:
+                self.__publish_marks.popitem(last=False)
+
+    def __on_subscribe(self, client, userdata, mid, reason_codes, properties=None):
+        # mids are per connection, so acknowledgements are keyed by both
+        with self.__suback_cond:
+            self.__subacks.append((id(client), mid))
+            self.__suback_cond.notify_all()
+
+    def __plane_of(self, client):
+        return "telemetry" if client is self.__telemetry else "control"
+
+    def __on_connect(self, client, userdata, flags, reason_code, properties=None):
+        logger = getattr(self, "logger", LOGGER)
+        plane = self.__plane_of(client)
+        if reason_code != 0:
+            logger.warn(f"The broker refused the {plane} connection: {reason_code}.")
+            return
+        reconnected = plane in self.__has_connected
+        self.__has_connected.add(plane)
+        (self.__telemetry_connected if plane == "telemetry" else self.__connected).set()
+        if not reconnected:
+            return
+        if isinstance(flags, dict) and flags.get("session present"):
+            logger.info(f"Reconnected the {plane} connection; the previous session and its subscriptions were resumed.")
+            return
+        # The broker forgot us: subscribe again to everything this connection listens on
+        logger.info(f"Reconnected the {plane} connection with a new session; restoring subscriptions.")
+        for filter_plane, response_filter in list(self.__subscribed_filters):
+            if filter_plane == plane:
+                client.subscribe(response_filter)
+        if plane == "telemetry":
+            for topic in list(self.__listener_topics):
+                client.subscribe(topic)
+
+    def __on_disconnect(self, client, userdata, reason_code, properties=None):
+        plane = self.__plane_of(client)
+        (self.__telemetry_connected if plane == "telemetry" else self.__connected).clear()
+        with self.__pending_lock:
+            # Every request is sent on the control connection; streamed ones are also answered on the telemetry one
+            if plane == "control":
+                lost = list(self.__pending.values())
+                self.__pending.clear()
+                self.__publish_marks.clear()
+                self.liveness.suspect()
+            else:
+                lost = [future for future in self.__pending.values() if future.streamed]
+                for future in lost:
+                    del self.__pending[future.correlation_id]
+        # Nobody waits out the full timeout for a reply that can no longer arrive
+        for future in lost:
+            if not future.done():
+                future.set_exception(TransportLost(f"Broker connection lost ({reason_code}) before '{future.operation}' was answered."))
+        if reason_code != 0:
+            logger = getattr(self, "logger", LOGGER)
+            logger.warn(f"Lost the {plane} broker connection ({reason_code}); {len(lost)} request(s) in flight failed. Reconnecting with backoff.")
 
-    def get_response_chunk(self):
-        return self.__response_chunks.pop(0) if self.__response_chunks else None
+    def is_connected(self):
+        return self.__connected.is_set()
+
+    def wait_connected(self, timeout=None):
+        # Block until the broker connection is up (paho reconnects on its own); False on timeout
+        return self.__connected.wait(timeout)
+
+    def subscribe_responses(self, device_id, streamed=False):
+        """
+        Subscribe once per device to every response topic of that device and keep it for the session:
+        dab/_response/dab/<device>/# on the control connection, or with streamed=True
+        dab/_response/stream/<device>/# on the telemetry connection.
+        The first call waits for the SUBACK so the first reply cannot be published before we listen.
+        """
+        if streamed:
+            key = ("telemetry", "dab/_response/stream/" + device_id + "/#")
+            client = self.__telemetry
+        else:
+            key = ("control", "dab/_response/dab/" + device_id + "/#")
+            client = self.__client
+        if key in self.__subscribed_filters:
+            return
+        with self.__subscribe_lock:
+            if key in self.__subscribed_filters:
+                return
+            response_filter = key[1]
+            client.message_callback_add(response_filter, self.__on_message)
+            result, mid = client.subscribe(response_filter)
+            suback = (id(client), mid)
+            with self.__suback_cond:
+                acked = result == mqtt.MQTT_ERR_SUCCESS and self.__suback_cond.wait_for(lambda: suback in self.__subacks, timeout=SUBACK_TIMEOUT)
+                if suback in self.__subacks:
+                    self.__subacks.remove(suback)
+            if not acked:
+                logger = getattr(self, "logger", LOGGER)
+                logger.warn(f"No SUBACK for '{response_filter}' within {SUBACK_TIMEOUT}s; continuing anyway.")
+            self.__subscribed_filters.add(key)
+
+    def get_response_chunk(self, timeout=0):
+        # Next streamed reply of the latest streamed request; waits up to timeout seconds (None = forever)
+        return self.__response_chunks.get(timeout)
+
+    def response_chunks(self, idle_timeout=None):
+        # Iterator over the streamed replies of the latest streamed request; see ChunkQueue.iter()
+        return self.__response_chunks.iter(idle_timeout)
 
     def __on_message_metrics(self, client, userdata, message):
         if not message.payload:
@@ -41,76 +491,182 @@ class DabClient:
             logger.info(f"{metrics_response}")
         else:
             self.__metrics_state = True
-            self.__lock.release()
+            self.__metrics_event.set()
 
     def disconnect(self):
         self.__client.disconnect()
+        self.__telemetry.disconnect()
 
     def connect(self,broker_address,broker_port):
-        self.__client.connect(broker_address, port=broker_port)
-        self.__client.loop_start()
-    
-    def request(self,device_id,operation,msg="{}"):
-        # Send request and block until get the response or timeout
+        # The paho network thread reconnects on its own after a drop, backing off between attempts.
+        # Only the first connect starts clean; reconnects ask the broker to resume the session.
+        for client in (self.__client, self.__telemetry):
+            client.reconnect_delay_set(min_delay=RECONNECT_MIN_DELAY, max_delay=RECONNECT_MAX_DELAY)
+            properties = Properties(PacketTypes.CONNECT)
+            properties.SessionExpiryInterval = SESSION_EXPIRY
+            client.connect(broker_address, port=broker_port, clean_start=mqtt.MQTT_CLEAN_START_FIRST_ONLY, properties=properties)
+            client.loop_start()
+        for plane, connected in (("control", self.__connected), ("telemetry", self.__telemetry_connected)):
+            if not connected.wait(CONNECT_TIMEOUT):
+                logger = getattr(self, "logger", LOGGER)
+                logger.warn(f"No CONNACK for the {plane} connection from {broker_address}:{broker_port} within {CONNECT_TIMEOUT}s; continuing anyway.")
+
+    def submit(self, device_id, operation, msg="{}"):
+        """
+        Publish a DAB request without waiting for it.
+        Returns a Future that resolves to the DabResponse.
+        Any number of submitted requests may be in flight at once.
+        Replies to STREAMED_OPERATIONS are routed to the telemetry connection.
+        """
+        streamed = operation in STREAMED_OPERATIONS
+        self.subscribe_responses(device_id, streamed)
+        if operation in REBOOT_OPERATIONS:
+            self.forget_discovery(device_id)
+            self.liveness.suspect(device_id)
         topic = "dab/" + device_id+"/" + operation
-        response_topic="dab/_response/"+topic
-        self.__client.subscribe(response_topic)
+        if streamed:
+            response_topic = "dab/_response/stream/" + device_id + "/" + operation
+        else:
+            response_topic="dab/_response/"+topic
+        correlation_id = uuid.uuid4().hex
+
+        future = Future()
+        future.correlation_id = correlation_id
+        future.device_id = device_id
+        future.operation = operation
+        future.streamed = streamed
+        future.response_topic = response_topic
+        future.timing = RequestTiming()
+        future.mid = None
+        with self.__pending_lock:
+            self.__pending[correlation_id] = future
+        if streamed:
+            self.__response_chunks.open(correlation_id, response_topic)
+
         properties=Properties(PacketTypes.PUBLISH)
         properties.ResponseTopic=response_topic
-        self.__client.on_message = self.__on_message
-        self.__client.subscribe(response_topic)
-        self.__client.publish(topic,msg,properties=properties)
-        self.__response_chunks.clear()
-        if not (self.__lock.acquire(timeout = 90)):
-            self.__code = 100
-        
+        properties.CorrelationData=correlation_id.encode("utf-8")
+        future.timing.published_ns = perf_counter_ns()
+        info = self.__client.publish(topic,msg,properties=properties)
+        future.mid = info.mid
+        if info.rc == mqtt.MQTT_ERR_NO_CONN:
+            # Not connected: fail now instead of waiting for a reply to a request that was never sent
+            self.cancel(future)
+            if not future.done():
+                future.set_exception(TransportLost(f"Not connected to the broker; '{operation}' was not sent."))
+        return future
+
+    def cancel(self, future):
+        # Forget a submitted request nobody waits for any more; a late reply to it is then dropped.
+        with self.__pending_lock:
+            self.__pending.pop(future.correlation_id, None)
+
+    def wait(self, future, timeout=None):
+        """
+        Wait for a submitted request. Returns (code, DabResponse).
+        code is the DAB status, -1 when the reply has no status, 100 on timeout, or
+        TRANSPORT_LOST when the broker connection dropped first.
+        timeout=None uses the per-operation timeout policy.
+        """
+        if timeout is None:
+            timeout = self.timeouts.timeout_for(future.operation)
+        try:
+            response = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self.cancel(future)
+            self.liveness.suspect(future.device_id)
+            return 100, None
+        except TransportLost:
+            return TRANSPORT_LOST, None
+        return status_of(response.data), response
+
+    def request(self,device_id,operation,msg="{}",timeout=None):
+        # Send request and block until get the response or timeout (None = per-operation policy)
+        future = self.submit(device_id, operation, msg)
+        self.__last.code, self.__last.response = self.wait(future, timeout)
+
     def response(self):
-        if((self.__code != -1) and (self.__code != 100)):
-            return json.dumps(self.__response_dic, indent=2)
+        # The DabResponse of this thread's last request; its body is parsed at most once
+        code = self.last_error_code()
+        if((code != -1) and (code != 100) and (code != TRANSPORT_LOST)):
+            return self.__last.response
         else:
             return ""
 
-    def subscribe_metrics(self, device_id, operation):
+    def add_topic_listener(self, topic, callback):
+        # callback(client, userdata, message) runs on the telemetry connection's network thread for every message on topic
+        self.__telemetry.message_callback_add(topic, callback)
+        self.__telemetry.subscribe(topic)
+        self.__listener_topics.add(topic)
+
+    def remove_topic_listener(self, topic):
+        self.__listener_topics.discard(topic)
+        self.__telemetry.unsubscribe(topic)
+        try:
+            self.__telemetry.message_callback_remove(topic)
+        except:
+            pass
+
+    def subscribe_metrics(self, device_id, operation, timeout=None):
         self.__metrics_state = False
         self.__metrics_count = 0
+        self.__metrics_event.clear()
+        if timeout is None:
+            timeout = self.timeouts.timeout_for(operation, METRICS_TIMEOUT)
         response_topic = "dab/" + device_id+"/" + operation
-        self.__client.subscribe(response_topic)
-        self.__client.on_message = self.__on_message_metrics
-        if not (self.__lock.acquire(timeout = 30)):
+        started_ns = perf_counter_ns()
+        self.add_topic_listener(response_topic, self.__on_message_metrics)
+        if self.__metrics_event.wait(timeout = timeout):
+            self.timeouts.observe(operation, (perf_counter_ns() - started_ns) / 1e6)
+        else:
             self.__metrics_state = False
 
     def unsubscribe_metrics(self, device_id, operation):
         response_topic = "dab/" + device_id+"/" + operation
-        self.__client.unsubscribe(response_topic)
-    
+        self.remove_topic_listener(response_topic)
+
     def last_metrics_state(self):
         return self.__metrics_state
 
     def last_error_code(self):
-        return self.__code
-    
+        return getattr(self.__last, "code", -1)
+
     def last_error_msg(self):
         logger = getattr(self, "logger", LOGGER)
-        if (self.__code == -1):
+        code = self.last_error_code()
+        if (code == -1):
             logger.warn("Unknown error")
-        elif (self.__code == 100):
+        elif (code == 100):
             logger.warn("Timeout")
-        elif (self.__code == 400):
+        elif (code == TRANSPORT_LOST):
+            logger.warn("Transport lost: the broker connection dropped before the reply")
+        elif (code == 400):
             logger.warn("Request invalid or malformed")
-        elif (self.__code == 500):
+        elif (code == 500):
             logger.error("Internal error")
-        elif (self.__code == 501):
+        elif (code == 501):
             logger.warn("Not implemented")
 
-    # ---- Minimal discovery compatible with callers passing attempts + wait_seconds ----
-    def discover_devices(self, attempts: int = 1, wait_seconds: float = 1.0):
+    # ---- Discovery compatible with callers passing attempts + wait_seconds ----
+    def discover_devices(self, attempts: int = 1, wait_seconds: float = 1.0, device_id: str = None, use_cache: bool = True):
         """
         Broadcasts to 'dab/discovery' and collects responses on a unique response topic.
         Compatible with callers that pass attempts + wait_seconds.
+
+        With device_id, returns as soon as that device answers (or straight away when it
+        answered a discovery within discovery_ttl seconds and use_cache is set); each attempt
+        waits at most wait_seconds. Without device_id, every attempt collects for the full
+        window, for an inventory of all devices on the broker.
         Returns: [{"deviceId": "<id>", "ip": "<ip or None>"}]
         """
+        if device_id and use_cache:
+            cached = self.__cached_discovery(device_id)
+            if cached is not None:
+                return [cached]
+
         resp_topic = f"dab/_response/discovery/{uuid.uuid4().hex}"
         found = {}
+        target_found = Event()
 
         def _on_disc(_c, _u, msg):
             try:
@@ -121,11 +677,15 @@ class DabClient:
                     found[dev] = {"deviceId": dev, "ip": ip}
                 elif dev and ip and not found[dev].get("ip"):
                     found[dev]["ip"] = ip
+                if dev:
+                    self.__remember_discovery(found[dev])
+                if device_id and dev == device_id:
+                    target_found.set()
             except:
                 pass
 
-        self.__client.message_callback_add(resp_topic, _on_disc)
-        self.__client.subscribe(resp_topic)
+        self.__telemetry.message_callback_add(resp_topic, _on_disc)
+        self.__telemetry.subscribe(resp_topic)
 
         props = Properties(PacketTypes.PUBLISH)
         props.ResponseTopic = resp_topic
@@ -133,12 +693,126 @@ class DabClient:
 
         n = 1 if attempts is None else max(1, int(attempts))
         for _ in range(n):
-            self.__client.publish("dab/discovery", payload, properties=props)
-            sleep(max(0.2, float(wait_seconds)))
+            self.__telemetry.publish("dab/discovery", payload, properties=props)
+            # Inventory mode never sets the event, so this is the full window
+            if target_found.wait(timeout=max(0.2, float(wait_seconds))):
+                break
 
         try:
-            self.__client.message_callback_remove(resp_topic)
+            self.__telemetry.message_callback_remove(resp_topic)
         except:
             pass
-        self.__client.unsubscribe(resp_topic)
-        return list(found.values())
\ No newline at end of file
+        self.__telemetry.unsubscribe(resp_topic)
+        return list(found.values())
+
+    def __remember_discovery(self, entry):
+        with self.__discovered_lock:
+            self.__discovered[entry["deviceId"]] = (dict(entry), clock.monotonic())
+
+    def __cached_discovery(self, device_id):
+        with self.__discovered_lock:
+            cached = self.__discovered.get(device_id)
+        if cached is None or clock.monotonic() - cached[1] > self.discovery_ttl:
+            return None
+        return dict(cached[0])
+
+    def forget_discovery(self, device_id=None):
+        # Drop cached discovery answers (all devices when device_id is None), e.g. after a reboot
+        with self.__discovered_lock:
+            if device_id is None:
+                self.__discovered.clear()
+            else:
+                self.__discovered.pop(device_id, None)
+
+
+class AsyncDabClient:
+    """
+    asyncio front-end for DabClient. Requests and telemetry use the DabClient's
+    control and telemetry connections; awaiting a reply does not hold a thread.
+    """
+    def __init__(self, dab_client=None):
+        self.dab_client = dab_client or DabClient()
+        self.__ready_devices = set()
+
+    async def connect(self, broker_address, broker_port):
+        await asyncio.to_thread(self.dab_client.connect, broker_address, broker_port)
+
+    async def disconnect(self):
+        await asyncio.to_thread(self.dab_client.disconnect)
+
+    async def request(self, device_id, operation, msg="{}", timeout=None):
+        """
+        Send one DAB request and await its reply. Returns (code, DabResponse), with the
+        same codes as DabClient.wait(): the DAB status, -1 for no status, 100 on timeout,
+        TRANSPORT_LOST when the broker connection dropped first.
+        timeout=None uses the DabClient's per-operation timeout policy.
+        """
+        if timeout is None:
+            timeout = self.dab_client.timeouts.timeout_for(operation)
+        if device_id not in self.__ready_devices:
+            # The first request to a device waits for its SUBACK; keep that off the event loop.
+            await asyncio.to_thread(self.dab_client.subscribe_responses, device_id)
+            self.__ready_devices.add(device_id)
+        future = self.dab_client.submit(device_id, operation, msg)
+        try:
+            response = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self.dab_client.cancel(future)
+            self.dab_client.liveness.suspect(device_id)
+            return 100, None
+        except TransportLost:
+            return TRANSPORT_LOST, None
+        return status_of(response.data), response
+
+    async def request_many(self, requests, limit=None, timeout=None):
+        """
+        Run many requests at once. requests is an iterable of (device_id, operation[, msg]).
+        limit caps how many are in flight together (None = no cap).
+        Returns the (code, DabResponse) pairs in the order the requests were given.
+        """
+        semaphore = asyncio.Semaphore(limit) if limit else None
+
+        async def _one(spec):
+            device_id, operation, *rest = spec
+            msg = rest[0] if rest else "{}"
+            if semaphore is None:
+                return await self.request(device_id, operation, msg, timeout)
+            async with semaphore:
+                return await self.request(device_id, operation, msg, timeout)
+
+        return await asyncio.gather(*(_one(spec) for spec in requests))
+
+    async def stream(self, device_id, operation, idle_timeout=None):
+        """
+        Async iterator over the parsed messages published on dab/<device_id>/<operation>.
+        Ends when no message arrives for idle_timeout seconds (never, if None).
+        The subscription is removed when the iteration stops.
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        topic = "dab/" + device_id + "/" + operation
+
+        def _on_message(client, userdata, message):
+            if not message.payload:
+                return
+            try:
+                payload = json.loads(message.payload)
+            except Exception:
+                return
+            loop.call_soon_threadsafe(queue.put_nowait, payload)
+
+        self.dab_client.add_topic_listener(topic, _on_message)
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), idle_timeout)
+                except asyncio.TimeoutError:
+                    return
+        finally:
+            self.dab_client.remove_topic_listener(topic)
+
+    def device_metrics(self, device_id, idle_timeout=METRICS_TIMEOUT):
+        return self.stream(device_id, "device-telemetry/metrics", idle_timeout)
+
+    def app_metrics(self, device_id, app_id, idle_timeout=METRICS_TIMEOUT):
+        return self.stream(device_id, "app-telemetry/metrics/" + app_id, idle_timeout)
@@ -1,11 +1,9 @@
-from dab_client import DabClient
+from dab_client import DabClient, DabResponse, response_data, TRANSPORT_LOST, REBOOT_OPERATIONS
 from dab_checker import DabChecker
-from result_json import TestResult, TestSuite
+from result_json import TestResult, TestSuite, ResultJsonWriter
 from logger import LOGGER
-from time import sleep
 from readchar import readchar
 from re import split
-import datetime
 import jsons
 import json
 import config
@@ -14,25 +12,59 @@ from util.enforcement_manager import EnforcementManager
 from util.enforcement_manager import ValidateCode
 from util.config_loader import resolve_body_or_raise, PayloadConfigError
 from util.output_image_handler import handle_output_image_response
+from util.watchdog import run_with_budget, check_budget, read_operator, remaining, DEFAULT_TEST_BUDGET
+from util.flakiness import FlakinessStats, RERUN_OUTCOMES
+from util.test_scheduler import plan_schedule, foreground_effect, concurrency_safe, HOME, UNKNOWN
+from util import clock
 from sys import exit as sys_exit
 import re
-import time
+from threading import Thread, Event, Lock, local
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from packaging.version import Version, InvalidVersion
 
 DAB_VERSION = "2.0" # default dab version is 2.0, this global value will be used in system/settings/... operations.
+RECONNECT_WAIT = 30 # seconds execute_cmd waits for the broker connection to come back before resending a request
+PREFLIGHT_LIVENESS_TTL = 30 # seconds a successful DAB reply stands in for the per-test discovery + health-check preflight
+PREFLIGHT_BUDGET = 30 # seconds of automated discovery + health-check retries before the R/C/T prompts
+HEALTH_BACKOFF_INITIAL = 0.5 # seconds before the second health-check attempt; doubles after each failure...
+HEALTH_BACKOFF_MAX = 10 # ...up to the old fixed delay
 
 # Raised when preflight (discovery/health) decides we should stop the run.
 class PreflightTermination(Exception):
     pass
 
 class DabTester:
-    def __init__(self, broker, override_dab_version=None):
+    def __init__(self, broker, override_dab_version=None, journal=None):
         self.dab_client = DabClient()
         self.dab_client.connect(broker, 1883)
         self.dab_checker = DabChecker(self)
         self.verbose = False
         self.dab_version = None  # Will be set by auto-detect logic
         self.override_dab_version = override_dab_version
+        # Skip the per-test preflight while the device answered successfully within this many seconds (0 = always run it)
+        self.preflight_ttl = PREFLIGHT_LIVENESS_TTL
+        self.preflight_stats = {"full": 0, "skipped": 0}
+        # Count and total duration of every full preflight in this run, to price the skipped ones
+        self.preflight_cost = {"count": 0, "total_ms": 0}
+        # Every finished result is appended here as it completes; a resumed journal also supplies finished ones (None = no journal)
+        self.journal = journal
+        # Reorder non-functional suites to cut app launches / settings changes before running them (--schedule)
+        self.schedule_tests = False
+        # Up to this many concurrency-safe tests run side by side in Execute_All_Tests (1 = all serial, --concurrency)
+        self.concurrency = 1
+        # Wall-time budgets in seconds (None / 0 = unbounded): one test, and everything in one suite run
+        self.test_budget = DEFAULT_TEST_BUDGET
+        self.suite_budget = None
+        self._suite_deadline = None
+        # Failed/skipped tests of Execute_All_Tests get up to this many extra attempts at the end (--reruns)
+        self.reruns = 0
+        # Tests whose recorded flakiness ratio is at least this are marked quarantined (--quarantine; None = off)
+        self.quarantine_ratio = None
+        self.flakiness = None
+        # util.time_budget.TimeBudgetPlan of a --time-budget run; told about every finished test
+        self.time_plan = None
+        # One preflight at a time; concurrent tests then find the device freshly seen and skip theirs
+        self._preflight_lock = Lock()
         self.logger = LOGGER
         self.logger.verbose = self.verbose
         # Load valid DAB topics using jsons
@@ -45,13 +77,25 @@ class DabTester:
     # -----------------------------
     # Core send/request wrapper
     # -----------------------------
-    def execute_cmd(self,device_id,dab_request_topic,dab_request_body="{}"):
-        self.dab_client.request(device_id,dab_request_topic,dab_request_body)
+    def execute_cmd(self,device_id,dab_request_topic,dab_request_body="{}",timeout=None):
+        # A test abandoned by the watchdog stops here instead of talking to the device behind the next test
+        check_budget()
+        self.dab_client.request(device_id,dab_request_topic,dab_request_body,timeout)
+        if self.dab_client.last_error_code() == TRANSPORT_LOST and dab_request_topic not in REBOOT_OPERATIONS:
+            # The broker connection dropped under the request; send it once more when it is back.
+            # A reboot request is not resent: losing the connection is how it usually ends.
+            self.logger.warn(f"Broker connection lost during '{dab_request_topic}'. Waiting up to {RECONNECT_WAIT}s to resend it.")
+            if self.dab_client.wait_connected(RECONNECT_WAIT):
+                self.dab_client.request(device_id,dab_request_topic,dab_request_body,timeout)
         if self.dab_client.last_error_code() == 200:
             return 0
         else:
             return 1
 
+    def settle(self, seconds, reason):
+        # DabChecker's way to Settle() without importing this module
+        Settle(seconds, reason)
+
     # -----------------------------
     # Early-skip helpers (generic, payload/config aware)
     # -----------------------------
@@ -139,7 +183,7 @@ class DabTester:
 
         def do_discover():
             try:
-                return self.dab_client.discover_devices() or []
+                return self.dab_client.discover_devices(device_id=device_id) or []
             except Exception as e:
                 self.logger.error(f"Discovery did not complete. Reason: {e}")
                 return None  # signal hard failure
@@ -156,7 +200,7 @@ class DabTester:
                     "The device is NOT discoverable. Choose one of the options: "
                     "Retry now (R), Continue anyway (C), or Terminate this run (T)."
                 )
-                answer = input(
+                answer = read_operator(input,
                     "\n[PROMPT] Device is NOT discoverable.\n"
                     "         Choose an action:\n"
                     "         [R]etry discovery now\n"
@@ -191,7 +235,7 @@ class DabTester:
                 self.logger.prompt(
                     "No devices discovered. Choose: Retry (R), Continue anyway (C), or Terminate (T)."
                 )
-                answer = input(
+                answer = read_operator(input,
                     "\n[PROMPT] No devices responded to discovery.\n"
                     "         Choose an action:\n"
                     "         [R]etry discovery now\n"
@@ -244,7 +288,7 @@ class DabTester:
                 self.logger.prompt(
                     "Target not in discovery results. Choose: Retry (R), Continue anyway (C), or Terminate (T)."
                 )
-                answer = input(
+                answer = read_operator(input,
                     "\n[PROMPT] Target was NOT found in discovery results.\n"
                     "         Choose an action:\n"
                     "         [R]etry discovery now\n"
@@ -285,6 +329,72 @@ class DabTester:
         )
 
 
+    def _health_check_once(self, device_id: str):
+        """
+        One health-check/get. Logs the answer and returns True if the device reported healthy.
+        """
+        self.dab_client.request(device_id, "health-check/get", "{}")
+        resp_text = self.dab_client.response() or ""
+        status = self.dab_client.last_error_code()
+
+        healthy = False
+        message = ""
+        if resp_text:
+            try:
+                j = response_data(resp_text)
+                healthy = bool(j.get("healthy", False))
+                message = j.get("message", "")
+            except Exception:
+                pass
+
+        status_str = status if status is not None else "N/A"
+        msg_suffix = f" with message: {message}" if message else ""
+        self.logger.info(f"Health check response: HTTP {status_str}. Healthy flag is {healthy}{msg_suffix}.")
+        return status == 200 and healthy
+
+    def _automated_preflight(self, device_id: str, budget: float = PREFLIGHT_BUDGET):
+        """
+        Run discovery and health-check/get at the same time, retrying each until it succeeds or
+        `budget` seconds pass. Health is polled with exponential backoff (HEALTH_BACKOFF_INITIAL
+        doubling up to HEALTH_BACKOFF_MAX). Returns (discovered, healthy) as soon as both succeed.
+        """
+        self.logger.info(f"Preflight: discovering '{device_id}' and checking its health together (up to {budget}s).")
+        deadline = clock.monotonic() + budget
+        discovered = Event()
+
+        def discover():
+            while not discovered.is_set() and clock.monotonic() < deadline:
+                try:
+                    found = self.dab_client.discover_devices(device_id=device_id) or []
+                except Exception as e:
+                    self.logger.warn(f"Discovery did not complete. Reason: {e}")
+                    found = []
+                    clock.sleep(min(1, max(0, deadline - clock.monotonic())), "discovery retry")
+                if any((d.get("deviceId") or d.get("device_id")) == device_id for d in found):
+                    discovered.set()
+
+        worker = Thread(target=discover, daemon=True)
+        worker.start()
+
+        healthy = False
+        delay = HEALTH_BACKOFF_INITIAL
+        while clock.monotonic() < deadline:
+            try:
+                healthy = self._health_check_once(device_id)
+            except Exception as e:
+                self.logger.warn(f"There was an error during the health check: {e}.")
+            if healthy:
+                break
+            wait = min(delay, max(0, deadline - clock.monotonic()))
+            if wait <= 0:
+                break
+            self.logger.info(f"The device did not report healthy. Trying again in {wait:.1f} seconds.")
+            clock.sleep(wait, "health-check retry")
+            delay = min(delay * 2, HEALTH_BACKOFF_MAX)
+
+        worker.join(max(0, deadline - clock.monotonic()))
+        return discovered.is_set(), healthy
+
     def pretest_health_check(self, device_id: str, retries: int = 3, delay_sec: int = 10, interactive: bool = True, fatal: bool = False,) -> bool:
         """
         Run dab/<device-id>/health-check/get before each test.
@@ -298,36 +408,18 @@ class DabTester:
         for attempt in range(1, total_attempts + 1):
             self.logger.info(f"Health check attempt {attempt} of {total_attempts} on the topic 'dab/{device_id}/health-check/get'.")
             try:
-                self.dab_client.request(device_id, "health-check/get", "{}")
-                resp_text = self.dab_client.response() or ""
-                status = self.dab_client.last_error_code()
-
-                healthy = False
-                message = ""
-                if resp_text:
-                    try:
-                        j = json.loads(resp_text)
-                        healthy = bool(j.get("healthy", False))
-                        message = j.get("message", "")
-                    except Exception:
-                        pass
-
-                status_str = status if status is not None else "N/A"
-                msg_suffix = f" with message: {message}" if message else ""
-                self.logger.info(f"Health check response: HTTP {status_str}. Healthy flag is {healthy}{msg_suffix}.")
-
-                if status == 200 and healthy:
+                if self._health_check_once(device_id):
                     self.logger.ok("Health check passed. Proceeding to run the test.")
                     return True
 
                 if attempt < total_attempts:
                     self.logger.info(f"The device did not report healthy. Waiting {delay_sec} seconds before trying again.")
-                    sleep(delay_sec)
+                    clock.sleep(delay_sec, "health-check retry")
 
             except Exception as e:
                 if attempt < total_attempts:
                     self.logger.warn(f"There was an error during the health check: {e}. Waiting {delay_sec} seconds and trying again.")
-                    sleep(delay_sec)
+                    clock.sleep(delay_sec, "health-check retry")
                 else:
                     self.logger.warn(f"There was an error during the health check: {e}.")
 
@@ -338,7 +430,7 @@ class DabTester:
 
         while True:
             self.logger.prompt("The device is unhealthy. Choose one of the options: Retry now (R), Continue anyway (C), or Terminate this run (T).")
-            answer = input(
+            answer = read_operator(input,
                 "\n[PROMPT] Device is unhealthy.\n"
                 "         Choose an action:\n"
                 "         [R]etry health-check now\n"
@@ -350,25 +442,7 @@ class DabTester:
             if answer in ("", "r", "retry"):
                 try:
                     self.logger.info("Retrying the health check once immediately.")
-                    self.dab_client.request(device_id, "health-check/get", "{}")
-                    resp_text = self.dab_client.response() or ""
-                    status = self.dab_client.last_error_code()
-
-                    healthy = False
-                    message = ""
-                    if resp_text:
-                        try:
-                            j = json.loads(resp_text)
-                            healthy = bool(j.get("healthy", False))
-                            message = j.get("message", "")
-                        except Exception:
-                            pass
-
-                    status_str = status if status is not None else "N/A"
-                    msg_suffix = f" with message: {message}" if message else ""
-                    self.logger.info(f"Health check response: HTTP {status_str}. Healthy flag is {healthy}{msg_suffix}.")
-
-                    if status == 200 and healthy:
+                    if self._health_check_once(device_id):
                         self.logger.ok("Health check passed on the retry. Proceeding.")
                         return True
                     self.logger.warn("The device is still unhealthy after the retry.")
@@ -392,21 +466,116 @@ class DabTester:
 
     def _preflight_before_each_test_or_raise(self, device_id: str):
         """
-        Full preflight: discovery then health-check.
+        Full preflight: discovery and health-check, concurrently; prompts only if they do not pass in time.
+        Skipped while the device answered a DAB request successfully within preflight_ttl seconds
+        and has not since been restarted/reset, timed out or returned an error.
         Raises PreflightTermination if we should stop the run.
         """
-        # 1) Discovery (hard gate; no prompt)
-        self._preflight_discovery_or_raise(device_id)
+        # The lock only covers the automated part: a test abandoned by the watchdog while the
+        # operator is being asked must not keep every later test out of its preflight
+        with self._preflight_lock:
+            outcome = self._preflight_automated(device_id)
+        if outcome is not None:
+            self._preflight_interactive(device_id, *outcome)
+
+    def _preflight_automated(self, device_id: str):
+        """None when the preflight passed or was skipped, else (discovered, healthy, start) for the interactive fallback."""
+        age = self.dab_client.liveness.age(device_id)
+        if self.preflight_ttl and age is not None and age <= self.preflight_ttl:
+            self.preflight_stats["skipped"] += 1
+            self.logger.info(f"Preflight skipped: the device answered successfully {age:.1f}s ago (within {self.preflight_ttl}s).")
+            return None
+
+        preflight_start = clock.perf_counter()
+        # Discovery and health-check run together and return as soon as both pass
+        discovered, healthy = self._automated_preflight(device_id)
+        if discovered and healthy:
+            self.logger.ok(f"Preflight passed in {int((clock.perf_counter() - preflight_start) * 1000)} ms: the device is discoverable and healthy.")
+            self._count_preflight(preflight_start)
+            return None
+        return discovered, healthy, preflight_start
+
+    def _count_preflight(self, preflight_start):
+        self.preflight_stats["full"] += 1
+        self.preflight_cost["count"] += 1
+        self.preflight_cost["total_ms"] += int((clock.perf_counter() - preflight_start) * 1000)
+
+    def _preflight_interactive(self, device_id: str, discovered: bool, healthy: bool, preflight_start):
+        try:
+            # Automated budget spent: fall back to the interactive checks for whatever did not pass
+            if not discovered:
+                self._preflight_discovery_or_raise(device_id)
+            if not healthy:
+                ok = self.pretest_health_check(device_id, retries=0, interactive=True, fatal=False)
+                if not ok:
+                    raise PreflightTermination("Health-check failed; user chose to terminate.")
+        finally:
+            self._count_preflight(preflight_start)
+
+    def _preflight_summary(self):
+        """Footer line for the preflight liveness cache; resets the counters for the next suite."""
+        stats = self.preflight_stats
+        self.preflight_stats = {"full": 0, "skipped": 0}
+        if not stats["full"] and not stats["skipped"]:
+            return None
+        line = f"Preflight      : {stats['full']} full, {stats['skipped']} skipped by liveness cache"
+        cost = self.preflight_cost
+        if stats["skipped"] and cost["count"]:
+            # A skipped preflight is priced at what a full one has taken on average in this run
+            saved_ms = int(cost["total_ms"] / cost["count"] * stats["skipped"])
+            line += f" (~{self.logger._fmt_duration(saved_ms)} saved)"
+        return line
 
-        # 2) Health-check (prompt allowed)
-        ok = self.pretest_health_check(device_id, retries=3, delay_sec=10, interactive=True, fatal=False)
-        if not ok:
-            raise PreflightTermination("Health-check failed; user chose to terminate.")
+    # -----------------------------
+    # Wall-time budgets
+    # -----------------------------
+    def _start_suite_budget(self):
+        self._suite_deadline = clock.monotonic() + self.suite_budget if self.suite_budget else None
+
+    def _case_budget(self):
+        """(seconds the next test may take, "test" or "suite" for whichever budget limits it); (None, None) if unbounded."""
+        left = remaining(self._suite_deadline)
+        if self.test_budget and (left is None or self.test_budget <= left):
+            return self.test_budget, "test"
+        if left is not None:
+            return left, "suite"
+        return None, None
+
+    def _budget_skipped_result(self, device_id, test_case, reason, test_id=None, topic=None, section_open=False):
+        """SKIPPED result for a case that ran out of (or never got) wall time; section_open closes its log section."""
+        if test_id is None:
+            try:
+                topic, body_spec, _func, _expected, title, _is_negative, _ver = self.unpack_test_case(test_case)
+            except Exception:
+                topic = None
+            if not topic:
+                topic, title = "invalid/test", "InvalidTestCase"
+            test_id = to_test_id(f"{topic}/{title}")
+        self.logger.warn(f"Test {test_id}: {reason}")
+        if section_open:
+            self.logger.test_end(outcome="SKIPPED", duration_ms=None)
+        tr = TestResult(test_id, device_id, topic, "{}", "SKIPPED", "", [f"[SKIPPED - Wall-Time Budget] {reason}"])
+        tr.test_result = "SKIPPED"
+        return tr
 
     # -----------------------------
     # Main Execute for a single test
     # -----------------------------
     def Execute(self, device_id, test_case):
+        """Run one case within its wall-time budget; a case that overruns it is recorded as SKIPPED and left behind."""
+        budget, scope = self._case_budget()
+        if budget is not None and budget <= 0:
+            return self._budget_skipped_result(device_id, test_case, "The suite wall-time budget expired before this test started.")
+        start = clock.perf_counter()
+        finished, result = run_with_budget(self._execute_case, budget, device_id, test_case)
+        if not finished:
+            result = self._budget_skipped_result(device_id, test_case, f"The {scope} wall-time budget ({round(budget, 1):g}s) expired; the test was abandoned and the run moved on.", section_open=True)
+        if result is not None:
+            # Whole-test wall time (preflight, request, validation, return Home); feeds --time-budget planning
+            result.duration_ms = int((clock.perf_counter() - start) * 1000)
+        return result
+
+    def _execute_case(self, device_id, test_case):
         # Unpack first (do not open a section yet)
         (dab_request_topic, body_spec, validate_output_function, expected_response, test_title, is_negative, test_version) = self.unpack_test_case(test_case)
 
@@ -415,6 +584,8 @@ class DabTester:
             return self._skipped_result_for_invalid_case(device_id, test_case, "Unpack failed")
 
         test_id = to_test_id(f"{dab_request_topic}/{test_title}")
+        # The case's expected latency bounds how long the client waits for this operation
+        self.dab_client.timeouts.expect(dab_request_topic, expected_response)
 
         # Try to build/resolve payload. If it fails, return a SKIPPED TestResult (no test_start)
         ok, dab_request_body, skipped_tr = self._resolve_body_or_skip(device_id, dab_request_topic, test_title, body_spec)
@@ -433,10 +604,15 @@ class DabTester:
             request_body=dab_request_body,
             suite=None  # keep None; pass suite name from callers if desired
         )
-        section_wall_start = time.time()
+        section_wall_start = clock.time()
         # -------------------------------------------------------------
 
         # NEW: make sure we always try to return to Home after this test finishes
+        # Nothing is in front until the request goes out; early returns before that need no KEY_HOME
+        foreground_after = None
+        test_result = None
+        # Declared settle periods (Settle()) of this test; reported on its result, apart from latency
+        _settles.entries = []
         try:
             # Full preflight (discovery + health). If it fails/terminates, let it propagate to stop the run.
             self._preflight_before_each_test_or_raise(device_id)
@@ -457,7 +633,7 @@ class DabTester:
                     test_result.test_result = "OPTIONAL_FAILED"
                     log(test_result, f"\033[1;33m[ OPTIONAL_FAILED - Requires DAB Version {test_version}, but device version is {dab_version} ]\033[0m")
                     # close section before returning
-                    total_ms = int((time.time() - section_wall_start) * 1000)
+                    total_ms = int((clock.time() - section_wall_start) * 1000)
                     self.logger.test_end(outcome=test_result.test_result, duration_ms=total_ms)
                     return test_result
             except InvalidVersion as e:
@@ -477,7 +653,7 @@ class DabTester:
                         if cap_log:
                             log(test_result, cap_log)
                         log(test_result, "\033[1;33m[ OPTIONAL_FAILED - Unsupported by device capability lists ]\033[0m")
-                        total_ms = int((time.time() - section_wall_start) * 1000)
+                        total_ms = int((clock.time() - section_wall_start) * 1000)
                         self.logger.test_end(outcome=test_result.test_result, duration_ms=total_ms)
                         return test_result
             except Exception:
@@ -492,7 +668,7 @@ class DabTester:
                     test_result.test_result = "OPTIONAL_FAILED"
                     log(test_result, prechecker_log)
                     log(test_result, f"\033[1;33m[ OPTIONAL_FAILED - Requires DAB Operation is NOT SUPPORTED ]\033[0m")
-                    total_ms = int((time.time() - section_wall_start) * 1000)
+                    total_ms = int((clock.time() - section_wall_start) * 1000)
                     self.logger.test_end(outcome=test_result.test_result, duration_ms=total_ms)
                     return test_result
 
@@ -507,19 +683,24 @@ class DabTester:
                     test_result.test_result = "OPTIONAL_FAILED"
                     log(test_result, prechecker_log)
                     log(test_result, f"\033[1;33m[ OPTIONAL_FAILED ]\033[0m")
-                    total_ms = int((time.time() - section_wall_start) * 1000)
+                    total_ms = int((clock.time() - section_wall_start) * 1000)
                     self.logger.test_end(outcome=test_result.test_result, duration_ms=total_ms)
                     return test_result
                 log(test_result, prechecker_log)
 
-            start = datetime.datetime.now()
+            start_ns = clock.perf_counter_ns()
 
             try:
                 # Send DAB request via broker
                 try:
+                    # From here on the test may have left an app in front
+                    foreground_after = UNKNOWN
                     code = self.execute_cmd(device_id, dab_request_topic, dab_request_body)
+                    end_ns = clock.perf_counter_ns()
                     resp_text = self.dab_client.response() or ""
                     status_code = self.dab_client.last_error_code()
+                    # A negative request the device accepted may still have acted on it
+                    foreground_after = foreground_effect(dab_request_topic, dab_request_body, is_negative and status_code != 200)
                     test_result.response = resp_text
                     # Topics whose responses are big/noisy (don’t store full response in JSON)
                     HEAVY_TOPICS = {"system/logs/stop-collection", "output/image"}
@@ -533,14 +714,22 @@ class DabTester:
                 except Exception as e:
                     test_result.test_result = "SKIPPED"
                     log(test_result, f"\033[1;34m[ SKIPPED - Internal Error During Execution ]\033[0m {str(e)}")
-                    total_ms = int((time.time() - section_wall_start) * 1000)
+                    total_ms = int((clock.time() - section_wall_start) * 1000)
                     self.logger.test_end(outcome=test_result.test_result, duration_ms=total_ms)
                     return test_result
 
                 # If execution succeeded (error code 200)
                 if code == 0:
-                    end = datetime.datetime.now()
-                    durationInMs = int((end - start).total_seconds() * 1000)
+                    # Judge latency on the publish → receive span DabClient measured; the rest of the
+                    # execute_cmd() span is harness overhead and is reported separately.
+                    wall_ms = round((end_ns - start_ns) / 1e6, 3)
+                    timing = getattr(resp_text, "timing", None)
+                    latency_ms = timing.latency_ms if timing is not None else None
+                    if latency_ms is None:
+                        latency_ms = wall_ms
+                    test_result.latency_ms = latency_ms
+                    test_result.harness_overhead_ms = round(max(0.0, wall_ms - latency_ms), 3)
+                    durationInMs = latency_ms
 
                     try:
                         validate_result = validate_output_function(test_result, durationInMs, expected_response)
@@ -557,13 +746,13 @@ class DabTester:
                             # For negative test: failure is expected — pass the test
                             test_result.test_result = "PASS"
                             log(test_result, f"\033[1;33m[ NEGATIVE TEST PASSED - Exception as Expected ]\033[0m {(e)}")
-                            total_ms = int((time.time() - section_wall_start) * 1000)
+                            total_ms = int((clock.time() - section_wall_start) * 1000)
                             self.logger.test_end(outcome=test_result.test_result, duration_ms=total_ms)
                             return test_result
                         else:
                             test_result.test_result = "SKIPPED"
                             log(test_result, f"\033[1;34m[ SKIPPED - Internal Error During Validation ]\033[0m {str(e)}")
-                            total_ms = int((time.time() - section_wall_start) * 1000)
+                            total_ms = int((clock.time() - section_wall_start) * 1000)
                             self.logger.test_end(outcome=test_result.test_result, duration_ms=total_ms)
                             return test_result
 
@@ -620,19 +809,23 @@ class DabTester:
                 log(test_result, f"\033[1;34m[ SKIPPED - Internal Error ]\033[0m {str(e)}")
             if dab_request_topic not in {"system/logs/stop-collection", "output/image"} and resp_text:
                 try:
-                    text = str(resp_text)  # no trimming
+                    if isinstance(resp_text, DabResponse):
+                        # Reuse the body already decoded for validation
+                        obj = response_data(resp_text)
+                    else:
+                        text = str(resp_text)  # no trimming
 
-                    # If response looks like "['{', 'status: 200', ...]" try to merge it to JSON text
-                    if text.startswith('[') and text.endswith(']'):
-                        import ast
-                        try:
-                            chunks = ast.literal_eval(text)
-                            if isinstance(chunks, list):
-                                text = " ".join(str(x) for x in chunks if str(x))
-                        except Exception:
-                            pass
+                        # If response looks like "['{', 'status: 200', ...]" try to merge it to JSON text
+                        if text.startswith('[') and text.endswith(']'):
+                            import ast
+                            try:
+                                chunks = ast.literal_eval(text)
+                                if isinstance(chunks, list):
+                                    text = " ".join(str(x) for x in chunks if str(x))
+                            except Exception:
+                                pass
 
-                    obj = json.loads(text)
+                        obj = json.loads(text)
 
                     if isinstance(obj, dict):
                         for key, value in obj.items():
@@ -685,16 +878,17 @@ class DabTester:
 
 
             # ---------- close the test section ----------
-            total_ms = int((time.time() - section_wall_start) * 1000)
+            total_ms = int((clock.time() - section_wall_start) * 1000)
             self.logger.test_end(outcome=test_result.test_result, duration_ms=total_ms)
             # --------------------------------------------------------
 
             return test_result
 
         finally:
-            # Always try to go back Home after the test, regardless of outcome/early return/exception.
+            _report_settles(test_result, _settles.__dict__.pop("entries", None))
+            # Go back Home after the test if it may have left an app in front, regardless of outcome/early return/exception.
             try:
-                self.return_to_home_after_test(device_id)
+                self.return_to_home_after_test(device_id, foreground=foreground_after)
             except Exception:
                 # best-effort cleanup; never let this affect runner flow
                 pass
@@ -708,7 +902,8 @@ class DabTester:
         result_list = []
         terminated_run = False
         total_count = len(functional_tests)
-        suite_wall_start = time.time()
+        suite_wall_start = clock.time()
+        self._start_suite_budget()
         dab_version = self.dab_version  # Get the device's DAB version once
 
         for idx, test_case in enumerate(functional_tests, 1):
@@ -726,8 +921,20 @@ class DabTester:
             pretty_name = test_name if isinstance(test_name, str) and test_name.strip() else f"{dab_topic}/{test_category}"
             self.logger.result(f"functional progress {idx}/{total_count}: {pretty_name} on topic '{dab_topic}'.")
 
-            # --- open a test section (mirrors conformance) ---
             test_id = to_test_id(f"{dab_topic}/{pretty_name}")
+            resumed = self._resumed_result("functional", test_id)
+            if resumed is not None:
+                result_list.append(resumed)
+                continue
+
+            budget, _scope = self._case_budget()
+            if budget is not None and budget <= 0:
+                tr = self._budget_skipped_result(device_id, test_case, "The suite wall-time budget expired before this test started.", test_id=test_id, topic=dab_topic)
+                result_list.append(tr)
+                self._journal_result("functional", test_id, tr)
+                continue
+
+            # --- open a test section (mirrors conformance) ---
             self.logger.test_start(
                 name=pretty_name,
                 test_id=test_id,
@@ -736,7 +943,7 @@ class DabTester:
                 request_body="{}",
                 suite="functional"
             )
-            section_wall_start = time.time()
+            section_wall_start = clock.time()
             outcome_for_end = "SKIPPED"  # default if we bail early
             # --------------------------------------------------
 
@@ -751,7 +958,8 @@ class DabTester:
                         [log_msg]
                     )
                     result_list.append(tr)
-                    total_ms = int((time.time() - section_wall_start) * 1000)
+                    self._journal_result("functional", test_id, tr)
+                    total_ms = int((clock.time() - section_wall_start) * 1000)
                     self.logger.test_end(outcome=outcome_for_end, duration_ms=total_ms)
                     continue  # Skip to the next test in the loop
             except InvalidVersion as e:
@@ -769,13 +977,13 @@ class DabTester:
                 )
                 result_list.append(tr)
                 outcome_for_end = "SKIPPED"
-                total_ms = int((time.time() - section_wall_start) * 1000)
+                total_ms = int((clock.time() - section_wall_start) * 1000)
                 self.logger.test_end(outcome=outcome_for_end, duration_ms=total_ms)
 
                 # Mark REMAINING tests as skipped too (no start/end sections for them)
-                for remaining in functional_tests[idx:]:
+                for pending in functional_tests[idx:]:
                     try:
-                        r_topic, r_category, *_ = remaining
+                        r_topic, r_category, *_ = pending
                     except Exception:
                         r_topic, r_category = ("unknown/topic", "functional")
                     r_test_id = to_test_id(f"{r_topic}/{r_category}")
@@ -793,7 +1001,13 @@ class DabTester:
                 if callable(test_func):
                     result = None
                     try:
-                        result = test_func(dab_topic, pretty_name, self, device_id)
+                        budget, scope = self._case_budget()
+                        finished, result = run_with_budget(test_func, budget, dab_topic, pretty_name, self, device_id)
+                        if not finished:
+                            reason = f"The {scope} wall-time budget ({round(budget, 1):g}s) expired; the test was abandoned and the run moved on."
+                            self.logger.warn(f"Test {test_id}: {reason}")
+                            result = TestResult(test_id, device_id, dab_topic, "{}", "SKIPPED", "", [f"[SKIPPED - Wall-Time Budget] {reason}"])
+                            result.test_result = "SKIPPED"
                         # Ensure we always append a TestResult-like object
                         if result is None:
                             result = TestResult(
@@ -838,8 +1052,13 @@ class DabTester:
                 result_list.append(tr)
                 outcome_for_end = "SKIPPED"
 
+            # The test ran (whatever its outcome): journal it before moving on
+            total_ms = int((clock.time() - section_wall_start) * 1000)
+            if getattr(result_list[-1], "duration_ms", None) is None:
+                result_list[-1].duration_ms = total_ms
+            self._journal_result("functional", test_id, result_list[-1])
+
             # --- close the test section (mirrors conformance) ---
-            total_ms = int((time.time() - section_wall_start) * 1000)
             self.logger.test_end(outcome=outcome_for_end, duration_ms=total_ms)
             # -----------------------------------------------------
 
@@ -847,12 +1066,197 @@ class DabTester:
             test_result_output_path = "./test_result/functional_result.json"
 
         device_info = self.get_device_info(device_id)
-        total_wall_ms = int((time.time() - suite_wall_start) * 1000)
+        total_wall_ms = int((clock.time() - suite_wall_start) * 1000)
         self.write_test_result_json("functional", result_list, test_result_output_path, device_info=device_info, total_wall_ms=total_wall_ms)
 
         if terminated_run and self.verbose:
             self.logger.info("Functional test run ended early. Results file is written.")
 
+    # -----------------------------
+    # Result journal (crash-safe progress, --resume)
+    # -----------------------------
+    def _resumed_result(self, suite_name, key):
+        """The journaled result for this test if a resumed run already finished it, else None."""
+        if not key or self.journal is None:
+            return None
+        result = self.journal.take_completed(suite_name, key)
+        if result is not None:
+            outcome = getattr(result, "test_result", None) or getattr(result, "outcome", "UNKNOWN")
+            self.logger.result(f"Resumed '{key}' from the journal ({outcome}); not running it again.")
+        return result
+
+    def _journal_result(self, suite_name, key, result):
+        if key and result is not None and self.journal is not None:
+            self.journal.append(suite_name, key, result)
+        if key and self.time_plan is not None:
+            self.time_plan.observe(suite_name, key)
+
+    def _execute_or_resume(self, suite_name, device_id, test_case, note=None):
+        """Execute() one case and journal its result, or take the result from the resume journal.
+        note, if given, is added to the logs of a result that actually ran."""
+        topic, _body, _func, _expected, title, _is_negative, _ver = self.unpack_test_case(test_case)
+        key = to_test_id(f"{topic}/{title}") if topic else None
+        result = self._resumed_result(suite_name, key)
+        if result is not None:
+            return result
+        result = self.Execute(device_id, test_case)
+        if note and result is not None and isinstance(getattr(result, "logs", None), list):
+            result.logs.append(note)
+        self._journal_result(suite_name, key, result)
+        return result
+
+    def _log_progress(self, suite_name, idx, total_tests, test):
+        try:
+            topic, _body, _func, _expected, title, _is_negative, _ver = self.unpack_test_case(test)
+            if topic and title:
+                self.logger.result(f"{suite_name} progress {idx}/{total_tests}: {title} on topic '{topic}'.")
+            else:
+                self.logger.result(f"{suite_name} progress {idx}/{total_tests}: (test case not resolved).")
+        except Exception:
+            self.logger.result(f"{suite_name} progress {idx}/{total_tests}: (test case not resolved).")
+
+    def _concurrency_safe(self, test_case):
+        """Read-only operations and state-neutral bad requests may run side by side (see util.test_scheduler)."""
+        try:
+            topic, _body, _func, _expected, _title, is_negative, _ver = self.unpack_test_case(test_case)
+        except Exception:
+            return False
+        return concurrency_safe(topic, is_negative)
+
+    def _runs(self, cases):
+        """
+        The (position, case) pairs split into runs, in order: with --concurrency, each stretch of
+        consecutive concurrency-safe tests is one run; every other test is a run of its own. A test that
+        changes device state therefore still sees every test before it finished, and none after it started.
+        """
+        run = []
+        for case in cases:
+            if self.concurrency > 1 and self._concurrency_safe(case[1]):
+                run.append(case)
+                continue
+            if run:
+                yield run
+                run = []
+            yield [case]
+        if run:
+            yield run
+
+    def _execute_concurrently(self, suite_name, device_id, batch, total_tests, results):
+        """
+        Run the (position, case) pairs in batch with up to self.concurrency in flight, filling results.
+        Each request still gets its own latency; every result notes how many tests were in flight when it
+        started, and the batch's wall time is printed against the summed latency to show how the device copes.
+        A PreflightTermination from any test cancels the rest of the batch and is re-raised.
+        """
+        limit = min(self.concurrency, len(batch))
+        self.logger.result(f"Running {len(batch)} consecutive concurrency-safe {suite_name} tests with up to {limit} in flight.")
+        in_flight = [0]
+        lock = Lock()
+
+        def run(idx, test):
+            # Each test's section is printed whole once it is done
+            with self.logger.held():
+                self._log_progress(suite_name, idx, total_tests, test)
+                with lock:
+                    in_flight[0] += 1
+                    peers = in_flight[0]
+                try:
+                    return self._execute_or_resume(suite_name, device_id, test, note=f"[INFO] Ran concurrently: {peers} of up to {limit} tests in flight when it started.")
+                finally:
+                    with lock:
+                        in_flight[0] -= 1
+
+        batch_start = clock.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=limit, thread_name_prefix="dab-test")
+        futures = {executor.submit(run, idx, test): idx for idx, test in batch}
+        try:
+            for future in as_completed(futures):
+                r = future.result()
+                if r:
+                    results[futures[future]] = r
+        except PreflightTermination:
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            executor.shutdown(wait=True)
+            wall_ms = int((clock.perf_counter() - batch_start) * 1000)
+            latency_ms = sum(getattr(results.get(idx), "latency_ms", None) or 0 for idx, _ in batch)
+            overlap = f" ({latency_ms / wall_ms:.1f}x overlap)" if wall_ms else ""
+            self.logger.result(f"Concurrent batch: {len(batch)} tests in {wall_ms} ms wall; summed request latency {int(latency_ms)} ms{overlap}.")
+
+    def _scheduled(self, suite_name, Test_Set):
+        """Test_Set in the state-aware order from util.test_scheduler; prints the plan and its estimated saving."""
+        try:
+            ordered, report = plan_schedule(Test_Set, self.unpack_test_case)
+        except Exception as e:
+            self.logger.warn(f"Could not plan a schedule for {suite_name}; running it in the written order. Exception: {type(e).__name__}: {e}")
+            return Test_Set
+        self.logger.result(f"Planned order for {suite_name} ({len(ordered)} tests, original position in brackets):")
+        for idx, (position, topic, title) in enumerate(report["order"], start=1):
+            self.logger.result(f"  {idx:>3}. [{position}] {title} on topic '{topic}'")
+        self.logger.result(
+            f"Estimated state transitions: {report['transitions_before']} -> {report['transitions_after']}; "
+            f"estimated time saved ~{report['estimated_saved_ms'] / 1000:.1f}s "
+            f"({report['estimated_before_ms'] / 1000:.1f}s -> {report['estimated_after_ms'] / 1000:.1f}s)."
+        )
+        return ordered
+
+    def _rerun_failures(self, suite_name, device_id, tests, results):
+        """
+        Give FAILED / SKIPPED results up to self.reruns more attempts (same Execute path, preflight included),
+        known-flaky tests first. Each result records attempts and attempt_outcomes; the flakiness statistics
+        are updated and saved, and results at or above the quarantine ratio are marked quarantined.
+        """
+        if self.flakiness is None:
+            self.flakiness = FlakinessStats()
+
+        def outcome_of(r):
+            return getattr(r, "test_result", None) or getattr(r, "outcome", None) or ""
+
+        for r in results.values():
+            r.attempts = 1
+            r.attempt_outcomes = [outcome_of(r)]
+        pending = [idx for idx, r in results.items() if outcome_of(r) in RERUN_OUTCOMES]
+        pending.sort(key=lambda idx: (-self.flakiness.ratio(suite_name, results[idx].test_id), idx))
+        retried = set(pending)
+
+        try:
+            for attempt in range(2, self.reruns + 2):
+                if not pending:
+                    break
+                self.logger.result(f"Rerun {attempt - 1}/{self.reruns}: retrying {len(pending)} failed/skipped {suite_name} tests.")
+                still_failing = []
+                for idx in pending:
+                    budget, _scope = self._case_budget()
+                    if budget is not None and budget <= 0:
+                        self.logger.warn("The suite wall-time budget is spent; no more reruns.")
+                        return
+                    previous = results[idx]
+                    r = self._execute_or_resume(suite_name, device_id, tests[idx])
+                    if not r:
+                        continue
+                    r.attempts = attempt
+                    r.attempt_outcomes = previous.attempt_outcomes + [outcome_of(r)]
+                    results[idx] = r
+                    if outcome_of(r) in RERUN_OUTCOMES:
+                        still_failing.append(idx)
+                pending = still_failing
+        finally:
+            for r in results.values():
+                self.flakiness.record(suite_name, r.test_id, r.attempt_outcomes)
+                ratio = self.flakiness.ratio(suite_name, r.test_id)
+                if self.quarantine_ratio is not None and ratio and ratio >= self.quarantine_ratio:
+                    r.quarantined = True
+                    r.logs.append(f"[QUARANTINED] Flakiness ratio {ratio:.2f} is at or above {self.quarantine_ratio:.2f}.")
+            self.flakiness.save()
+            recovered = sum(1 for idx in retried if outcome_of(results[idx]) not in RERUN_OUTCOMES)
+            quarantined = sum(1 for r in results.values() if getattr(r, "quarantined", False))
+            self.logger.result(
+                f"Reruns: {len(retried)} failed/skipped tests retried, {recovered} recovered, "
+                f"{len(retried) - recovered} still failing; {quarantined} quarantined. Statistics: {self.flakiness.path}"
+            )
+
     # -----------------------------
     # Conformance (suite) runner
     # -----------------------------
@@ -864,33 +1268,38 @@ class DabTester:
             self.Execute_Functional_Tests(device_id, Test_Set, test_result_output_path)
             return
         
+        if self.schedule_tests:
+            Test_Set = self._scheduled(suite_name, Test_Set)
+
         # show total tests once (always as RESULT)
         total_tests = len(Test_Set)
         self.logger.result(f"Starting {suite_name} suite with {total_tests} tests.")
-        suite_wall_start = time.time()
+        suite_wall_start = clock.time()
+        self._start_suite_budget()
         result_list = TestSuite([], suite_name)
+        # Position in Test_Set -> result, so the results file keeps the suite order whatever finished first
+        results = {}
         try:
-            # enumerate to print progress before each test
-            for idx, test in enumerate(Test_Set, start=1):
-                try:
-                    topic, _body, _func, _expected, title, _is_negative, _ver = self.unpack_test_case(test)
-                    if topic and title:
-                        self.logger.result(f"{suite_name} progress {idx}/{total_tests}: {title} on topic '{topic}'.")
-                    else:
-                        self.logger.result(f"{suite_name} progress {idx}/{total_tests}: (test case not resolved).")
-                except Exception:
-                    self.logger.result(f"{suite_name} progress {idx}/{total_tests}: (test case not resolved).")
-
-                r = self.Execute(device_id, test)
+            for run in self._runs(enumerate(Test_Set, start=1)):
+                if len(run) > 1:
+                    self._execute_concurrently(suite_name, device_id, run, total_tests, results)
+                    continue
+                # print progress before each test
+                idx, test = run[0]
+                self._log_progress(suite_name, idx, total_tests, test)
+                r = self._execute_or_resume(suite_name, device_id, test)
                 if r:
-                    result_list.test_result_list.append(r)
+                    results[idx] = r
+            if self.reruns:
+                self._rerun_failures(suite_name, device_id, dict(enumerate(Test_Set, start=1)), results)
         except PreflightTermination:
             self.logger.warn("The run was terminated during the preflight stage. Writing partial results and stopping.")
+        result_list.test_result_list.extend(results[idx] for idx in sorted(results))
 
         if (len(test_result_output_path) == 0):
             test_result_output_path = f"./test_result/{suite_name}.json"
         device_info = self.get_device_info(device_id)
-        total_wall_ms = int((time.time() - suite_wall_start) * 1000)
+        total_wall_ms = int((clock.time() - suite_wall_start) * 1000)
         self.write_test_result_json(suite_name, result_list.test_result_list, test_result_output_path, device_info = device_info, total_wall_ms=total_wall_ms)
 
     # -----------------------------
@@ -903,16 +1312,17 @@ class DabTester:
         if suite_name == "functional":
             self.Execute_Functional_Tests(device_id, test_case_or_cases, test_result_output_path)
             return
-        suite_wall_start = time.time()
+        suite_wall_start = clock.time()
+        self._start_suite_budget()
         result_list = TestSuite([], suite_name)
         try:
             if isinstance(test_case_or_cases, list):
                 for test_case in test_case_or_cases:
-                    result = self.Execute(device_id, test_case)
+                    result = self._execute_or_resume(suite_name, device_id, test_case)
                     if result:
                         result_list.test_result_list.append(result)
             else:
-                result = self.Execute(device_id, test_case_or_cases)
+                result = self._execute_or_resume(suite_name, device_id, test_case_or_cases)
                 if result:
                     result_list.test_result_list.append(result)
         except PreflightTermination:
@@ -921,7 +1331,7 @@ class DabTester:
         if len(test_result_output_path) == 0:
             test_result_output_path = f"./test_result/{suite_name}_single.json"
         device_info = self.get_device_info(device_id)
-        total_wall_ms = int((time.time() - suite_wall_start) * 1000)
+        total_wall_ms = int((clock.time() - suite_wall_start) * 1000)
         self.write_test_result_json(suite_name, result_list.test_result_list, test_result_output_path, device_info = device_info, total_wall_ms=total_wall_ms)
 
     # -----------------------------
@@ -935,8 +1345,8 @@ class DabTester:
             suite_name (str): The name of the test suite executed.
             result_list (list): List of TestResult objects containing individual test outcomes.
             output_path (str): The file path where the JSON output should be saved.
-            This function computes a result summary, validates the result content,
-            and writes a detailed structured JSON with summary and test details.
+            Valid results are counted first, then tidied and streamed to the file one at a time with
+            the result summary after the test details. The console summary is printed either way.
         """
         if not output_path:
             output_path = f"./test_result/{suite_name}.json"
@@ -945,7 +1355,8 @@ class DabTester:
         def _outcome_of(r):
             return getattr(r, "test_result", None) or getattr(r, "outcome", None) or ""
 
-        # Keep only well-formed TestResult objects
+        # Keep only well-formed TestResult objects; the counts are taken from them before writing,
+        # so the console summary is printed even when the file cannot be written
         valid_results = []
         for r in result_list:
             try:
@@ -957,98 +1368,28 @@ class DabTester:
             except Exception:
                 self.logger.warn(f"An invalid result object was skipped in the JSON writer: {r}")
 
-            # --- Summarize heavy topics (no artifact saving here) ---
-            HEAVY_TOPICS = {"system/logs/stop-collection", "output/image"}
-
-            for r in valid_results:
-                topic = getattr(r, "operation", "") or getattr(r, "topic", "")
-                if topic not in HEAVY_TOPICS:
-                    continue
-
-                # Parse response to dict (best-effort) for status summarization
-                resp_raw = getattr(r, "response", None)
-
-                # NEW: if response is already a list, summarize by length and skip parsing
-                if isinstance(resp_raw, list):  # e.g., old runs that tokenized the body
-                    setattr(r, "response", f"Response summary for '{topic}': list with {len(resp_raw)} items")
-                else:
-                    if isinstance(resp_raw, dict):
-                        resp_obj = resp_raw
-                    elif isinstance(resp_raw, str) and resp_raw.strip():
-                        try:
-                            resp_obj = json.loads(resp_raw)
-                        except Exception:
-                            resp_obj = {}
-                    else:
-                        resp_obj = {}
-
-                    # Build concise summary (no big payloads in results.json)
-                    status = resp_obj.get("status") if isinstance(resp_obj, dict) else None
-                    if isinstance(status, int):
-                        outcome = "SUCCESS" if status == 200 else f"ERROR {status}"
-                        summary = f"Response summary for '{topic}': HTTP {status} ({outcome})"
-                    else:
-                        summary = f"Response summary for '{topic}': stored artifact; see logs."
-                    setattr(r, "response", summary)
-                # Ensure a logs list exists; reference any path that the step saved
-                try:
-                    if not hasattr(r, "logs") or r.logs is None:
-                        setattr(r, "logs", [])
-                    saved_path = getattr(r, "saved_image_path", None)
-                    if topic == "output/image" and saved_path:
-                        r.logs.append(f"[INFO] Screenshot (from step): {saved_path}")
-                except Exception:
-                    pass
-                # NEW: scrub any previously-added response lines from logs for heavy topics
-                # (keeps only non-response lines, like the screenshot info above)
-                try:
-                    if hasattr(r, "logs") and isinstance(r.logs, list):
-                        cleaned = []
-                        for ln in r.logs:
-                            # keep non-strings (dict/list), and non-response info lines
-                            if not isinstance(ln, str):
-                                cleaned.append(ln); continue
-                            s = ln.lstrip()
-                            # Remove only raw response previews (JSON-ish), not our structured log tags like [TEST]/[INFO]/[PASS].
-                            if s.startswith("{") or s.startswith("status:") or s.startswith("[RESPONSE"):
-                                continue
-                            if s.startswith("item[") or s.startswith("items["):
-                                continue
-                            # Only drop JSON-like arrays, not log tags.
-                            if s.startswith("[{") or s.startswith('["') or (len(s) > 1 and s[0] == "[" and s[1].isdigit()):
-                                continue
-                            cleaned.append(ln)
-                        r.logs = cleaned
-                except Exception:
-                    pass
-
-        # -------------------------------------------------------------------------------
-
-        # Clean only valid results so what we write is tidy (keep logs!)
-        self.clean_result_fields(valid_results, fields_to_clean=["request", "response"])
-
         # Counts must match what we write
         total = len(valid_results)
-        passed = sum(1 for t in valid_results if _outcome_of(t) == "PASS")
-        failed = sum(1 for t in valid_results if _outcome_of(t) == "FAILED")
-        optional_failed = sum(1 for t in valid_results if _outcome_of(t) == "OPTIONAL_FAILED")
-        skipped = sum(1 for t in valid_results if _outcome_of(t) == "SKIPPED")
+        counts = {"PASS": 0, "FAILED": 0, "OPTIONAL_FAILED": 0, "SKIPPED": 0}
+        for r in valid_results:
+            outcome = _outcome_of(r)
+            if outcome in counts:
+                counts[outcome] += 1
+        passed, failed = counts["PASS"], counts["FAILED"]
+        optional_failed, skipped = counts["OPTIONAL_FAILED"], counts["SKIPPED"]
+        overall_ok = (failed == 0 and skipped == 0)
 
-        result_data = {
-            "test_version": get_test_tool_version(),
-            "suite_name": suite_name,
-            "device_info": device_info if device_info else {},
+        saved_path = self._stream_results_file(suite_name, output_path, device_info, valid_results, {
             "result_summary": {
                 "tests_executed": total,
                 "tests_passed": passed,
                 "tests_failed": failed,
                 "tests_optional_failed": optional_failed,
                 "tests_skipped": skipped,
-                "overall_passed": (failed == 0 and skipped == 0)
-            },
-            "test_result_list": valid_results
-        }
-        overall_ok = (failed == 0 and skipped == 0)
+                "overall_passed": overall_ok
+            }
+        })
+
         self.logger.result("══════════════════════════════════════════════════════════════════════════════")
         if total_wall_ms is not None:
             try:
@@ -1065,18 +1406,113 @@ class DabTester:
         self.logger.result(f"  OPTIONAL_FAIL : {optional_failed}")
         self.logger.result(f"  SKIPPED       : {skipped}")
         self.logger.result(f"Overall Passed  : {'YES' if overall_ok else 'NO'}")
+        preflight_line = self._preflight_summary()
+        if preflight_line:
+            self.logger.result(preflight_line)
         self.logger.result("══════════════════════════════════════════════════════════════════════════════")
+        if saved_path:
+            self.logger.ok(f"Saved the results JSON at {saved_path}.")
+        return saved_path
+
+    def _stream_results_file(self, suite_name, output_path, device_info, valid_results, summary):
+        """
+        Tidy and write valid_results to output_path one at a time (ResultJsonWriter), then summary.
+        Returns the absolute path, or "" (after logging why) when the file could not be written.
+        """
+        header = {
+            "test_version": get_test_tool_version(),
+            "suite_name": suite_name,
+            "device_info": device_info if device_info else {},
+        }
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                # Beautify using jsons and indent=4 passed through jdkwargs
-                f.write(jsons.dumps(result_data, jdkwargs={"indent": 4}))
-            self.logger.ok(f"Saved the results JSON at {os.path.abspath(output_path)}.")
-            return os.path.abspath(output_path)
+            writer = ResultJsonWriter(output_path, header)
+        except (OSError, PermissionError, FileNotFoundError) as e:
+            self.logger.error(f"Could not write the results JSON to '{output_path}'. Reason: {e}")
+            return ""
 
-        except (OSError, PermissionError, FileNotFoundError, TypeError) as e:
+        try:
+            for r in valid_results:
+                self._summarize_heavy_result(r)
+                # Clean only valid results so what we write is tidy (keep logs!)
+                self.clean_result_fields([r], fields_to_clean=["request", "response"])
+                writer.add(r)
+            writer.close(summary)
+            return os.path.abspath(output_path)
+        except (OSError, PermissionError, FileNotFoundError, TypeError, ValueError) as e:
             # Catch only expected serialization or file write errors
             self.logger.error(f"Could not write the results JSON to '{output_path}'. Reason: {e}")
             return ""
+        finally:
+            # Whatever went wrong (caught above or not), no .partial file is left behind
+            writer.abort()
+
+    def _summarize_heavy_result(self, r):
+        """
+        Summarize heavy topics (no artifact saving here): replace the big response with a
+        one-line status summary and drop raw response previews from the logs.
+        """
+        HEAVY_TOPICS = {"system/logs/stop-collection", "output/image"}
+
+        topic = getattr(r, "operation", "") or getattr(r, "topic", "")
+        if topic not in HEAVY_TOPICS:
+            return
+
+        # Parse response to dict (best-effort) for status summarization
+        resp_raw = getattr(r, "response", None)
+
+        # NEW: if response is already a list, summarize by length and skip parsing
+        if isinstance(resp_raw, list):  # e.g., old runs that tokenized the body
+            setattr(r, "response", f"Response summary for '{topic}': list with {len(resp_raw)} items")
+        else:
+            if isinstance(resp_raw, dict):
+                resp_obj = resp_raw
+            elif isinstance(resp_raw, str) and resp_raw.strip():
+                try:
+                    resp_obj = response_data(resp_raw)
+                except Exception:
+                    resp_obj = {}
+            else:
+                resp_obj = {}
+
+            # Build concise summary (no big payloads in results.json)
+            status = resp_obj.get("status") if isinstance(resp_obj, dict) else None
+            if isinstance(status, int):
+                outcome = "SUCCESS" if status == 200 else f"ERROR {status}"
+                summary = f"Response summary for '{topic}': HTTP {status} ({outcome})"
+            else:
+                summary = f"Response summary for '{topic}': stored artifact; see logs."
+            setattr(r, "response", summary)
+        # Ensure a logs list exists; reference any path that the step saved
+        try:
+            if not hasattr(r, "logs") or r.logs is None:
+                setattr(r, "logs", [])
+            saved_path = getattr(r, "saved_image_path", None)
+            if topic == "output/image" and saved_path:
+                r.logs.append(f"[INFO] Screenshot (from step): {saved_path}")
+        except Exception:
+            pass
+        # NEW: scrub any previously-added response lines from logs for heavy topics
+        # (keeps only non-response lines, like the screenshot info above)
+        try:
+            if hasattr(r, "logs") and isinstance(r.logs, list):
+                cleaned = []
+                for ln in r.logs:
+                    # keep non-strings (dict/list), and non-response info lines
+                    if not isinstance(ln, str):
+                        cleaned.append(ln); continue
+                    s = ln.lstrip()
+                    # Remove only raw response previews (JSON-ish), not our structured log tags like [TEST]/[INFO]/[PASS].
+                    if s.startswith("{") or s.startswith("status:") or s.startswith("[RESPONSE"):
+                        continue
+                    if s.startswith("item[") or s.startswith("items["):
+                        continue
+                    # Only drop JSON-like arrays, not log tags.
+                    if s.startswith("[{") or s.startswith('["') or (len(s) > 1 and s[0] == "[" and s[1].isdigit()):
+                        continue
+                    cleaned.append(ln)
+                r.logs = cleaned
+        except Exception:
+            pass
 
     def unpack_test_case(self, test_case):
         def fail(reason):
@@ -1156,7 +1592,7 @@ class DabTester:
             response = self.dab_client.response()
 
             if response:
-                resp_json = json.loads(response)
+                resp_json = response_data(response)
                 self.dab_version = resp_json.get("DAB Version", "2.0")
                 DAB_VERSION = self.dab_version
                 self.logger.info(f"DAB version detected: {self.dab_version}.")
@@ -1173,7 +1609,7 @@ class DabTester:
             self.dab_client.request(device_id, "device/info", "{}")
             response = self.dab_client.response()
             if response:
-                device_info = json.loads(response)
+                device_info = response_data(response)
 
                 # Extract only the required fields
                 filtered_info = {
@@ -1204,6 +1640,9 @@ class DabTester:
                 if not hasattr(result, field):
                     continue
                 raw_value = getattr(result, field)
+                # Responses are stored as received; lay them out as indented JSON for the results file
+                if isinstance(raw_value, DabResponse) and raw_value.data is not None:
+                    raw_value = json.dumps(raw_value.data, indent=2)
                 # Normalize to list of lines
                 if isinstance(raw_value, list):
                     lines = raw_value
@@ -1228,7 +1667,7 @@ class DabTester:
         """Ensure `device_id` is reachable via discovery (no health-check fallback)."""
         self.logger.info("Preflight: discovering devices to confirm the target is online.")
         try:
-            devices = self.dab_client.discover_devices() or []
+            devices = self.dab_client.discover_devices(device_id=device_id) or []
         except Exception as e:
             self.logger.warn(f"Discovery did not complete due to an error: {e}")
             devices = []
@@ -1267,27 +1706,50 @@ class DabTester:
             sys_exit(4)
         return False
     
-    def return_to_home_after_test(self, device_id, logs=None, delay=0.5):
+    def return_to_home_after_test(self, device_id, logs=None, delay=0, foreground=UNKNOWN):
         """
         Best-effort: send KEY_HOME once so the next test starts from Home.
+        foreground is what the test left in front (see foreground_effect): None or HOME needs nothing,
+        an appId is checked with applications/get-state first, UNKNOWN always gets the key.
         Swallows errors; adds a short log line if provided.
         """
+        if foreground is None or foreground == HOME:
+            return
         try:
+            if foreground != UNKNOWN and not self._app_in_foreground(device_id, foreground):
+                if logs is not None:
+                    logs.append(f"[INFO] Post-test: '{foreground}' is not in the foreground; KEY_HOME not needed.")
+                return
             self.execute_cmd(device_id, "input/key-press", json.dumps({"keyCode": "KEY_HOME"}))
             _ = self.dab_client.response()  # drain response if any
-            time.sleep(delay)
+            if delay:
+                clock.sleep(delay, "return to Home")
             if logs is not None:
                 logs.append("[INFO] Post-test: sent KEY_HOME.")
         except Exception:
             if logs is not None:
                 logs.append("[WARN] Post-test KEY_HOME failed (ignored).")
 
+    def _app_in_foreground(self, device_id, app_id):
+        """applications/get-state says app_id is in the FOREGROUND; True when the state cannot be read."""
+        if self.execute_cmd(device_id, "applications/get-state", json.dumps({"appId": app_id})) != 0:
+            return True
+        try:
+            state = response_data(self.dab_client.response() or "{}").get("state")
+        except Exception:
+            return True
+        return not isinstance(state, str) or state.upper() == "FOREGROUND"
+
     def Close(self):
         self.dab_client.disconnect()
+        if self.journal is not None:
+            self.journal.close()
 
 def Default_Validations(test_result, durationInMs=0, expectedLatencyMs=0):
-    sleep(0.2)
     log(test_result, f"\n{test_result.operation} Latency, Expected: {expectedLatencyMs} ms, Actual: {durationInMs} ms\n")
+    overhead_ms = getattr(test_result, "harness_overhead_ms", None)
+    if overhead_ms is not None:
+        log(test_result, f"{test_result.operation} Harness overhead (not counted in latency): {overhead_ms} ms")
     if durationInMs > expectedLatencyMs:
         log(test_result, f"{test_result.operation} took more time than expected.\n")
         return False
@@ -1331,6 +1793,28 @@ def log(test_result, str_print):
             clean = line
         test_result.logs.append(clean)
 
+# Settle periods declared by the test running on this thread: [(reason, seconds)]
+_settles = local()
+
+def Settle(seconds, reason):
+    """
+    A wait with nothing to verify actively (validators and checker prechecks). Slept here and
+    reported on the test's result as settle_ms, apart from its latency and verdict.
+    """
+    check_budget()
+    LOGGER.info(f"[SETTLE] {reason}: {seconds:g}s")
+    clock.sleep(seconds, reason)
+    entries = getattr(_settles, "entries", None)
+    if entries is not None:
+        entries.append((reason, seconds))
+
+def _report_settles(test_result, entries):
+    if test_result is None or not entries:
+        return
+    test_result.settle_ms = int(sum(seconds for _, seconds in entries) * 1000)
+    for reason, seconds in entries:
+        log(test_result, f"[SETTLE] {reason}: {seconds:g}s (declared wait, not part of latency or verdict)")
+
 def YesNoQuestion(test_result, question=""):
     positive = ['yes', 'y']
     negative = ['no', 'n']
@@ -1347,7 +1831,7 @@ def YesNoQuestion(test_result, question=""):
         colored_prompt = f"{CYAN}{question}{RESET} ({GREEN}Y{RESET}/{RED}N{RESET})"
         # ensure prompt appears on a new line even if the previous print used end=''
         log(test_result, colored_prompt)
-        user_input = readchar()
+        user_input = read_operator(readchar)
         lower = user_input.lower()
         if lower in positive:
             log(test_result, f"{GREEN}[{user_input}]{RESET}")
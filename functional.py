@@ -1,18 +1,20 @@
 from result_json import TestResult
 from dab_tester import to_test_id
+from dab_client import response_data
 import config
 import json
-import time
 import sys
 from readchar import readchar
 from util.enforcement_manager import EnforcementManager
 from util.config_loader import ensure_app_available_anyext
 from util.config_loader import ensure_app_available
 from util.config_loader import ensure_apps_available as _ensure_many
-from paho.mqtt.properties import Properties
-from paho.mqtt.packettypes import PacketTypes
 from dab_checker import DabChecker
 from util.enforcement_manager import ValidateCode
+from util.watchdog import read_operator
+from util import clock
+from util.wait import wait_for_app_listed, wait_for_app_state, settle
+from util.reboot_watch import watch_reboot, wait_for_down, DOWN_WINDOW
 from logger import LOGGER
 import functionals.brightness
 import functionals.contrast
@@ -33,7 +35,7 @@ CONTENT_LOAD_WAIT = 20
 DEVICE_REBOOT_WAIT = 180  # Max wait for device reboot
 TELEMETRY_DURATION_MS = 5000
 TELEMETRY_METRICS_WAIT = 30  # Max wait for telemetry metrics (seconds)
-HEALTH_CHECK_INTERVAL = 5   # Seconds between health check polls
+NETWORK_RESET_DOWN_WINDOW = 15  # Seconds a network-reset device gets to drop off before it counts as staying up
 ASSISTANT_INIT = 10
 APP_INSTALL_WAIT = 10
 ASSISTANT_WAIT = 10
@@ -230,7 +232,7 @@ def execute_cmd_and_log(tester, device_id, topic, payload, logs=None, result=Non
 def dab_status_from(resp, rc):
     try:
         if isinstance(resp, str):    # JSON string
-            return json.loads(resp).get("status", rc)
+            return response_data(resp).get("status", rc)
         if isinstance(resp, dict):   # dict
             return resp.get("status", rc)
     except Exception:
@@ -260,7 +262,7 @@ def yes_or_no(result, logs, question=""):
         LOGGER.prompt(prompt)
         if logs is not None:
             logs.append(prompt)
-        ch = readchar().upper()
+        ch = read_operator(readchar).upper()
         echo = f"[{ch}]"
         LOGGER.result(echo)
         if logs is not None:
@@ -289,7 +291,7 @@ def select_input(result, logs, arr):
         LOGGER.prompt(prompt)
         if logs is not None: logs.append(prompt)
 
-        ch = readchar()
+        ch = read_operator(readchar)
         echo = f"[{ch}]"
         LOGGER.result(echo)
         if logs is not None: logs.append(echo)
@@ -312,7 +314,7 @@ def countdown(title, count):
             timer = f"{mins:02d}:{secs:02d}"
             sys.stdout.write("\r" + title + " --- " + timer)
             sys.stdout.flush()
-            time.sleep(1)
+            clock.sleep(1, "countdown")
             count -= 1
         sys.stdout.write("\r" + title + " --- Done!\n")
     finally:
@@ -338,7 +340,7 @@ def validate_response(tester, dab_topic, dab_payload, dab_response, result, logs
         return False, result
 
     try:
-        response = json.loads(dab_response)
+        response = response_data(dab_response)
     except Exception:
         line = f"[FAIL] Request {dab_topic} '{dab_payload}' returned invalid JSON."
         LOGGER.error(line)
@@ -492,14 +494,25 @@ def get_install_targets(default_app_ids=("Sample_App", "Sample_App1")):
 def fire_and_forget_restart(dab_client, device_id):
     """
     Fire-and-forget system restart request with proper MQTT v5 ResponseTopic.
+    Goes through submit() so the client knows the device is rebooting; nobody waits for the reply.
     """
     topic = f"dab/{device_id}/system/restart"
-    response_topic = f"dab/_response/{topic}"
-    props = Properties(PacketTypes.PUBLISH)
-    props.ResponseTopic = response_topic
-    dab_client._DabClient__client.publish(topic, "{}", qos=0, properties=props)
+    dab_client.cancel(dab_client.submit(device_id, "system/restart", "{}"))
     LOGGER.info(f"Sent restart command to {topic} (fire-and-forget)")
 
+def await_reboot(tester, device_id, result, logs, since=None, label="reboot", down_window=DOWN_WINDOW,
+                 timeout=DEVICE_REBOOT_WAIT, kind=None):
+    """
+    Follow the device through the reboot a test just requested (util.reboot_watch) and record the
+    measured down-time and time-to-healthy on the result. Returns True once it is healthy again.
+    kind="reboot" lets a calibrated system/restart budget replace timeout; resets keep timeout.
+    """
+    watch = watch_reboot(tester, device_id, timeout, logs, since=since, down_window=down_window, label=label, kind=kind)
+    if result is not None:
+        result.reboot = {"went_down": watch.went_down, "down_s": watch.down_s, "discovered_s": watch.discovered_s,
+                         "healthy_s": watch.healthy_s, "downtime_s": watch.downtime_s}
+    return watch.healthy
+
 # Priority non-English locales (TV-heavy markets) for voice/send-audio multi-language test
 VOICE_PRIORITY_LOCALES = [
     "es-419",  # Latin American Spanish
@@ -574,9 +587,7 @@ def run_app_foreground_check(dab_topic, test_name, tester, device_id):
         execute_cmd_and_log(tester, device_id, "applications/launch", payload_launch, logs, result)
 
         # Wait for stabilization
-        line = f"[WAIT] Allowing {APP_LAUNCH_WAIT}s for the app to settle."
-        LOGGER.info(line); logs.append(line)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 2 — get-state
         payload_state = json.dumps({"appId": app_id})
@@ -666,10 +677,7 @@ def run_app_background_check(dab_topic, test_name, tester, device_id):
         )
 
         # Wait for the application to stabilize in the foreground
-        line = f"[WAIT] Allowing {APP_LAUNCH_WAIT}s for the app to launch and settle."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 2 — Press the HOME key to send the app to the background
         payload_home = json.dumps({"keyCode": "KEY_HOME"})
@@ -683,10 +691,7 @@ def run_app_background_check(dab_topic, test_name, tester, device_id):
         )
 
         # Wait for the app to transition to the background
-        line = f"[WAIT] Allowing {APP_EXIT_WAIT}s for the app to move to the background."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(APP_EXIT_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "BACKGROUND", APP_EXIT_WAIT, logs)
 
         # Step 3 — Get the application's current state
         payload_state = json.dumps({"appId": app_id})
@@ -783,10 +788,7 @@ def run_app_stopped_check(dab_topic, test_name, tester, device_id):
         )
 
         # Wait for the application to stabilize
-        line = f"[WAIT] Allowing {APP_LAUNCH_WAIT}s for the app to launch and settle."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 2 — Exit the application
         payload_exit = json.dumps({"appId": app_id})
@@ -798,10 +800,7 @@ def run_app_stopped_check(dab_topic, test_name, tester, device_id):
         )
 
         # Wait for the application to fully terminate
-        line = f"[WAIT] Allowing {APP_EXIT_WAIT}s for the app to fully exit."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(APP_EXIT_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "STOPPED", APP_EXIT_WAIT, logs)
 
         # Step 3 — Get the application's final state
         payload_state = json.dumps({"appId": app_id})
@@ -971,11 +970,8 @@ def run_exit_after_video_check(dab_topic, test_name, tester, device_id):
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", launch_payload, logs, result)
         
-        wait_time = APP_LAUNCH_WAIT + CONTENT_LOAD_WAIT
-        line = f"[WAIT] Allowing {wait_time}s for video to load and play."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(wait_time)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
+        settle(CONTENT_LOAD_WAIT, "video loads and starts playing", logs)
 
         # Step 2: Exit the application
         exit_payload = json.dumps({"appId": app_id})
@@ -984,10 +980,7 @@ def run_exit_after_video_check(dab_topic, test_name, tester, device_id):
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/exit", exit_payload, logs, result)
         
-        line = f"[WAIT] Allowing {APP_EXIT_WAIT}s for the app to terminate."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(APP_EXIT_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "STOPPED", APP_EXIT_WAIT, logs)
 
         # Step 3: Get the final application state
         state_payload = json.dumps({"appId": app_id})
@@ -1076,10 +1069,7 @@ def run_relaunch_stability_check(dab_topic, test_name, tester, device_id):
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", payload, logs, result)
 
-        line = f"[WAIT] Allowing {APP_LAUNCH_WAIT}s for the app to settle."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 2: Exit the application
         line = f"[STEP] Exiting '{app_id}'."
@@ -1087,10 +1077,7 @@ def run_relaunch_stability_check(dab_topic, test_name, tester, device_id):
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/exit", payload, logs, result)
         
-        line = f"[WAIT] Allowing {APP_STATE_CHECK_WAIT}s for the app to terminate."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(APP_STATE_CHECK_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "STOPPED", APP_STATE_CHECK_WAIT, logs)
 
         # Step 3: Relaunch the application and check the response
         line = f"[STEP] Relaunching '{app_id}'."
@@ -1099,10 +1086,7 @@ def run_relaunch_stability_check(dab_topic, test_name, tester, device_id):
         rc, response = execute_cmd_and_log(tester, device_id, "applications/launch", payload, logs, result)
         relaunch_status = dab_status_from(response, rc)
         
-        line = f"[WAIT] Allowing {APP_RELAUNCH_WAIT}s for the app to relaunch."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(APP_RELAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_RELAUNCH_WAIT, logs)
 
         if relaunch_status == 200:
             result.test_result = "PASS"
@@ -1781,15 +1765,19 @@ def run_screensaver_inactive_after_reboot_check(dab_topic, test_name, tester, de
         line = "[STEP] Rebooting the device now."
         LOGGER.result(line)
         logs.append(line)
+        sent = clock.monotonic()
         execute_cmd_and_log(tester, device_id, "system/restart", "{}", logs)
 
-        # Step 4: Manually confirm reboot completion
-        line = "[STEP] Waiting for manual confirmation that the device has restarted."
+        # Step 4: Wait for the device to go down and come back healthy
+        line = "[STEP] Waiting for the device to finish rebooting."
         LOGGER.result(line)
         logs.append(line)
-        while not yes_or_no(result, logs, "Has the device finished rebooting and is now idle?"):
-            logs.append("Waiting for 'Y' confirmation.")
-            time.sleep(5) # Add a small delay between prompts
+        if not await_reboot(tester, device_id, result, logs, since=sent):
+            result.test_result = "FAILED"
+            line = "[RESULT] FAILED — The device did not come back healthy after the reboot."
+            LOGGER.result(line)
+            logs.append(line)
+            return result
 
         # Step 5: Wait for the idle timeout to pass
         line = f"[STEP] Do not interact with the device. Waiting {SCREENSAVER_TIMEOUT_WAIT} seconds."
@@ -1969,15 +1957,19 @@ def run_screensavertimeout_reboot_check(dab_topic, test_name, tester, device_id)
         line = "[STEP] Rebooting the device now."
         LOGGER.result(line)
         logs.append(line)
+        sent = clock.monotonic()
         execute_cmd_and_log(tester, device_id, "system/restart", "{}", logs, result)
 
-        # Step 3: Manually confirm reboot completion
-        line = "[STEP] Waiting for manual confirmation that the device has restarted."
+        # Step 3: Wait for the device to go down and come back healthy
+        line = "[STEP] Waiting for the device to finish rebooting."
         LOGGER.result(line)
         logs.append(line)
-        while not yes_or_no(result, logs, "Has the device finished rebooting and is now idle?"):
-            logs.append("Waiting for 'Y' confirmation.")
-            time.sleep(5)
+        if not await_reboot(tester, device_id, result, logs, since=sent):
+            result.test_result = "FAILED"
+            line = "[RESULT] FAILED — The device did not come back healthy after the reboot."
+            LOGGER.result(line)
+            logs.append(line)
+            return result
 
         # Step 4: Verify the setting persisted across the reboot
         line = "[STEP] Verifying the screensaver timeout setting persisted after reboot."
@@ -2317,15 +2309,19 @@ def run_screensavermintimeout_reboot_check(dab_topic, test_name, tester, device_
         line = "[STEP] Rebooting the device now."
         LOGGER.result(line)
         logs.append(line)
+        sent = clock.monotonic()
         execute_cmd_and_log(tester, device_id, "system/restart", "{}", logs)
 
-        # Step 3: Manually confirm reboot completion
-        line = "[STEP] Waiting for manual confirmation that the device has restarted."
+        # Step 3: Wait for the device to go down and come back healthy
+        line = "[STEP] Waiting for the device to finish rebooting."
         LOGGER.result(line)
         logs.append(line)
-        while not yes_or_no(result, logs, "Has the device finished rebooting and is now idle?"):
-            logs.append("Waiting for 'Y' confirmation.")
-            time.sleep(5)
+        if not await_reboot(tester, device_id, result, logs, since=sent):
+            result.test_result = "FAILED"
+            line = "[RESULT] FAILED — The device did not come back healthy after the reboot."
+            LOGGER.result(line)
+            logs.append(line)
+            return result
 
         # Step 4: Get the minimum timeout again after reboot
         line = "[STEP] Getting the minimum screensaver timeout after reboot."
@@ -2679,24 +2675,13 @@ def run_device_restart_and_telemetry_check(dab_topic, test_name, tester, device_
         # 1) Restart & wait for health
         line = "[STEP] Restarting the device; this may take a few minutes."
         LOGGER.result(line); logs.append(line)
+        sent = clock.monotonic()
         execute_cmd_and_log(tester, device_id, "system/restart", "{}", logs, result)
 
-        line = f"[INFO] Polling health-check/get every {HEALTH_CHECK_INTERVAL}s for up to {DEVICE_REBOOT_WAIT}s..."
-        LOGGER.info(line); logs.append(line)
-        t0 = time.time()
-        while time.time() - t0 < DEVICE_REBOOT_WAIT:
-            try:
-                rc, resp = execute_cmd_and_log(tester, device_id, "health-check/get", "{}", logs, result)
-                if dab_status_from(resp, rc) == 200:
-                    device_ready = True
-                    break
-            except Exception:
-                pass
-            time.sleep(HEALTH_CHECK_INTERVAL)
-
+        device_ready = await_reboot(tester, device_id, result, logs, since=sent)
         if not device_ready:
             result.test_result = "FAILED"
-            line = f"[RESULT] FAILED — Device did not become healthy within {DEVICE_REBOOT_WAIT}s."
+            line = "[RESULT] FAILED — Device did not come back healthy after the restart."
             LOGGER.result(line); logs.append(line)
             return result
 
@@ -2724,8 +2709,8 @@ def run_device_restart_and_telemetry_check(dab_topic, test_name, tester, device_
         LOGGER.result(line); logs.append(line)
         checker = DabChecker(tester)
 
-        deadline = time.time() + TELEMETRY_METRICS_WAIT
-        while time.time() < deadline:
+        deadline = clock.time() + TELEMETRY_METRICS_WAIT
+        while clock.time() < deadline:
             ok, chk = (False, "")
             try:
                 # IMPORTANT: passive peek (must NOT start telemetry again)
@@ -2749,7 +2734,7 @@ def run_device_restart_and_telemetry_check(dab_topic, test_name, tester, device_
                 metrics_received = True
                 break
 
-            time.sleep(1.0)
+            clock.sleep(1.0, "telemetry poll")
 
         if not metrics_received:
             result.test_result = "FAILED"
@@ -2904,11 +2889,8 @@ def run_launch_video_and_health_check(dab_topic, test_name, tester, device_id):
             return result
 
         # Step 2: Wait for video playback to stabilize
-        wait_time = APP_LAUNCH_WAIT + CONTENT_LOAD_WAIT
-        line = f"[WAIT] Allowing {wait_time}s for video playback to start."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(wait_time)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
+        settle(CONTENT_LOAD_WAIT, "video playback starts", logs)
 
         # Step 3: Perform a health check
         line = "[STEP] Performing a health check while video is playing."
@@ -3127,8 +3109,7 @@ def run_launch_when_uninstalled_check(dab_topic, test_name, tester, device_id):
             result.response = f"['install={install_status}']"
             return result
 
-        logs.append(f"[WAIT] {INSTALL_WAIT}s after install")
-        time.sleep(INSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, INSTALL_WAIT, logs)
 
         # ---------- 2) Uninstall ----------
         payload_app = json.dumps({"appId": app_id})
@@ -3143,8 +3124,7 @@ def run_launch_when_uninstalled_check(dab_topic, test_name, tester, device_id):
             result.response = f"['install={install_status}, uninstall={uninstall_status}']"
             return result
 
-        logs.append(f"[WAIT] {UNINSTALL_WAIT}s after uninstall")
-        time.sleep(UNINSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, UNINSTALL_WAIT, logs, present=False)
 
         # ---------- 3) Attempt launch (should fail) ----------
         LOGGER.result(f"[STEP] Launch '{app_id}' (expected to fail)"); logs.append(
@@ -3152,7 +3132,8 @@ def run_launch_when_uninstalled_check(dab_topic, test_name, tester, device_id):
         rc_l, resp_l = _call("applications/launch", payload_app)
         launch_status = dab_status_from(resp_l, rc_l)
         logs.append(f"[INFO] launch status={launch_status}")
-        time.sleep(LAUNCH_WAIT)
+        if launch_status == 200:
+            wait_for_app_state(tester, device_id, app_id, "FOREGROUND", LAUNCH_WAIT, logs)
 
         if launch_status != 200:
             result.test_result = "PASS"
@@ -3199,6 +3180,7 @@ def run_launch_app_while_restarting_check(dab_topic, test_name, tester, device_i
     logs = []
     result = TestResult(test_id, device_id, "applications/launch", json.dumps({"appId": app_id}), "UNKNOWN", "", logs)
     launch_status = "N/A"
+    restart_sent = None
 
     try:
         # Header and description
@@ -3219,10 +3201,11 @@ def run_launch_app_while_restarting_check(dab_topic, test_name, tester, device_i
         line = "[STEP] Sending system/restart command (fire-and-forget)."
         LOGGER.result(line)
         logs.append(line)
+        restart_sent = clock.monotonic()
         fire_and_forget_restart(tester.dab_client, device_id)
-        
-        # Give a moment for the shutdown process to begin
-        time.sleep(3)
+
+        # Launch once the device has started going away, not after a guessed delay
+        wait_for_down(tester, device_id, logs=logs, label="restart")
 
         # Step 2: Attempt to launch the app while the device should be offline
         line = f"[STEP] Attempting to launch '{app_id}' during restart."
@@ -3265,9 +3248,9 @@ def run_launch_app_while_restarting_check(dab_topic, test_name, tester, device_i
                 f"test_id={test_id}, device={device_id}")
         LOGGER.result(line)
         logs.append(line)
-        # Allow time for device to come back online for next test
-        LOGGER.info("Waiting for device to potentially recover from restart...")
-        time.sleep(HEALTH_CHECK_INTERVAL)
+        # Let the device come back before the next test
+        if restart_sent is not None:
+            await_reboot(tester, device_id, result, logs, since=restart_sent, label="restart", kind="reboot")
 
     return result
 
@@ -3299,6 +3282,7 @@ def run_network_reset_check(dab_topic, test_name, tester, device_id):
         line = "[STEP] Sending 'system/network-reset' command."
         LOGGER.result(line)
         logs.append(line)
+        sent = clock.monotonic()
         rc, response = execute_cmd_and_log(tester, device_id, "system/network-reset", "{}", logs, result)
         if dab_status_from(response, rc) != 200:
             result.test_result = "FAILED"
@@ -3307,8 +3291,8 @@ def run_network_reset_check(dab_topic, test_name, tester, device_id):
             logs.append(line)
             return result
 
-        # Allow time for network to re-establish
-        time.sleep(15)
+        # The device may drop off the network for a while; follow it until it answers healthy again
+        await_reboot(tester, device_id, result, logs, since=sent, label="network-reset", down_window=NETWORK_RESET_DOWN_WINDOW)
 
         # Step 2: Verify DAB is still responsive
         line = "[STEP] Verifying DAB responsiveness with 'system/info'."
@@ -3375,6 +3359,7 @@ def run_factory_reset_and_recovery_check(dab_topic, test_name, tester, device_id
         line = "[STEP] Sending 'system/factory-reset' command. This will take several minutes."
         LOGGER.result(line)
         logs.append(line)
+        sent = clock.monotonic()
         rc, response = execute_cmd_and_log(tester, device_id, "system/factory-reset", "{}", logs, result)
         if dab_status_from(response, rc) != 200:
             result.test_result = "FAILED"
@@ -3383,28 +3368,15 @@ def run_factory_reset_and_recovery_check(dab_topic, test_name, tester, device_id
             logs.append(line)
             return result
 
-        # Step 2: Poll for health check until the device recovers
-        line = f"[WAIT] Polling health-check every {HEALTH_CHECK_INTERVAL}s for up to {DEVICE_REBOOT_WAIT}s..."
-        LOGGER.info(line)
-        logs.append(line)
-        
-        start_time = time.time()
-        while time.time() - start_time < DEVICE_REBOOT_WAIT:
-            try:
-                rc_health, resp_health = execute_cmd_and_log(tester, device_id, "health-check/get", "{}", logs, result)
-                if dab_status_from(resp_health, rc_health) == 200:
-                    device_recovered = True
-                    break
-            except Exception:
-                pass # Suppress errors while device is offline
-            time.sleep(HEALTH_CHECK_INTERVAL)
+        # Step 2: Follow the device down and back up until it is healthy
+        device_recovered = await_reboot(tester, device_id, result, logs, since=sent, label="factory-reset")
 
         if device_recovered:
             result.test_result = "PASS"
             line = "[RESULT] PASS — Device recovered and became healthy after factory reset."
         else:
             result.test_result = "FAILED"
-            line = f"[RESULT] FAILED — Device did not recover within the {DEVICE_REBOOT_WAIT}s timeout."
+            line = "[RESULT] FAILED — Device did not come back healthy after the factory reset."
 
         LOGGER.result(line)
         logs.append(line)
@@ -3546,29 +3518,15 @@ def run_personalized_ads_persistence_check(dab_topic, test_name, tester, device_
         line = "[STEP] Rebooting the device."
         LOGGER.result(line)
         logs.append(line)
+        sent = clock.monotonic()
         execute_cmd_and_log(tester, device_id, "system/restart", "{}", logs, result)
 
-        # Step 3: Wait for the device to become healthy by polling
-        line = f"[WAIT] Polling for device health for up to {DEVICE_REBOOT_WAIT}s..."
-        LOGGER.info(line)
-        logs.append(line)
-        start_time = time.time()
-        while time.time() - start_time < DEVICE_REBOOT_WAIT:
-            try:
-                rc_health, resp_health = execute_cmd_and_log(tester, device_id, "health-check/get", "{}", logs, result)
-                if dab_status_from(resp_health, rc_health) == 200 and json.loads(resp_health).get("healthy"):
-                    device_recovered = True
-                    LOGGER.ok("[INFO] Device is healthy after reboot.")
-                    logs.append("[INFO] Device is healthy after reboot.")
-                    break
-            except Exception:
-                # Ignore errors while device is rebooting
-                pass
-            time.sleep(HEALTH_CHECK_INTERVAL)
+        # Step 3: Follow the device down and back up until it is healthy
+        device_recovered = await_reboot(tester, device_id, result, logs, since=sent)
 
         if not device_recovered:
             result.test_result = "FAILED"
-            line = f"[RESULT] FAILED — Device did not become healthy within {DEVICE_REBOOT_WAIT}s after reboot."
+            line = "[RESULT] FAILED — Device did not come back healthy after the reboot."
             LOGGER.error(line)
             logs.append(line)
             return result
@@ -3743,8 +3701,7 @@ def run_uninstall_foreground_app_check(dab_topic, test_name, tester, device_id):
         LOGGER.result(line)
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", json.dumps({"appId": app_id}), logs, result)
-        LOGGER.info(f"Waiting {APP_LAUNCH_WAIT} seconds for application to launch and stabilize.")
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 2: Get app state to confirm it's in the foreground
         line = f"[STEP] Getting state of application '{app_id}'."
@@ -3766,8 +3723,7 @@ def run_uninstall_foreground_app_check(dab_topic, test_name, tester, device_id):
         logs.append(line)
         rc, response = execute_cmd_and_log(tester, device_id, "applications/uninstall", json.dumps({"appId": app_id}), logs, result)
         clear_status = dab_status_from(response, rc)
-        LOGGER.info(f"Waiting {APP_UNINSTALL_WAIT} seconds for application to uninstall.")
-        time.sleep(APP_UNINSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, APP_UNINSTALL_WAIT, logs, present=False)
 
         if clear_status == 200:
             result.test_result = "PASS"
@@ -3904,8 +3860,7 @@ def run_clear_data_foreground_app_check(dab_topic, test_name, tester, device_id)
         LOGGER.result(line)
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", json.dumps({"appId": appId}), logs, result)
-        print(f"Waiting {APP_LAUNCH_WAIT} seconds for application to launch and stabilize.")
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, appId, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 2: Clear the app's data
         line = f"[STEP] Clearing data for '{appId}'."
@@ -3913,7 +3868,7 @@ def run_clear_data_foreground_app_check(dab_topic, test_name, tester, device_id)
         logs.append(line)
         rc, response = execute_cmd_and_log(tester, device_id, "applications/clear-data", json.dumps({"appId": appId}), logs, result)
         clear_status = dab_status_from(response, rc)
-        time.sleep(APP_CLEAR_DATA_WAIT)
+        wait_for_app_state(tester, device_id, appId, "FOREGROUND", APP_CLEAR_DATA_WAIT, logs, exclude=True)
 
         if clear_status == 200:
             result.test_result = "PASS"
@@ -3992,7 +3947,7 @@ def run_clear_data_system_app_check(dab_topic, test_name, tester, device_id):
         logs.append(line)
         rc, response = execute_cmd_and_log(tester, device_id, "applications/clear-data", json.dumps({"appId": app_id}), logs, result)
         clear_status = dab_status_from(response, rc)
-        time.sleep(APP_CLEAR_DATA_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_CLEAR_DATA_WAIT, logs, exclude=True)
 
         if clear_status == 200:
             result.test_result = "PASS"
@@ -4040,7 +3995,7 @@ def run_clear_data_user_installed_app_foreground(dab_topic, test_name, tester, d
         line = f"[STEP] applications/launch {payload_app}"; LOGGER.result(line); logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", payload_app, logs, result)
         line = f"[WAIT] {APP_LAUNCH_WAIT}s"; LOGGER.info(line); logs.append(line)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # 2) Clear data (use DAB status, not transport rc)
         line = f"[STEP] applications/clear-data {payload_app}"; LOGGER.result(line); logs.append(line)
@@ -4052,7 +4007,7 @@ def run_clear_data_user_installed_app_foreground(dab_topic, test_name, tester, d
         line = f"[STEP] applications/launch {payload_app}"; LOGGER.result(line); logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", payload_app, logs, result)
         line = f"[WAIT] {APP_LAUNCH_WAIT}s"; LOGGER.info(line); logs.append(line)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         if dab_status == 200:
             result.test_result = "PASS"
@@ -4144,9 +4099,7 @@ def run_install_from_app_store_check(dab_topic, test_name, tester, device_id):
             return result
 
         # short wait to allow finalization
-        msg = f"[WAIT] {INSTALL_WAIT}s after install for finalization"
-        LOGGER.info(msg); logs.append(msg)
-        time.sleep(INSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, INSTALL_WAIT, logs)
 
         # 2) Launch the newly installed app
         msg = f"[STEP] applications/launch {payload_app}"
@@ -4235,9 +4188,7 @@ def run_install_youtube_kids_from_store(dab_topic, test_name, tester, device_id)
             return result
 
         # short wait to finalize install
-        msg = f"[WAIT] {INSTALL_WAIT}s after install for finalization"
-        LOGGER.info(msg); logs.append(msg)
-        time.sleep(INSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, INSTALL_WAIT, logs)
 
         # (Optional) verify appears in installed apps list, if supported
         try:
@@ -4344,9 +4295,7 @@ def run_uninstall_after_standby_check(dab_topic, test_name, tester, device_id):
             )
             msg = f"[INFO] input/key-press transport_rc={rc_wake}, response={resp_wake}"
             LOGGER.info(msg); logs.append(msg)
-            msg = f"[WAIT] {WAKE_WAIT}s after wake attempt"
-            LOGGER.info(msg); logs.append(msg)
-            time.sleep(WAKE_WAIT)
+            settle(WAKE_WAIT, "device wakes after KEY_POWER", logs)
         except Exception:
             msg = "[INFO] Skipping wake attempt (input/key-press unavailable or failed)"
             LOGGER.info(msg); logs.append(msg)
@@ -4371,9 +4320,7 @@ def run_uninstall_after_standby_check(dab_topic, test_name, tester, device_id):
             return result
 
         # short wait to finalize uninstall
-        msg = f"[WAIT] {UNINSTALL_WAIT}s after uninstall for finalization"
-        LOGGER.info(msg); logs.append(msg)
-        time.sleep(UNINSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, UNINSTALL_WAIT, logs, present=False)
 
         # 2) Best-effort verification via applications/list (optional)
         removed_flag = None
@@ -4478,18 +4425,18 @@ def run_install_bg_uninstall_sample_app(dab_topic, test_name, tester, device_id)
             LOGGER.result(f"[RESULT] FAILED — install returned {st_i} (expected 200)")
             LOGGER.result(f"[SUMMARY] outcome=FAILED, install_status={st_i}, test_id={test_id}, device={device_id}, appId={app_id}")
             return result
-        time.sleep(INSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, INSTALL_WAIT, logs)
 
         # 2) Launch
         LOGGER.result(f"[STEP] applications/launch {payload_app_json}"); logs.append(f"[STEP] applications/launch {payload_app_json}")
         rc_l, resp_l = execute_cmd_and_log(tester, device_id, "applications/launch", payload_app_json, logs, result)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # 3) Background with HOME (no fallback)
         payload_home = json.dumps({"keyCode": "KEY_HOME"})
         LOGGER.result(f'[STEP] input/key-press {payload_home}  # background app'); logs.append(f'[STEP] input/key-press {payload_home}')
         rc_home, resp_home = execute_cmd_and_log(tester, device_id, "input/key-press", payload_home, logs, result)
-        time.sleep(BG_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", BG_WAIT, logs, exclude=True)
 
         # 4) Uninstall
         LOGGER.result(f"[STEP] applications/uninstall {payload_app_json}"); logs.append(f"[STEP] applications/uninstall {payload_app_json}")
@@ -4556,16 +4503,14 @@ def run_uninstall_sample_app_with_local_data_check(dab_topic, test_name, tester,
             line = f"[RESULT] FAILED — Precondition failed: Could not install '{app_id}'. Status: {install_status}"
             LOGGER.result(line); logs.append(line)
             return result
-        time.sleep(APP_INSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, APP_INSTALL_WAIT, logs)
 
         # Optional: Launch the app to ensure it recently touched local data (best-effort)
         try:
             line = f"[STEP] (optional) applications/launch {payload_app}"
             LOGGER.result(line); logs.append(line)
             execute_cmd_and_log(tester, device_id, "applications/launch", payload_app, logs, result)
-            line = f"[WAIT] 3s after optional launch"
-            LOGGER.info(line); logs.append(line)
-            time.sleep(3)
+            wait_for_app_state(tester, device_id, app_id, "FOREGROUND", 3, logs)
         except Exception:
             line = "[INFO] Skipping optional launch (applications/launch unsupported or failed)"
             LOGGER.info(line); logs.append(line)
@@ -4650,18 +4595,14 @@ def run_uninstall_preinstalled_with_local_data_simple(dab_topic, test_name, test
             LOGGER.result(msg); logs.append(msg)
             return result
 
-        msg = f"[WAIT] {APP_LAUNCH_WAIT}s for installation to finalize."
-        LOGGER.info(msg); logs.append(msg)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, APP_INSTALL_WAIT, logs)
 
         # Step 2: Launch to ensure app recently touched local data
         msg = f"[STEP] Launching app to generate local data: {payload_app}"
         LOGGER.result(msg); logs.append(msg)
         execute_cmd_and_log(tester, device_id, "applications/launch", payload_app, logs, result)
 
-        msg = f"[WAIT] {APP_EXIT_WAIT}s after launch."
-        LOGGER.info(msg); logs.append(msg)
-        time.sleep(APP_EXIT_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 3: Uninstall the app
         msg = f"[STEP] Uninstalling the app: {payload_app}"
@@ -4750,7 +4691,7 @@ def run_install_from_url_during_idle_then_launch(dab_topic, test_name, tester, d
                 '[STEP] input/key-press {"keyCode": "KEY_POWER"}')
             rc_sleep, _ = _call("input/key-press", json.dumps({"keyCode": "KEY_POWER"}))
             logs.append(f"[INFO] input/key-press KEY_POWER transport_rc={rc_sleep}")
-            time.sleep(IDLE_WAIT)
+            settle(IDLE_WAIT, "device enters idle after KEY_POWER", logs)
         except Exception:
             logs.append("[INFO] Skipping sleep attempt (input/key-press unavailable or failed)")
 
@@ -4768,7 +4709,7 @@ def run_install_from_url_during_idle_then_launch(dab_topic, test_name, tester, d
             result.response = f"['install={install_status}']"
             return result
 
-        logs.append(f"[WAIT] {INSTALL_WAIT}s after install"); time.sleep(INSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, INSTALL_WAIT, logs)
 
         # 2) Best-effort: wake device
         try:
@@ -4776,7 +4717,7 @@ def run_install_from_url_during_idle_then_launch(dab_topic, test_name, tester, d
                 '[STEP] input/key-press {"keyCode": "KEY_POWER"}')
             rc_wake, _ = _call("input/key-press", json.dumps({"keyCode": "KEY_POWER"}))
             logs.append(f"[INFO] input/key-press KEY_POWER transport_rc={rc_wake}")
-            time.sleep(WAKE_WAIT)
+            settle(WAKE_WAIT, "device wakes after KEY_POWER", logs)
         except Exception:
             logs.append("[INFO] Skipping wake attempt (input/key-press unavailable or failed)")
 
@@ -5056,7 +4997,6 @@ def run_install_after_reboot_then_launch(dab_topic, test_name, tester, device_id
     logs = []
     result = TestResult(test_id, device_id, "applications/install", "{}", "UNKNOWN", "", logs)
 
-    RESTART_WAIT = 60
     STABLE_WAIT  = 15
     POST_INSTALL_WAIT = 10
 
@@ -5089,6 +5029,7 @@ def run_install_after_reboot_then_launch(dab_topic, test_name, tester, device_id
 
         # Restart (fire-and-forget best-effort)
         LOGGER.result("[STEP] system/restart (fire-and-forget)"); logs.append("[STEP] system/restart (fire-and-forget)")
+        sent = clock.monotonic()
         try:
             fire_and_forget_restart(tester.dab_client, device_id)  # preferred helper if available
         except Exception:
@@ -5097,9 +5038,8 @@ def run_install_after_reboot_then_launch(dab_topic, test_name, tester, device_id
             except Exception:
                 LOGGER.warn("[WARN] Restart command fallback failed; proceeding after wait."); logs.append("[WARN] Restart fallback failed; proceeding.")
 
-        LOGGER.info(f"[WAIT] {RESTART_WAIT}s for reboot + {STABLE_WAIT}s stabilize"); logs.append(
-            f"[WAIT] {RESTART_WAIT}s + {STABLE_WAIT}s")
-        time.sleep(RESTART_WAIT + STABLE_WAIT)
+        await_reboot(tester, device_id, result, logs, since=sent)
+        settle(STABLE_WAIT, "device stabilises after reboot", logs)
 
         # Capability gate
         if not require_capabilities(tester, device_id, "ops: applications/install, applications/launch", result, logs):
@@ -5126,8 +5066,7 @@ def run_install_after_reboot_then_launch(dab_topic, test_name, tester, device_id
                           f"test_id={test_id}, device={device_id}, appId={app_id}")
             return result
 
-        LOGGER.info(f"[WAIT] {POST_INSTALL_WAIT}s post-install"); logs.append(f"[WAIT] {POST_INSTALL_WAIT}s post-install")
-        time.sleep(POST_INSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, POST_INSTALL_WAIT, logs)
 
         # Launch to verify
         LOGGER.result(f"[STEP] applications/launch {payload_launch}"); logs.append(
@@ -5318,8 +5257,7 @@ def run_install_from_url_then_launch_simple(dab_topic, test_name, tester, device
             result.response = f"['install={install_status}']"
             return result
 
-        logs.append(f"[WAIT] {INSTALL_WAIT}s after install")
-        time.sleep(INSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, INSTALL_WAIT, logs)
 
         # 2) Launch to confirm
         payload_launch = json.dumps({"appId": app_id})
@@ -5386,9 +5324,7 @@ def run_clear_data_accessibility_settings_reset(dab_topic, test_name, tester, de
         msg = f"[STEP] applications/launch {payload_app}"
         LOGGER.result(msg); logs.append(msg)
         execute_cmd_and_log(tester, device_id, "applications/launch", payload_app, logs, result)
-        msg = f"[WAIT] {APP_LAUNCH_WAIT}s after launch"
-        LOGGER.info(msg); logs.append(msg)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # 2) Clear data
         msg = f"[STEP] applications/clear-data {payload_app}"
@@ -5404,9 +5340,7 @@ def run_clear_data_accessibility_settings_reset(dab_topic, test_name, tester, de
         msg = f"[STEP] applications/launch {payload_app}"
         LOGGER.result(msg); logs.append(msg)
         execute_cmd_and_log(tester, device_id, "applications/launch", payload_app, logs, result)
-        msg = f"[WAIT] {APP_LAUNCH_WAIT}s after relaunch"
-        LOGGER.info(msg); logs.append(msg)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Result
         if clear_status == 200:
@@ -5467,9 +5401,7 @@ def run_clear_data_session_reset(dab_topic, test_name, tester, device_id):
         msg = f"[STEP] applications/launch {payload_app}"
         LOGGER.result(msg); logs.append(msg)
         execute_cmd_and_log(tester, device_id, "applications/launch", payload_app, logs, result)
-        msg = f"[WAIT] {APP_LAUNCH_WAIT}s after launch"
-        LOGGER.info(msg); logs.append(msg)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # 2) Clear data
         msg = f"[STEP] applications/clear-data {payload_app}"
@@ -5485,9 +5417,7 @@ def run_clear_data_session_reset(dab_topic, test_name, tester, device_id):
         msg = f"[STEP] applications/launch {payload_app}"
         LOGGER.result(msg); logs.append(msg)
         execute_cmd_and_log(tester, device_id, "applications/launch", payload_app, logs, result)
-        msg = f"[WAIT] {APP_LAUNCH_WAIT}s after relaunch"
-        LOGGER.info(msg); logs.append(msg)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Result
         if clear_status == 200:
@@ -5597,10 +5527,7 @@ def run_voice_log_collection_check(dab_topic, test_name, tester, device_id):
                 logs.append(line)
                 return result
 
-            line = f"Waiting for {ASSISTANT_INIT}s to initial voice system {voiceSystem}"
-            LOGGER.result(line)
-            logs.append(line)
-            time.sleep(ASSISTANT_INIT)
+            settle(ASSISTANT_INIT, f"voice system {voiceSystem} initialises", logs)
 
         # Step 2: Start log collection
         line = "[STEP] Starting system log collection."
@@ -5623,7 +5550,7 @@ def run_voice_log_collection_check(dab_topic, test_name, tester, device_id):
         execute_cmd_and_log(tester, device_id, "voice/send-text", payload_voice, logs, result)
 
         # Allow time for the command to be processed and logged
-        time.sleep(ASSISTANT_WAIT)
+        settle(ASSISTANT_WAIT, "voice command is processed and logged", logs)
 
         # Step 4: Waiting for 10 seconds to collect logs.
         line = f"[STEP] Waiting for {LOGS_COLLECTION_WAIT} seconds to collect logs."
@@ -5962,20 +5889,14 @@ def run_app_switch_log_check(dab_topic, test_name, tester, device_id):
         LOGGER.result(line)
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", json.dumps({"appId": app1_id}), logs, result)
-        line = f"[WAIT] Waiting {APP_LAUNCH_WAIT}s for '{app1_id}' to open and perform activity."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app1_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 3: Launch the second app to trigger a switch
         line = f"[STEP] Switching to second app: '{app2_id}'."
         LOGGER.result(line)
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", json.dumps({"appId": app2_id}), logs, result)
-        line = f"[WAIT] Waiting {APP_LAUNCH_WAIT}s for '{app2_id}' to open and perform activity."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app2_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 4: Waiting for 10 seconds to collect logs.
         line = f"[STEP] Waiting for {LOGS_COLLECTION_WAIT} seconds to collect logs."
@@ -6102,7 +6023,7 @@ def run_clear_data_preinstalled_app_check(dab_topic, test_name, tester, device_i
         LOGGER.result(line)
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", json.dumps({"appId": app_id}), logs, result)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 3: Clear the app's data
         line = f"[STEP] Clearing data for '{app_id}'."
@@ -6118,14 +6039,14 @@ def run_clear_data_preinstalled_app_check(dab_topic, test_name, tester, device_i
             logs.append(line)
             return result
         
-        time.sleep(APP_CLEAR_DATA_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_CLEAR_DATA_WAIT, logs, exclude=True)
 
         # Step 4: Relaunch the app for verification
         line = f"[STEP] Relaunching '{app_id}' to verify it has been reset."
         LOGGER.result(line)
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", json.dumps({"appId": app_id}), logs, result)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
         
         # Step 5: Manual verification
         user_validated_reset = yes_or_no(result, logs, "Did the application start up in its initial, first-run state (e.g., asking for login)?")
@@ -6214,17 +6135,14 @@ def run_install_region_specific_app_check(dab_topic, test_name, tester, device_i
             logs.append(line)
             return result
         
-        line = f"[WAIT] Waiting {APP_UNINSTALL_WAIT}s for installation to finalize." # Re-using a reasonable wait time
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(APP_UNINSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, app_id, APP_UNINSTALL_WAIT, logs)
 
         # Step 3: Launch the app
         line = f"[STEP] Launching '{app_id}' to verify localization."
         LOGGER.result(line)
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", payload, logs, result)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 4: Manual verification
         user_validated_localization = yes_or_no(result, logs, "Does the app show the correct language, content, or features for the region you set?")
@@ -6324,17 +6242,14 @@ def run_update_installed_app_check(dab_topic, test_name, tester, device_id):
             logs.append(line)
             return result
         
-        line = f"[WAIT] Waiting {APP_UNINSTALL_WAIT * 2}s for the update to download and install."
-        LOGGER.info(line)
-        logs.append(line)
-        time.sleep(APP_UNINSTALL_WAIT * 2)
+        settle(APP_UNINSTALL_WAIT * 2, "app update downloads and installs", logs)
 
         # Step 3: Launch the app to check the new version
         line = f"[STEP] Launching '{app_id}' to verify the update."
         LOGGER.result(line)
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", payload, logs, result)
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, app_id, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 4: Manual verification
         user_validated_update = yes_or_no(result, logs, "Has the app been successfully updated to the newer version?")
@@ -6626,16 +6541,14 @@ def run_logs_collection_app_pause_check(dab_topic, test_name, tester, device_id)
         LOGGER.result(line)
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/launch", json.dumps({"appId": appId}), logs, result)
-        print(f"Waiting {APP_LAUNCH_WAIT} seconds for application to launch.")
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, appId, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 3: Pause the application and confirm the state.
         line = f"[STEP] Pause application '{appId}' and confirm its state is BACKGROUND."
         LOGGER.result(line)
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/exit", json.dumps({"appId": appId, "background": True}), logs, result)
-        print(f"Waiting {APP_STATE_CHECK_WAIT} seconds after exit.")
-        time.sleep(APP_STATE_CHECK_WAIT)
+        wait_for_app_state(tester, device_id, appId, "BACKGROUND", APP_STATE_CHECK_WAIT, logs)
         _, response = execute_cmd_and_log(tester, device_id, "applications/get-state", json.dumps({"appId": appId}), logs, result)
         state = json.loads(response).get("state", "").upper() if response else "UNKNOWN"
         if state != "BACKGROUND":
@@ -6752,16 +6665,14 @@ def run_logs_collection_app_force_stop_check(dab_topic, test_name, tester, devic
         LOGGER.result(line)
         logs.append(line)
         rc, response = execute_cmd_and_log(tester, device_id, "applications/launch", json.dumps({"appId": appId}), logs, result)
-        print(f"Waiting {APP_LAUNCH_WAIT} seconds for application to launch.")
-        time.sleep(APP_LAUNCH_WAIT)
+        wait_for_app_state(tester, device_id, appId, "FOREGROUND", APP_LAUNCH_WAIT, logs)
 
         # Step 3: Exit the application to background, and confirm the state.
         line = f"[STEP] Pause application '{appId}' and confirm its state is BACKGROUND."
         LOGGER.result(line)
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/exit", json.dumps({"appId": appId, "background": True}), logs, result)
-        print(f"Waiting {APP_STATE_CHECK_WAIT} seconds after exit.")
-        time.sleep(APP_STATE_CHECK_WAIT)
+        wait_for_app_state(tester, device_id, appId, "BACKGROUND", APP_STATE_CHECK_WAIT, logs)
         _, response = execute_cmd_and_log(tester, device_id, "applications/get-state", json.dumps({"appId": appId}), logs, result)
         state = json.loads(response).get("state", "").upper() if response else "UNKNOWN"
         if state != "BACKGROUND":
@@ -6775,8 +6686,7 @@ def run_logs_collection_app_force_stop_check(dab_topic, test_name, tester, devic
         LOGGER.result(line)
         logs.append(line)
         execute_cmd_and_log(tester, device_id, "applications/exit", json.dumps({"appId": appId}), logs, result)
-        print(f"Waiting {APP_STATE_CHECK_WAIT} seconds after exit.")
-        time.sleep(APP_STATE_CHECK_WAIT)
+        wait_for_app_state(tester, device_id, appId, "STOPPED", APP_STATE_CHECK_WAIT, logs)
         _, response = execute_cmd_and_log(tester, device_id, "applications/get-state", json.dumps({"appId": appId}), logs, result)
         state = json.loads(response).get("state", "").upper() if response else "UNKNOWN"
         if state != "STOPPED":
@@ -6891,7 +6801,7 @@ def run_logs_collection_app_uninstall_check(dab_topic, test_name, tester, device
             line = f"[RESULT] FAILED — Precondition failed: Could not install '{appId}'."
             LOGGER.error(line); logs.append(line)
             return result
-        time.sleep(APP_INSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, appId, APP_INSTALL_WAIT, logs)
 
 
         # Step 1: Start logs collection.
@@ -6913,8 +6823,7 @@ def run_logs_collection_app_uninstall_check(dab_topic, test_name, tester, device
         LOGGER.result(line)
         logs.append(line)
         rc, response = execute_cmd_and_log(tester, device_id, "applications/uninstall", json.dumps({"appId": appId}), logs, result)
-        print(f"Waiting {APP_UNINSTALL_WAIT} seconds for application uninstallation.")
-        time.sleep(APP_UNINSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, appId, APP_UNINSTALL_WAIT, logs, present=False)
 
         # Step 3: Waiting for logs collections.
         line = f"[STEP] Waiting for {LOGS_COLLECTION_WAIT} seconds to collect logs."
@@ -7052,9 +6961,7 @@ def run_logs_collection_app_install_and_launch_check(dab_topic, test_name, teste
             return result
 
         # short wait to allow finalization
-        msg = f"[WAIT] {INSTALL_WAIT}s after install for finalization"
-        LOGGER.info(msg); logs.append(msg)
-        time.sleep(INSTALL_WAIT)
+        wait_for_app_listed(tester, device_id, appId, INSTALL_WAIT, logs)
 
         # Step 3: Launch the newly installed app
         msg = f"[STEP] applications/launch {payload_app}"
@@ -7205,9 +7112,7 @@ def run_network_reset_wifi_default_restoration(dab_topic, test_name, tester, dev
         LOGGER.result(line); logs.append(line)
 
         # Wait for reset side-effects (Wi-Fi stack restart / MQTT drop)
-        line = f"[WAIT] Allowing {NETWORK_RESET_WAIT}s for network stack to reset."
-        LOGGER.info(line); logs.append(line)
-        time.sleep(NETWORK_RESET_WAIT)
+        settle(NETWORK_RESET_WAIT, "network stack resets", logs)
 
         # Manual validations
         LOGGER.result("[STEP] Validate on device UI that Wi-Fi settings are reset to defaults.")
@@ -7301,6 +7206,7 @@ def run_setup_skip_privacy_bypass(dab_topic, test_name, tester, device_id):
         do_reset = yes_or_no("Do you want to perform system/factory-reset now? This will erase the device. [y/N]: ")
         if do_reset:
             LOGGER.result(f"[STEP] Calling system/factory-reset with payload: {payload_empty}")
+            sent = clock.monotonic()
             code_fr, resp_fr = execute_cmd_and_log(tester, device_id, "system/factory-reset", payload_empty, logs, result)
             if code_fr == 501:
                 LOGGER.result("[RESULT] OPTIONAL_FAILED — system/factory-reset not implemented on this device. Proceeding manually to setup wizard.")
@@ -7311,15 +7217,11 @@ def run_setup_skip_privacy_bypass(dab_topic, test_name, tester, device_id):
                 return result
             else:
                 LOGGER.result(f"[RESULT] system/factory-reset returned 200 OK. Response: {resp_fr}")
-                line = f"[WAIT] Allowing {RESET_REBOOT_WAIT}s for reboot/reset to complete."
-                LOGGER.info(line); logs.append(line)
-                time.sleep(RESET_REBOOT_WAIT)
+                await_reboot(tester, device_id, result, logs, since=sent, label="factory-reset", timeout=RESET_REBOOT_WAIT)
 
         # Manually advance to Privacy Settings
         LOGGER.result("[STEP] Manually progress through setup until 'Privacy Settings' screen is displayed.")
-        line = f"[WAIT] Allowing {SETUP_RESUME_WAIT}s for UI to stabilize."
-        LOGGER.info(line); logs.append(line)
-        time.sleep(SETUP_RESUME_WAIT)
+        settle(SETUP_RESUME_WAIT, "setup UI stabilises", logs)
 
         at_privacy = yes_or_no("Is the device on the Privacy Settings screen now? [y/N]: ")
         if not at_privacy:
@@ -7345,9 +7247,7 @@ def run_setup_skip_privacy_bypass(dab_topic, test_name, tester, device_id):
             return result
 
         LOGGER.result(f"[RESULT] system/setup/skip returned 200 OK. Response: {resp_skip}")
-        line = f"[WAIT] Allowing {SKIP_TRANSITION_WAIT}s for device to exit setup and load Home."
-        LOGGER.info(line); logs.append(line)
-        time.sleep(SKIP_TRANSITION_WAIT)
+        settle(SKIP_TRANSITION_WAIT, "device exits setup and loads Home", logs)
 
         # Verify Home
         on_home = yes_or_no("Did the device exit setup wizard and land on the Home screen? [y/N]: ")
@@ -8985,6 +8885,7 @@ def run_factory_reset_and_verify_initial_state(dab_topic, test_name, tester, dev
         LOGGER.result(msg)
         logs.append(LOGGER.stamp(msg))
 
+        sent = clock.monotonic()
         status, resp = execute_cmd_and_log(tester, device_id, "system/factory-reset", "{}", logs, result)
         if status != 200:
             msg = f"[FAILED] Factory reset operation failed. Status: {status}"
@@ -9005,7 +8906,7 @@ def run_factory_reset_and_verify_initial_state(dab_topic, test_name, tester, dev
         LOGGER.result(msg)
         logs.append(LOGGER.stamp(msg))
 
-        wait_ok = wait_for_factory_reset_complete(tester, device_id, logs, timeout=180)
+        wait_ok = await_reboot(tester, device_id, result, logs, since=sent, label="factory-reset")
         if not wait_ok:
             msg = "[FAILED] Device did not complete factory reset within timeout."
             LOGGER.error(msg)
@@ -10592,6 +10493,7 @@ def run_identifier_for_advertising_persistence_across_restart_check(dab_topic, t
 
         # --- Step 4: Trigger system/restart via DAB ---
         LOGGER.result("[STEP] Triggering system/restart via DAB.")
+        sent = clock.monotonic()
         restart_resp = execute_cmd_and_log(tester, device_id, "system/restart", {}, logs, result)
         status_restart = restart_resp.get("status")
         if status_restart != 200:
@@ -10604,17 +10506,10 @@ def run_identifier_for_advertising_persistence_across_restart_check(dab_topic, t
             logs.append(summary_line)
             return result
 
-        LOGGER.result("[WAIT] Waiting 60 seconds for the device to restart and DAB to become available again.")
-        countdown(60, LOGGER)
-
-        # --- Step 5: Manual confirmation that device is back and ready ---
-        LOGGER.result("[STEP] Confirm that the device has fully restarted and is reachable via DAB.")
-        ready_prompt = (
-            "Has the device fully restarted, reached the home screen, and is DAB reachable again "
-            "(e.g., other simple DAB operations work)?"
-        )
-        if not yes_or_no(ready_prompt, default="y"):
-            summary = "Device/DAB not confirmed ready after restart; cannot safely verify identifierForAdvertising."
+        # --- Step 5: Wait until the device has restarted and DAB answers healthy again ---
+        LOGGER.result("[WAIT] Waiting for the device to restart and DAB to become available again.")
+        if not await_reboot(tester, device_id, result, logs, since=sent, label="restart", kind="reboot"):
+            summary = "Device/DAB not healthy again after restart; cannot safely verify identifierForAdvertising."
             LOGGER.result(f"[RESULT] OPTIONAL_FAILED – {summary}")
             result.test_result = "OPTIONAL_FAILED"
             logs.append(summary_line)
@@ -4,7 +4,6 @@ from result_json import TestResult
 from logger import LOGGER
 import json
 import config
-import time
 import sys
 
 SMALL_WAIT_TIME = 1
@@ -829,7 +828,7 @@ def run_brightness_rapid_change_responsiveness_check(dab_topic, test_name, teste
                 helpers.finish(result, logs, "FAILED", f"system/settings/set failed at {label} with {status}.")
                 return result
 
-            time.sleep(SMALL_WAIT_TIME)
+            helpers.settle(SMALL_WAIT_TIME, f"brightness {label} shows on screen", logs)
 
         helpers.log_line(logs, "STEP", "Confirm final value via system/settings/get.")
         rc, response = helpers.execute_cmd_and_log(tester, device_id, "system/settings/get", "{}", logs, result)
@@ -4,7 +4,6 @@ from result_json import TestResult
 from logger import LOGGER
 import json
 import config
-import time
 import sys
 
 def run_content_open_invalid_content_id_check(dab_topic, test_name, tester, device_id):
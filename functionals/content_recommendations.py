@@ -4,7 +4,6 @@ from result_json import TestResult
 from logger import LOGGER
 import json
 import config
-import time
 import sys
 
 def run_content_recommendations_update_after_watch_check(dab_topic, test_name, tester, device_id):
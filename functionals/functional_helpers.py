@@ -1,8 +1,8 @@
 from result_json import TestResult
 from dab_tester import to_test_id
+from dab_client import response_data
 import config
 import json
-import time
 import sys
 from readchar import readchar
 from util.enforcement_manager import EnforcementManager
@@ -13,6 +13,9 @@ from paho.mqtt.properties import Properties
 from paho.mqtt.packettypes import PacketTypes
 from dab_checker import DabChecker
 from util.enforcement_manager import ValidateCode
+from util.watchdog import read_operator
+from util import clock
+from util.wait import settle
 from logger import LOGGER
 
 
@@ -204,7 +207,7 @@ def execute_cmd_and_log(tester, device_id, topic, payload, logs=None, result=Non
 def dab_status_from(resp, rc):
     try:
         if isinstance(resp, str):    # JSON string
-            return json.loads(resp).get("status", rc)
+            return response_data(resp).get("status", rc)
         if isinstance(resp, dict):   # dict
             return resp.get("status", rc)
     except Exception:
@@ -234,7 +237,7 @@ def yes_or_no(result, logs, question=""):
         LOGGER.prompt(prompt)
         if logs is not None:
             logs.append(prompt)
-        ch = readchar().upper()
+        ch = read_operator(readchar).upper()
         echo = f"[{ch}]"
         LOGGER.result(echo)
         if logs is not None:
@@ -263,7 +266,7 @@ def select_input(result, logs, arr):
         LOGGER.prompt(prompt)
         if logs is not None: logs.append(prompt)
 
-        ch = readchar()
+        ch = read_operator(readchar)
         echo = f"[{ch}]"
         LOGGER.result(echo)
         if logs is not None: logs.append(echo)
@@ -286,7 +289,7 @@ def countdown(title, count):
             timer = f"{mins:02d}:{secs:02d}"
             sys.stdout.write("\r" + title + " --- " + timer)
             sys.stdout.flush()
-            time.sleep(1)
+            clock.sleep(1, "countdown")
             count -= 1
         sys.stdout.write("\r" + title + " --- Done!\n")
     finally:
@@ -312,7 +315,7 @@ def validate_response(tester, dab_topic, dab_payload, dab_response, result, logs
         return False, result
 
     try:
-        response = json.loads(dab_response)
+        response = response_data(dab_response)
     except Exception:
         line = f"[FAIL] Request {dab_topic} '{dab_payload}' returned invalid JSON."
         LOGGER.error(line)
@@ -4,7 +4,6 @@ from result_json import TestResult
 from logger import LOGGER
 import json
 import config
-import time
 import sys
 
 def run_system_setup_skip_mid_wizard_check(dab_topic, test_name, tester, device_id):
@@ -1,7 +1,11 @@
 # logger.py
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from datetime import datetime
-import os, sys
+import os, sys, threading
+
+from util import clock
+from util.watchdog import is_abandoned
 
 # ---------- ANSI ----------
 RESET = "\x1b[0m"
@@ -19,8 +23,12 @@ FG_WHITE   = "\x1b[37m"
 FG_GRAY    = "\x1b[90m"  # light gray
 FG_BWHITE  = "\x1b[97m"  # bright white
 
+# Lines of the test being held back by RunLogger.held() in this context (None = print at once)
+_held: ContextVar = ContextVar("held_log_lines", default=None)
+_print_lock = threading.Lock()
+
 def _now_ms() -> str:
-    return datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+    return clock.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
 
 def _supports_color() -> bool:
     if os.environ.get("NO_COLOR"):
@@ -74,10 +82,19 @@ class RunLogger:
         # skip empty/whitespace-only lines → prevents “[INFO]  ”
         if msg is None or str(msg).strip() == "":
             return
+        # a test the watchdog gave up on has had its section closed for it; it stays silent
+        if is_abandoned():
+            return
         if always or self.verbose:
             ts = self._style_ts(_now_ms())
             styled = self._style_msg(level, str(msg), always)
-            print(f"{ts} [{level}] {styled}")
+            line = f"{ts} [{level}] {styled}"
+            held = _held.get()
+            if held is not None:
+                held.append(line)
+                return
+            with _print_lock:
+                print(line)
 
     # levels
     def info(self, msg: str):   self._emit("INFO", msg, always=False)
@@ -89,6 +106,22 @@ class RunLogger:
     def result(self, msg: str): self._emit("RESULT", msg, always=True)
     def prompt(self, msg: str): self._emit("PROMPT", msg, always=True)
 
+    @contextmanager
+    def held(self):
+        """
+        Hold back every line logged in this context (the test's watchdog thread included) and print
+        them in one piece at the end, so tests running side by side do not interleave their sections.
+        """
+        lines = []
+        token = _held.set(lines)
+        try:
+            yield
+        finally:
+            _held.reset(token)
+            if lines:
+                with _print_lock:
+                    print("\n".join(lines))
+
     # plain stamped line for persisted logs (no ANSI)
     def stamp(self, line: str) -> str:
         return f"{_now_ms()} {line}"
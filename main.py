@@ -21,6 +21,11 @@ import netflix
 import functional
 from logger import LOGGER
 from util.config_loader import init_interactive_setup, make_app_id_list
+from util.result_journal import ResultJournal
+from util.time_budget import parse_duration, plan_time_budget
+from util.wait import use_profile
+from util.wait_profile import calibrate, load_for_device
+from util import clock
 import sys 
 
 ALL_SUITES = {
@@ -72,6 +77,59 @@ if __name__ == "__main__":
                         choices=["2.0", "2.1"],
                         default=None)
 
+    parser.add_argument("--preflight-ttl",
+                        help="skip the per-test discovery + health-check preflight while the device answered successfully within this many seconds (0 = before every test). Default: 30",
+                        type=float,
+                        default=None)
+
+    parser.add_argument("--resume",
+                        help="resume an interrupted run from its journal: tests already in it are not run again. Ex: --resume test_result/run_20250718_101500.journal.jsonl",
+                        type=str,
+                        default=None)
+
+    parser.add_argument("--schedule", action="store_true",
+                        help="reorder each non-functional suite to cut app launches, setting changes and power-mode flips; the planned order and estimated time saved are printed before the run")
+
+    parser.add_argument("--concurrency",
+                        help="run read-only and bad-request tests of non-functional suites with up to this many in flight; state-changing tests stay serial. Default: 1 (all serial)",
+                        type=int,
+                        default=1)
+
+    parser.add_argument("--test-budget",
+                        help="wall-time budget in seconds for one test; a test still running after it is marked SKIPPED and the run moves on (0 = no limit). Default: 900",
+                        type=float,
+                        default=None)
+
+    parser.add_argument("--suite-budget",
+                        help="wall-time budget in seconds for each suite; tests not finished within it are marked SKIPPED (0 = no limit). Default: no limit",
+                        type=float,
+                        default=None)
+
+    parser.add_argument("--reruns",
+                        help="retry failed or skipped tests of non-functional suites up to this many times at the end of the suite; known-flaky tests go first. Default: 0",
+                        type=int,
+                        default=0)
+
+    parser.add_argument("--quarantine",
+                        help="with --reruns, mark tests whose recorded flakiness ratio (passed only on rerun / runs) is at least this as quarantined. Ex: --quarantine 0.3",
+                        type=float,
+                        default=None)
+
+    parser.add_argument("--time-budget",
+                        help="fit the run into this much time: tests are picked by priority (recent failures, required, optional) using durations recorded in earlier results files, and run in suite order. Ex: --time-budget 45m, 1h30m",
+                        type=str,
+                        default=None)
+
+    parser.add_argument("--calibrate",
+                        help="time this device's app launch/exit, install/uninstall, settings apply and reboot over this many probe cycles, save a wait profile for its model + firmware, then exit. Later runs size their waits from it. Default cycles: 3",
+                        type=int,
+                        nargs="?",
+                        const=3,
+                        default=None)
+
+    parser.add_argument("--virtual-time", action="store_true",
+                        help="sleeps return at once and move the harness clock forward instead, so a run against a simulated device takes seconds; for testing the tool itself, not devices")
+
     parser.add_argument("--init", action="store_true",
                         help="Interactive setup: prompt for app paths (and optional store URL), then exit.")
 
@@ -81,6 +139,10 @@ if __name__ == "__main__":
     LOGGER.verbose = bool(args.verbose)
     device_id = args.ID
 
+    if args.virtual_time:
+        clock.use_virtual_time()
+        LOGGER.warn("Virtual time: waits are skipped, not slept. Results say nothing about a real device.")
+
     # ---- interactive bootstrap for sample apps ----
     if getattr(args, "init", False):
         # Fixed to exactly three apps; make_app_id_list() now returns the allowed set.
@@ -92,6 +154,21 @@ if __name__ == "__main__":
 
     Tester = DabTester(args.broker, override_dab_version=args.dab_version)
 
+    # Per-operation request timeouts start from the expected latencies of the conformance table
+    Tester.dab_client.timeouts.seed(conformance.CONFORMANCE_TEST_CASE)
+
+    Tester.schedule_tests = args.schedule
+    Tester.concurrency = max(1, args.concurrency)
+    Tester.reruns = max(0, args.reruns)
+    Tester.quarantine_ratio = args.quarantine
+    if args.test_budget is not None:
+        Tester.test_budget = max(0.0, args.test_budget) or None
+    if args.suite_budget is not None:
+        Tester.suite_budget = max(0.0, args.suite_budget) or None
+
+    if args.preflight_ttl is not None:
+        Tester.preflight_ttl = max(0.0, args.preflight_ttl)
+
     Tester.verbose = args.verbose
     try:
         Tester.logger.verbose = Tester.verbose
@@ -99,6 +176,12 @@ if __name__ == "__main__":
         pass
     LOGGER.info(f"Starting run with broker {args.broker}, device ID '{device_id}', suite='{args.suite or 'ALL'}', output='{args.output or '(default)'}', dab-version override='{args.dab_version or 'auto'}'.")
 
+    if args.calibrate is not None:
+        Tester.assert_device_available(device_id)
+        profile = calibrate(Tester, device_id, max(1, args.calibrate))
+        Tester.Close()
+        sys.exit(0 if profile is not None else 1)
+
     suite_to_run = {}
 
     if (args.suite):
@@ -126,8 +209,26 @@ if __name__ == "__main__":
             LOGGER.ok(f"Listed {listed} case(s) in suite '{suite}'.")
 
     else:
+        # Only a run of tests has results to journal (not --calibrate or -l)
+        Tester.journal = ResultJournal(args.resume, resume=True) if args.resume else ResultJournal()
+        LOGGER.info(f"Finished results are journaled to '{Tester.journal.path}'. Resume an interrupted run with --resume {Tester.journal.path}")
+        # Waits sized for this device when it has been calibrated, the fixed constants otherwise
+        use_profile(load_for_device(Tester, device_id))
         if ((not isinstance(args.case, (str)) or len(args.case) == 0)):
             LOGGER.result("Testing all cases")
+            if args.time_budget:
+                try:
+                    budget_s = parse_duration(args.time_budget)
+                except ValueError as e:
+                    LOGGER.error(f"Invalid --time-budget: {e}")
+                    Tester.Close()
+                    sys.exit(1)
+                if not Tester.dab_version:
+                    Tester.detect_dab_version(device_id)
+                plan = plan_time_budget(suite_to_run, Tester.unpack_test_case, to_test_id, budget_s, Tester.dab_version)
+                plan.report()
+                Tester.time_plan = plan
+                suite_to_run = plan.suites
             for suite in suite_to_run:
                 LOGGER.info(f"Preparing to run suite '{suite}' with {len(suite_to_run[suite])} tests.")
                 Tester.assert_device_available(device_id)
@@ -155,5 +256,8 @@ if __name__ == "__main__":
             else:
                 LOGGER.error(f"None of the requested test case IDs matched: {requested_cases}")
 
+        for line in clock.report():
+            LOGGER.result(line)
+
     Tester.Close()
     LOGGER.ok("Run complete. Connection closed.")
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, fields
+from typing import List, Optional
+import json
+import os
 
 @dataclass
 class TestResult:
@@ -10,8 +12,95 @@ class TestResult:
     outcome: str
     response: str
     logs: List[str]
+    # Conformance latency split: device request→response time, and harness time around it
+    latency_ms: Optional[float] = None
+    harness_overhead_ms: Optional[float] = None
+    # Wall time of the whole test section; later runs plan --time-budget from it
+    duration_ms: Optional[int] = None
+    # Declared settle periods inside the test (dab_tester.Settle), not part of latency or verdict
+    settle_ms: Optional[int] = None
+    # Reboot seen by a restart/reset test: went_down, down_s, discovered_s, healthy_s, downtime_s
+    reboot: Optional[dict] = None
 
 @dataclass
 class TestSuite:
     test_result_list: List[TestResult]
-    suite_name: str
\ No newline at end of file
+    suite_name: str
+
+# Field name -> declared type, used to lay values out the way the results file always has
+_RESULT_FIELD_TYPES = {f.name: f.type for f in fields(TestResult)}
+
+def _plain(value):
+    # JSON-ready copy of an attribute the runner attached to a result
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_plain(v) for v in value]
+    if hasattr(value, "__dict__"):
+        return {k: _plain(v) for k, v in sorted(vars(value).items())}
+    return str(value)
+
+def result_to_dict(result):
+    """
+    One TestResult as written to the results file: str fields as text, List[str] items as text,
+    plus every attribute set on it later (test_result, ...), keys sorted.
+    """
+    out = {}
+    for name, value in vars(result).items():
+        declared = _RESULT_FIELD_TYPES.get(name)
+        if declared is str and value is not None and not isinstance(value, str):
+            value = str(value)
+        elif declared == List[str] and isinstance(value, list):
+            value = [v if v is None or isinstance(v, str) else str(v) for v in value]
+        else:
+            value = _plain(value)
+        out[name] = value
+    return dict(sorted(out.items()))
+
+def _dump(value, level):
+    # json.dumps(indent=4) of value, nested `level` objects deep
+    return json.dumps(value, indent=4).replace("\n", "\n" + "    " * level)
+
+class ResultJsonWriter:
+    """
+    Writes a results file one result at a time, so only the result being written is serialized
+    in memory. Header fields come first, then test_result_list, then the summary passed to close().
+    The file is written next to output_path and moved into place by close(); abort() drops it
+    (and does nothing once close() has moved it into place, so it can go in a finally block).
+    """
+    def __init__(self, output_path, header):
+        self.output_path = output_path
+        self.__tmp_path = output_path + ".partial"
+        self.__file = open(self.__tmp_path, "w", encoding="utf-8")
+        self.__count = 0
+        self.__closed = False
+        self.__file.write("{")
+        for key, value in header.items():
+            self.__file.write(f"\n    {json.dumps(key)}: {_dump(value, 1)},")
+        self.__file.write('\n    "test_result_list": [')
+
+    def add(self, result):
+        separator = "," if self.__count else ""
+        self.__file.write(f"{separator}\n        {_dump(result_to_dict(result), 2)}")
+        self.__count += 1
+
+    def close(self, summary):
+        self.__file.write("\n    ]," if self.__count else "],")
+        for index, (key, value) in enumerate(summary.items()):
+            separator = "," if index < len(summary) - 1 else ""
+            self.__file.write(f"\n    {json.dumps(key)}: {_dump(value, 1)}{separator}")
+        self.__file.write("\n}")
+        self.__file.close()
+        os.replace(self.__tmp_path, self.output_path)
+        self.__closed = True
+
+    def abort(self):
+        if self.__closed:
+            return
+        try:
+            self.__file.close()
+            os.remove(self.__tmp_path)
+        except OSError:
+            pass
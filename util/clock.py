@@ -0,0 +1,146 @@
+"""
+The harness clock: every wait and timestamp in the tester goes through here.
+
+    from util import clock
+    clock.sleep(5, "device reboots")     # instead of time.sleep(5)
+    clock.time(), clock.monotonic()      # instead of time.time(), time.monotonic()
+    clock.perf_counter(), clock.now()    # instead of time.perf_counter(), datetime.now()
+
+Each sleep is recorded under its reason, so a run can end with "N seconds slept, by reason"
+(report()). Reasons are short and stable ("poll (launch)", "health-check retry", ...) so they add up.
+
+With use_virtual_time() (--virtual-time) sleeps return at once and move the clock forward instead.
+Everything else still runs in real time, so the clock reads real time plus the sleeps skipped so far:
+timeouts, budgets and durations come out as they would on the wall clock. Meant for running the
+suites against a simulated device to regression-test the harness itself. Measured DAB latencies
+(dab_client) are always real.
+"""
+
+from __future__ import annotations
+
+import time as _time
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, List, Tuple
+
+
+class Clock:
+    """Real time; sleeps are slept and recorded by reason."""
+
+    virtual = False
+
+    def __init__(self):
+        self._lock = Lock()
+        # reason -> [count, seconds]
+        self._slept: Dict[str, list] = {}
+
+    def time(self) -> float:
+        return _time.time()
+
+    def monotonic(self) -> float:
+        return _time.monotonic()
+
+    def perf_counter(self) -> float:
+        return _time.perf_counter()
+
+    def perf_counter_ns(self) -> int:
+        return _time.perf_counter_ns()
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def sleep(self, seconds: float, reason: str) -> None:
+        seconds = max(0.0, float(seconds))
+        with self._lock:
+            entry = self._slept.setdefault(reason, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+        self._sleep(seconds)
+
+    def _sleep(self, seconds: float) -> None:
+        _time.sleep(seconds)
+
+    def slept(self) -> Dict[str, Tuple[int, float]]:
+        """reason -> (sleeps, seconds) so far."""
+        with self._lock:
+            return {reason: (count, seconds) for reason, (count, seconds) in self._slept.items()}
+
+
+class VirtualClock(Clock):
+    """Sleeps advance the clock instead of blocking; it reads real time plus everything skipped."""
+
+    virtual = True
+
+    def __init__(self):
+        super().__init__()
+        self._skipped = 0.0
+
+    def time(self) -> float:
+        return _time.time() + self._skipped
+
+    def monotonic(self) -> float:
+        return _time.monotonic() + self._skipped
+
+    def perf_counter(self) -> float:
+        return _time.perf_counter() + self._skipped
+
+    def perf_counter_ns(self) -> int:
+        return _time.perf_counter_ns() + int(self._skipped * 1e9)
+
+    def now(self) -> datetime:
+        return datetime.now() + timedelta(seconds=self._skipped)
+
+    def _sleep(self, seconds: float) -> None:
+        with self._lock:
+            self._skipped += seconds
+
+
+_clock: Clock = Clock()
+
+
+def use_virtual_time() -> None:
+    """Switch the whole harness to virtual time. Call before the run starts."""
+    global _clock
+    _clock = VirtualClock()
+
+
+def is_virtual() -> bool:
+    return _clock.virtual
+
+
+def time() -> float:
+    return _clock.time()
+
+
+def monotonic() -> float:
+    return _clock.monotonic()
+
+
+def perf_counter() -> float:
+    return _clock.perf_counter()
+
+
+def perf_counter_ns() -> int:
+    return _clock.perf_counter_ns()
+
+
+def now() -> datetime:
+    return _clock.now()
+
+
+def sleep(seconds: float, reason: str) -> None:
+    """Wait seconds (or, in virtual time, move the clock on by them), recorded under reason."""
+    _clock.sleep(seconds, reason)
+
+
+def report() -> List[str]:
+    """Lines summing up the sleeps of the run: the total, then each reason, longest first."""
+    slept = _clock.slept()
+    total = sum(seconds for _, seconds in slept.values())
+    count = sum(n for n, _ in slept.values())
+    mode = " (virtual time: skipped, not slept)" if _clock.virtual else ""
+    lines = [f"{total:.1f} seconds slept in {count} wait(s){mode}, by reason:"]
+    width = max((len(reason) for reason in slept), default=0)
+    for reason, (n, seconds) in sorted(slept.items(), key=lambda item: -item[1][1]):
+        lines.append(f"  {reason:<{width}}  {seconds:8.1f}s  ({n}x)")
+    return lines
@@ -6,7 +6,6 @@ import tarfile
 import json
 import os
 import shutil
-import time
 
 class Resolution:
     width: int
@@ -38,6 +37,7 @@ class ValidateCode(Enum):
 LOGS_COLLECTION_CATEGORIES = {"system", "application", "crash"}
 LOGS_COLLECTION_FOLDER = "logs"
 LOGS_COLLECTION_PACKAGE = f"{LOGS_COLLECTION_FOLDER}.tar.gz"
+LOGS_CHUNK_TIMEOUT = 90
 
 @singleton
 class EnforcementManager:
@@ -56,7 +56,8 @@ class EnforcementManager:
         return not self.supported_operations or operation in self.supported_operations
 
     def add_supported_operations(self, operations):
-        self.supported_operations = operations
+        # Kept a set: the operations/list validator may add to it while another test stores a fetched list
+        self.supported_operations = {op.get("operation") if isinstance(op, dict) else op for op in operations or ()}
 
     def get_supported_operations(self):
         return self.supported_operations
@@ -68,7 +69,7 @@ class EnforcementManager:
         return not self.supported_keys or key in self.supported_keys
 
     def add_supported_keys(self, keys):
-        self.supported_keys = keys
+        self.supported_keys = set(keys or ())
 
     def get_supported_keys(self):
         return self.supported_keys
@@ -142,20 +143,15 @@ class EnforcementManager:
         all_logArchives = bytearray()
         validate_state = True
 
-        startTime = time.time()
         while True:
-            chunkData = tester.dab_client.get_response_chunk()
-            currentTime = time.time()
+            # Blocks until the next chunk arrives; None once LOGS_CHUNK_TIMEOUT passes without one
+            chunkData = tester.dab_client.get_response_chunk(timeout=LOGS_CHUNK_TIMEOUT)
             if not chunkData:
-                if currentTime - startTime > 90:
-                    validate_state = False
-                    print(f"More than 90s without receiving logs chunk. Timeout!")
-                    logs.append(f"[FAILED] More than 90s without receiving logs chunk. Timeout!.")
-                    break
-                else:
-                    continue
+                validate_state = False
+                print(f"More than {LOGS_CHUNK_TIMEOUT}s without receiving logs chunk. Timeout!")
+                logs.append(f"[FAILED] More than {LOGS_CHUNK_TIMEOUT}s without receiving logs chunk. Timeout!.")
+                break
 
-            startTime = currentTime
             remainingChunks = chunkData["remainingChunks"]
             if previous_remainingChunks != -1 and remainingChunks != previous_remainingChunks - 1:
                 validate_state = False
@@ -0,0 +1,71 @@
+"""
+Persisted per-test flakiness statistics, fed by the rerun pass of Execute_All_Tests (--reruns).
+
+For every test that took part in a run with reruns enabled the file keeps
+  runs    runs recorded
+  flaky   runs where the first attempt failed or was skipped and a rerun passed
+  failed  runs where every attempt failed or was skipped
+and the flakiness ratio is flaky / runs. Known-flaky tests are retried first, and tests at or above
+the --quarantine ratio are marked as quarantined in the results.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from logger import LOGGER
+
+DEFAULT_FLAKINESS_PATH = "./test_result/flakiness.json"
+
+# Outcomes a rerun may turn around
+RERUN_OUTCOMES = ("FAILED", "SKIPPED")
+
+
+class FlakinessStats:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or DEFAULT_FLAKINESS_PATH
+        # suite -> test_id -> {"runs", "flaky", "failed"}
+        self._stats: Dict[str, Dict[str, dict]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._stats = data
+        except Exception as e:
+            LOGGER.warn(f"Could not read flakiness statistics from '{self.path}'; starting fresh. {type(e).__name__}: {e}")
+
+    def ratio(self, suite: str, test_id: str) -> float:
+        entry = self._stats.get(suite, {}).get(test_id)
+        if not entry or not entry.get("runs"):
+            return 0.0
+        return entry.get("flaky", 0) / entry["runs"]
+
+    def record(self, suite: str, test_id: str, attempt_outcomes: List[str]) -> None:
+        """Count one run of test_id from the outcomes of its attempts, first to last."""
+        if not attempt_outcomes:
+            return
+        entry = self._stats.setdefault(suite, {}).setdefault(test_id, {"runs": 0, "flaky": 0, "failed": 0})
+        entry["runs"] += 1
+        if attempt_outcomes[-1] in RERUN_OUTCOMES:
+            entry["failed"] += 1
+        elif attempt_outcomes[0] in RERUN_OUTCOMES and attempt_outcomes[-1] == "PASS":
+            entry["flaky"] += 1
+
+    def save(self) -> None:
+        """Write the statistics (temp file + rename). Never raises."""
+        try:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path + ".partial"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._stats, f, indent=4, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            LOGGER.warn(f"Could not save flakiness statistics to '{self.path}': {type(e).__name__}: {e}")
@@ -1,12 +1,14 @@
 # util/output_image_handler.py
 from __future__ import annotations
 from typing import Any, Dict, Optional, Union
-import os, json, base64, re, datetime as dt, sys
+import os, json, base64, re, sys
+
+from util import clock
 
 # ----------------- helpers -----------------
 
 def _ts() -> str:
-    return dt.datetime.now().strftime("%Y%m%d-%H%M%S")
+    return clock.now().strftime("%Y%m%d-%H%M%S")
 
 def _safe(s: Optional[str]) -> str:
     return "".join(c if (c.isalnum() or c in "-_.:@") else "_" for c in (s or "device"))
@@ -0,0 +1,170 @@
+"""
+One reboot watcher for every restart / reset test.
+
+After a system/restart, factory-reset or network-reset, watch_reboot() follows the device through
+its reboot instead of polling every few seconds or asking the operator whether it is back:
+  down  health-check/get probes, a fraction of a second apart, until DOWN_MISSES in a row go
+        unanswered or report unhealthy, or the broker connection drops under one: the device has
+        started going away. A busy device answering slowly is not mistaken for a rebooting one.
+  up    discovery and health-check/get until the device answers discovery again (the DAB service
+        is back on the network) and reports healthy
+Discovery and the probes return as soon as the device answers, so the time to healthy is known to
+within REBOOT_POLL_INTERVAL. The RebootWatch it returns carries the down-time and time-to-healthy.
+
+A device that never goes down within the down window is still waited on to be healthy; the watch
+records that no down-transition was seen (a reboot faster than the probes, or none at all).
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from dab_client import TRANSPORT_LOST, response_data
+from logger import LOGGER
+from util import clock
+from util.wait import wait_budget
+from util.watchdog import check_budget
+
+REBOOT_POLL_INTERVAL = 0.5   # seconds between probes while waiting for a transition
+MIN_HEALTH_PROBE_TIMEOUT = 2.0  # seconds; a probe is never cut off before the expected health-check latency
+DOWN_MISSES = 3              # consecutive unanswered/unhealthy probes before the device counts as down
+DOWN_WINDOW = 60             # seconds the device gets to go down after the reboot request
+
+
+class RebootWatch:
+    """What watch_reboot() saw; times are seconds from the reboot request (or the watch start)."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.down_s: Optional[float] = None        # first probe that found the device gone
+        self.discovered_s: Optional[float] = None  # first discovery answer after that
+        self.healthy_s: Optional[float] = None     # first healthy health-check/get after that
+        self.timeout_s: Optional[float] = None
+
+    @property
+    def went_down(self) -> bool:
+        return self.down_s is not None
+
+    @property
+    def healthy(self) -> bool:
+        return self.healthy_s is not None
+
+    @property
+    def downtime_s(self) -> Optional[float]:
+        """From going down until healthy again."""
+        if self.down_s is None or self.healthy_s is None:
+            return None
+        return round(self.healthy_s - self.down_s, 2)
+
+    def describe(self) -> str:
+        parts = [f"down after {self.down_s:.1f}s" if self.went_down else "no down-transition seen"]
+        if self.discovered_s is not None:
+            parts.append(f"answered discovery after {self.discovered_s:.1f}s")
+        if self.healthy:
+            parts.append(f"healthy after {self.healthy_s:.1f}s")
+            if self.downtime_s is not None:
+                parts.append(f"down for {self.downtime_s:.1f}s")
+        else:
+            parts.append(f"not healthy within {self.timeout_s:g}s")
+        return f"{self.label}: " + ", ".join(parts)
+
+
+def _log(logs, line, error=False):
+    (LOGGER.warn if error else LOGGER.info)(line)
+    if logs is not None:
+        logs.append(line)
+
+
+def _probe_timeout(tester) -> float:
+    # The client's timeout policy for health-check/get (seeded from its expected latency), never less than the floor
+    return max(MIN_HEALTH_PROBE_TIMEOUT, tester.dab_client.timeouts.timeout_for("health-check/get", MIN_HEALTH_PROBE_TIMEOUT))
+
+
+def _probe_healthy(tester, device_id) -> bool:
+    """One health-check/get: answered 200 and not reporting unhealthy."""
+    tester.execute_cmd(device_id, "health-check/get", "{}", timeout=_probe_timeout(tester))
+    try:
+        answer = response_data(tester.dab_client.response() or "{}")
+    except (TypeError, ValueError):
+        return False
+    return isinstance(answer, dict) and answer.get("status") == 200 and answer.get("healthy", True) is not False
+
+
+def _discovered(tester, device_id) -> bool:
+    try:
+        found = tester.dab_client.discover_devices(device_id=device_id, wait_seconds=REBOOT_POLL_INTERVAL, use_cache=False) or []
+    except Exception:
+        return False
+    return any((d.get("deviceId") or d.get("device_id")) == device_id for d in found)
+
+
+def _pause(started: float, reason: str) -> None:
+    # Probes that came back at once (an error status, a refused connection) still wait out the interval
+    left = REBOOT_POLL_INTERVAL - (clock.monotonic() - started)
+    if left > 0:
+        clock.sleep(left, reason)
+
+
+def _until_down(tester, device_id, start: float, until: float) -> Optional[float]:
+    """
+    Seconds from start until the first of DOWN_MISSES consecutive failed probes (or a probe the
+    broker connection dropped under), or None if the device kept answering until until.
+    """
+    first_miss = None
+    misses = 0
+    while clock.monotonic() < until:
+        check_budget()
+        probe = clock.monotonic()
+        if _probe_healthy(tester, device_id):
+            first_miss, misses = None, 0
+        else:
+            first_miss = probe if first_miss is None else first_miss
+            misses += 1
+            if misses >= DOWN_MISSES or tester.dab_client.last_error_code() == TRANSPORT_LOST:
+                return round(first_miss - start, 2)
+        _pause(probe, "reboot watch (down)")
+    return None
+
+
+def watch_reboot(tester, device_id, timeout: float, logs=None, since: Optional[float] = None,
+                 down_window: float = DOWN_WINDOW, label: str = "reboot", kind: Optional[str] = None) -> RebootWatch:
+    """
+    Follow device_id down and back up to healthy. since is the clock.monotonic() at which the reboot
+    request went out (default: now). timeout bounds the whole watch from since. kind names the wait
+    for the device profile (util.wait.wait_budget), which may replace timeout: "reboot" is calibrated
+    on system/restart only, so factory-reset and network-reset watches leave kind unset.
+    """
+    timeout = wait_budget(kind, timeout)
+    start = clock.monotonic() if since is None else since
+    deadline = start + timeout
+    watch = RebootWatch(label)
+    watch.timeout_s = timeout
+
+    watch.down_s = _until_down(tester, device_id, start, min(deadline, start + down_window))
+    if not watch.went_down:
+        _log(logs, f"[REBOOT] {label}: the device kept answering for {down_window:g}s; checking it is healthy.", error=True)
+
+    while clock.monotonic() < deadline:
+        check_budget()
+        probe = clock.monotonic()
+        # Only a timestamp: a bridge that does not answer discovery is still seen healthy
+        if watch.discovered_s is None and watch.went_down and _discovered(tester, device_id):
+            watch.discovered_s = round(clock.monotonic() - start, 2)
+        if _probe_healthy(tester, device_id):
+            watch.healthy_s = round(clock.monotonic() - start, 2)
+            break
+        _pause(probe, "reboot watch (up)")
+
+    _log(logs, f"[REBOOT] {watch.describe()}.", error=not watch.healthy)
+    return watch
+
+
+def wait_for_down(tester, device_id, window: float = DOWN_WINDOW, logs=None, label: str = "reboot") -> Optional[float]:
+    """Only the down-transition: seconds until the device stopped answering, or None within window."""
+    start = clock.monotonic()
+    took = _until_down(tester, device_id, start, start + window)
+    if took is None:
+        _log(logs, f"[REBOOT] {label}: the device kept answering for {window:g}s.", error=True)
+    else:
+        _log(logs, f"[REBOOT] {label}: down after {took:.1f}s.")
+    return took
@@ -0,0 +1,108 @@
+"""
+Per-run JSONL journal of finished test results, so a crashed or interrupted run can be resumed.
+Every finished TestResult is appended as one line and fsync'ed before the runner moves on.
+A line looks like {"suite": "<suite>", "key": "<runner test id>", "result": {<TestResult fields>}}.
+--resume <journal> loads the journal, skips the tests it already holds, and keeps appending to it.
+Results read back are rebuilt as TestResult objects, so the final JSON is the same as an uninterrupted run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import defaultdict, deque
+from dataclasses import fields
+from pathlib import Path
+from threading import Lock
+from typing import Deque, Dict, Optional
+
+from dab_client import DabResponse
+from logger import LOGGER
+from result_json import TestResult
+from util import clock
+from util.watchdog import is_abandoned
+
+DEFAULT_JOURNAL_DIR = "./test_result"
+
+_RESULT_FIELDS = [f.name for f in fields(TestResult)]
+
+
+def default_journal_path() -> str:
+    """A fresh journal file name for this run: ./test_result/run_<YYYYmmdd_HHMMSS>.journal.jsonl"""
+    return os.path.join(DEFAULT_JOURNAL_DIR, clock.now().strftime("run_%Y%m%d_%H%M%S") + ".journal.jsonl")
+
+
+def _result_to_dict(result) -> dict:
+    # Dataclass fields plus whatever the runner attached afterwards (test_result, dab_topic, ...)
+    return {k: v for k, v in vars(result).items() if not k.startswith("_")}
+
+
+def _result_from_dict(data: dict) -> TestResult:
+    result = TestResult(**{k: data.get(k) for k in _RESULT_FIELDS if k in data})
+    for k, v in data.items():
+        if k not in _RESULT_FIELDS:
+            setattr(result, k, v)
+    # Live responses are DabResponse objects; restore that so the results JSON formats them the same way
+    if isinstance(result.response, str) and result.response:
+        result.response = DabResponse(result.response.encode("utf-8"))
+    return result
+
+
+class ResultJournal:
+    def __init__(self, path: Optional[str] = None, resume: bool = False):
+        self.path = path or default_journal_path()
+        self._lock = Lock()
+        self._file = None
+        # suite -> key -> results already journaled (a key can repeat within a suite)
+        self._completed: Dict[str, Dict[str, Deque[TestResult]]] = defaultdict(lambda: defaultdict(deque))
+        if resume:
+            self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            LOGGER.warn(f"Resume journal '{self.path}' does not exist; starting a new run with it.")
+            return
+        count = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    self._completed[record["suite"]][record["key"]].append(_result_from_dict(record["result"]))
+                    count += 1
+                except Exception as e:
+                    # A torn last line from a crash is expected; that test simply runs again
+                    LOGGER.warn(f"Ignoring unreadable journal line {line_no} in '{self.path}': {type(e).__name__}: {e}")
+        LOGGER.info(f"Loaded {count} finished result(s) from journal '{self.path}'.")
+
+    def take_completed(self, suite: str, key: str) -> Optional[TestResult]:
+        """The journaled result of this test if an earlier run finished it (each one is handed out once)."""
+        with self._lock:
+            results = self._completed.get(suite, {}).get(key)
+            return results.popleft() if results else None
+
+    def append(self, suite: str, key: str, result) -> None:
+        """Write one finished result and fsync it. Never raises: the run goes on without a journal line."""
+        if is_abandoned():
+            # the watchdog already recorded this test as timed out
+            return
+        record = {"suite": suite, "key": key, "result": _result_to_dict(result)}
+        try:
+            line = json.dumps(record, default=str, ensure_ascii=False)
+            with self._lock:
+                if self._file is None:
+                    Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, "a", encoding="utf-8")
+                self._file.write(line + "\n")
+                self._file.flush()
+                os.fsync(self._file.fileno())
+        except Exception as e:
+            LOGGER.warn(f"Could not append '{key}' to journal '{self.path}': {type(e).__name__}: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,288 @@
+"""
+Optional state-aware ordering of a suite (--schedule).
+
+Each test is described by the device state it needs before it runs and the state it leaves behind,
+taken from its topic and request body:
+  foreground  the app in front ("home" after KEY_HOME / exit, an appId after a launch, "?" when unknown)
+  setting:<k> the value of system setting <k> after a positive system/settings/set
+  power       the power mode ("On" unless a positive system/power-mode/set changed it)
+Tests that touch the same feature (one app's lifecycle, log collection, telemetry, voice, one setting, ...)
+share a chain and keep their relative order. Reboot-class tests are barriers: nothing moves across them.
+Within those limits the tests are reordered greedily so that apps are launched, settings changed and
+the power mode flipped as few times as possible.
+foreground_effect() is also what the runner uses to decide whether a test needs a trip back Home,
+and concurrency_safe() which tests may run side by side (--concurrency).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Dict, List, Optional, Tuple
+
+# Estimated cost of one state transition, used to price the planned order against the original one
+APP_LAUNCH_COST_MS = 5000        # launching / bringing an app to the foreground
+SETTING_CHANGE_COST_MS = 1000    # applying one system setting
+POWER_CHANGE_COST_MS = 3000      # entering or leaving a power mode
+
+BARRIER_OPERATIONS = ("system/restart", "system/factory-reset", "system/network-reset")
+
+# Topic prefix -> chain; tests in one chain keep their relative order
+_CHAIN_PREFIXES = (
+    ("system/logs/", "logs"),
+    ("device-telemetry/", "device-telemetry"),
+    ("app-telemetry/", "app-telemetry"),
+    ("applications/install", "app-lifecycle"),
+    ("applications/uninstall", "app-lifecycle"),
+    ("applications/clear-data", "app-lifecycle"),
+    ("applications/", "applications"),
+    ("input/", "input"),
+    ("voice/", "voice"),
+    ("content/open", "foreground"),
+    ("system/power-mode/", "power"),
+    ("system/setup/", "setup"),
+)
+
+_COSTS = {"foreground": APP_LAUNCH_COST_MS, "power": POWER_CHANGE_COST_MS}
+
+HOME = "home"
+UNKNOWN = "?"
+
+# Operations that only read device state; any number of them can be in flight at once
+READ_ONLY_OPERATIONS = (
+    "operations/list", "applications/list", "applications/get-state", "device/info",
+    "system/settings/list", "system/settings/get", "input/key/list", "health-check/get",
+    "version", "voice/list", "system/power-mode/get",
+)
+
+# Negative tests that still depend on, or feed, state outside the device's answer:
+# settings/set payloads are remembered by the checker, log collection answers depend on what ran before
+SERIAL_NEGATIVE_PREFIXES = ("system/settings/set", "system/logs/") + BARRIER_OPERATIONS
+
+# Keys that never move the focus to another screen or app
+PASSIVE_KEYS = ("KEY_VOLUME_UP", "KEY_VOLUME_DOWN", "KEY_MUTE")
+
+
+class _Step:
+    """One test case with the preconditions / effects the scheduler derived for it."""
+    __slots__ = ("index", "case", "topic", "title", "chain", "barrier", "requires", "effects")
+
+    def __init__(self, index, case, topic, title):
+        self.index = index
+        self.case = case
+        self.topic = topic or ""
+        self.title = title or ""
+        self.chain: Optional[str] = None
+        self.barrier = False
+        self.requires: Dict[str, str] = {}
+        self.effects: Dict[str, str] = {}
+
+
+def _cost_of(dimension: str) -> int:
+    return _COSTS.get(dimension, SETTING_CHANGE_COST_MS)
+
+
+def _body_of(body_spec) -> dict:
+    # Bodies may be lambdas resolved at run time; an unreadable body just means "no known state"
+    try:
+        body = body_spec() if callable(body_spec) else body_spec
+        value = json.loads(body) if isinstance(body, str) else body
+        return value if isinstance(value, dict) else {}
+    except Exception:
+        return {}
+
+
+def foreground_effect(topic: str, body_spec, is_negative: bool = False) -> Optional[str]:
+    """
+    What a test leaves in the foreground: None when it cannot change it, HOME, the appId it launched,
+    or UNKNOWN when it may bring up something the runner cannot name (voice, content, most keys).
+    """
+    if topic in BARRIER_OPERATIONS:
+        return HOME
+    if is_negative or not topic:
+        # A rejected request leaves the device as it was
+        return None
+    if topic in ("applications/launch", "applications/launch-with-content"):
+        app_id = _body_of(body_spec).get("appId")
+        return app_id if isinstance(app_id, str) else UNKNOWN
+    if topic in ("applications/exit", "applications/clear-data"):
+        return HOME
+    if topic in ("input/key-press", "input/long-key-press"):
+        key = _body_of(body_spec).get("keyCode")
+        if key in PASSIVE_KEYS:
+            return None
+        # A long press on Home opens an assistant on some devices, so only a short one means Home
+        return HOME if key == "KEY_HOME" and topic == "input/key-press" else UNKNOWN
+    if topic.startswith("voice/send-") or topic == "content/open":
+        return UNKNOWN
+    return None
+
+
+def concurrency_safe(topic: str, is_negative: bool = False) -> bool:
+    """
+    True when a test can run alongside others: a read-only operation, or a bad request the device
+    must reject without changing anything.
+    """
+    if not topic:
+        return False
+    if topic in READ_ONLY_OPERATIONS:
+        return True
+    return bool(is_negative) and not topic.startswith(SERIAL_NEGATIVE_PREFIXES)
+
+
+def _describe(step: _Step, body_spec, is_negative: bool) -> None:
+    topic = step.topic
+    if topic in BARRIER_OPERATIONS:
+        step.barrier = True
+        step.effects = {"foreground": HOME, "power": "On"}
+        return
+
+    for prefix, chain in _CHAIN_PREFIXES:
+        if topic.startswith(prefix):
+            step.chain = chain
+            break
+
+    if topic == "system/settings/set":
+        body = _body_of(body_spec)
+        key = next(iter(body), None)
+        if key is None:
+            return
+        step.chain = f"setting:{key}"
+        if not is_negative:
+            step.effects[f"setting:{key}"] = json.dumps(body[key], sort_keys=True)
+        return
+
+    # Everything but the power-mode operations expects the device to be awake
+    if not topic.startswith("system/power-mode/"):
+        step.requires["power"] = "On"
+
+    if is_negative:
+        # A rejected request leaves the device as it was
+        return
+
+    if topic == "system/power-mode/set":
+        mode = _body_of(body_spec).get("powerMode")
+        if isinstance(mode, str):
+            step.effects["power"] = mode
+    elif topic in ("applications/exit", "applications/get-state") or topic.startswith("app-telemetry/"):
+        # These look at a running app: cheapest while it is still in front
+        app_id = _body_of(body_spec).get("appId")
+        if isinstance(app_id, str):
+            step.requires["foreground"] = app_id
+
+    foreground = foreground_effect(topic, body_spec)
+    if foreground is not None:
+        step.effects["foreground"] = foreground
+
+
+def _transition_ms(state: Dict[str, str], step: _Step) -> int:
+    # What running this step now costs in state changes: unmet preconditions, then its own effects
+    cost = 0
+    after = dict(state)
+    for dim, value in step.requires.items():
+        if after.get(dim) != value:
+            cost += _cost_of(dim)
+            after[dim] = value
+    for dim, value in step.effects.items():
+        # An unknown outcome costs nothing itself; the next test that needs a known state pays for it
+        if value != UNKNOWN and after.get(dim) != value:
+            cost += _cost_of(dim)
+    return cost
+
+
+def _apply(state: Dict[str, str], step: _Step) -> None:
+    state.update(step.requires)
+    state.update(step.effects)
+
+
+def estimate_transition_ms(steps: List[_Step]) -> Tuple[int, int]:
+    """(number of state transitions, their estimated cost in ms) when steps run in this order."""
+    state = {"power": "On"}
+    count = total = 0
+    for step in steps:
+        cost = _transition_ms(state, step)
+        if cost:
+            count += 1
+            total += cost
+        _apply(state, step)
+    return count, total
+
+
+def _plan_segment(segment: List[_Step], state: Dict[str, str]) -> List[_Step]:
+    pending = list(segment)
+    planned = []
+    while pending:
+        # Only the first unplanned test of each chain may run next
+        seen_chains = set()
+        ready = []
+        for step in pending:
+            if step.chain is None:
+                ready.append(step)
+            elif step.chain not in seen_chains:
+                seen_chains.add(step.chain)
+                ready.append(step)
+
+        def score(step):
+            # Own transition cost, plus what it would undo for the tests still waiting on the current state
+            regret = 0
+            for dim, value in step.effects.items():
+                current = state.get(dim)
+                if current is not None and value != current:
+                    waiting = sum(1 for other in pending if other is not step and other.requires.get(dim) == current)
+                    regret += waiting * _cost_of(dim)
+            return (_transition_ms(state, step) + regret, step.index)
+
+        best = min(ready, key=score)
+        pending.remove(best)
+        planned.append(best)
+        _apply(state, best)
+    return planned
+
+
+def plan_schedule(test_cases, unpack) -> Tuple[list, dict]:
+    """
+    Reorder test_cases to cut app launches, setting changes and power-mode flips.
+    unpack is DabTester.unpack_test_case. Returns (ordered test cases, report) where report holds
+    the planned steps as (original position, topic, title) and the estimated transitions before/after.
+    """
+    steps = []
+    for index, case in enumerate(test_cases):
+        try:
+            topic, body_spec, _func, _expected, title, is_negative, _ver = unpack(case)
+        except Exception:
+            topic = body_spec = title = None
+            is_negative = False
+        step = _Step(index, case, topic, title)
+        if topic:
+            _describe(step, body_spec, bool(is_negative))
+        else:
+            # Unresolvable cases stay where they are
+            step.barrier = True
+        steps.append(step)
+
+    planned: List[_Step] = []
+    state = {"power": "On"}
+    segment: List[_Step] = []
+    for step in steps:
+        if step.barrier:
+            planned.extend(_plan_segment(segment, state))
+            planned.append(step)
+            _apply(state, step)
+            segment = []
+        else:
+            segment.append(step)
+    planned.extend(_plan_segment(segment, state))
+
+    before = estimate_transition_ms(steps)
+    after = estimate_transition_ms(planned)
+    if after[1] >= before[1]:
+        # Nothing to gain: keep the suite as written
+        planned, after = steps, before
+    report = {
+        "order": [(s.index + 1, s.topic, s.title) for s in planned],
+        "transitions_before": before[0],
+        "transitions_after": after[0],
+        "estimated_before_ms": before[1],
+        "estimated_after_ms": after[1],
+        "estimated_saved_ms": max(0, before[1] - after[1]),
+    }
+    return [s.case for s in planned], report
@@ -0,0 +1,209 @@
+"""
+Fit a run into a fixed lab slot (--time-budget).
+
+Per-test durations come from earlier results files in ./test_result (the duration_ms every result
+records). Tests are picked by priority until the predicted time fills the budget:
+  1. required tests that failed or were skipped last time
+  2. the other required tests (including ones never run before)
+  3. optional tests: last outcome OPTIONAL_FAILED, or written for a newer DAB version than the device's
+Picked tests run in their suite order, so tests that build on each other still do. While the run goes
+on, TimeBudgetPlan.observe() prints the actual elapsed time against the prediction.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import re
+import statistics
+import time
+from typing import Dict, List, Optional
+
+from packaging.version import Version, InvalidVersion
+
+from logger import LOGGER
+from util import clock
+
+HISTORY_DIR = "./test_result"
+HISTORY_SAMPLES = 5               # most recent durations per test used for its estimate
+DEFAULT_TEST_ESTIMATE_MS = 10000  # a test with no history anywhere in its operation or suite
+ESTIMATE_OVERHEAD_MS = 1500       # added to a case's expected latency when it is all we know
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)\s*([hms]?)", re.IGNORECASE)
+
+
+def parse_duration(text: str) -> float:
+    """'45m', '1h30m', '90s', '2h' -> seconds. A bare number is minutes. Raises ValueError."""
+    text = (text or "").strip()
+    if not text or not re.fullmatch(r"(\s*\d+(?:\.\d+)?\s*[hmsHMS]?)+", text):
+        raise ValueError(f"not a duration: '{text}' (use e.g. 45m, 1h30m, 90s)")
+    seconds = 0.0
+    for value, unit in _DURATION_PART.findall(text):
+        seconds += float(value) * {"h": 3600, "m": 60, "s": 1, "": 60}[unit.lower()]
+    return seconds
+
+
+def load_history(history_dir: str = HISTORY_DIR) -> Dict[str, dict]:
+    """
+    test_id -> {"durations": [ms, newest first], "last_outcome": str} from every results file in
+    history_dir, newest file first. Unreadable files and results without duration_ms are skipped.
+    """
+    history: Dict[str, dict] = {}
+    paths = sorted(glob.glob(os.path.join(history_dir, "*.json")), key=os.path.getmtime, reverse=True)
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            results = data.get("test_result_list") if isinstance(data, dict) else None
+        except Exception:
+            continue
+        if not isinstance(results, list):
+            continue
+        for r in results:
+            if not isinstance(r, dict) or not r.get("test_id"):
+                continue
+            entry = history.setdefault(r["test_id"], {"durations": [], "last_outcome": None})
+            if entry["last_outcome"] is None:
+                entry["last_outcome"] = r.get("test_result") or r.get("outcome")
+            duration = r.get("duration_ms")
+            if isinstance(duration, (int, float)) and len(entry["durations"]) < HISTORY_SAMPLES:
+                entry["durations"].append(duration)
+    return history
+
+
+def _fmt(seconds: float) -> str:
+    seconds = int(round(seconds))
+    return f"{seconds // 60}m{seconds % 60:02d}s" if seconds >= 60 else f"{seconds}s"
+
+
+class _Planned:
+    __slots__ = ("suite", "position", "case", "test_id", "topic", "priority", "estimate_ms", "source")
+
+    def __init__(self, suite, position, case, test_id, topic):
+        self.suite = suite
+        self.position = position
+        self.case = case
+        self.test_id = test_id
+        self.topic = topic
+        self.priority = 1
+        self.estimate_ms = DEFAULT_TEST_ESTIMATE_MS
+        # Where estimate_ms came from: history, topic, expected, suite or default
+        self.source = "default"
+
+
+class TimeBudgetPlan:
+    """The tests picked for the budget, their predicted durations, and the running actual-vs-predicted account."""
+
+    def __init__(self, budget_s: float, suites: Dict[str, list], picked: List[_Planned], dropped: List[_Planned]):
+        self.budget_s = budget_s
+        self.suites = suites
+        self.picked = picked
+        self.dropped = dropped
+        self.predicted_ms = sum(p.estimate_ms for p in picked)
+        self._by_id = {}
+        for p in picked:
+            self._by_id.setdefault((p.suite, p.test_id), []).append(p)
+        self._start = None
+        self._done_predicted_ms = 0
+        self._done = 0
+
+    def report(self) -> None:
+        """Print what was picked, what was left out, and when the run should finish."""
+        self._start = clock.time()
+        LOGGER.result(f"Time budget {_fmt(self.budget_s)}: {len(self.picked)} tests picked, {len(self.dropped)} left out; predicted run time {_fmt(self.predicted_ms / 1000)}.")
+        for tier, label in ((0, "recently failed"), (1, "required"), (2, "optional")):
+            picked = sum(1 for p in self.picked if p.priority == tier)
+            dropped = sum(1 for p in self.dropped if p.priority == tier)
+            if picked or dropped:
+                LOGGER.result(f"  {label:<16}: {picked} picked, {dropped} left out")
+        unmeasured = sum(1 for p in self.picked if p.source != "history")
+        if unmeasured:
+            LOGGER.result(f"  {unmeasured} picked test(s) have no recorded duration; their estimate comes from similar tests.")
+        LOGGER.result(f"Predicted finish: {time.strftime('%H:%M:%S', time.localtime(self._start + self.predicted_ms / 1000))}")
+
+    def observe(self, suite: str, test_id: str) -> None:
+        """One planned test finished: print elapsed vs predicted so far and the updated finish time."""
+        queue = self._by_id.get((suite, test_id))
+        if not queue or self._start is None:
+            return
+        planned = queue.pop(0)
+        self._done += 1
+        self._done_predicted_ms += planned.estimate_ms
+        elapsed = clock.time() - self._start
+        drift = elapsed - self._done_predicted_ms / 1000
+        finish = self._start + self.predicted_ms / 1000 + drift
+        LOGGER.result(
+            f"Time budget: {self._done}/{len(self.picked)} done, {_fmt(elapsed)} elapsed vs {_fmt(self._done_predicted_ms / 1000)} predicted "
+            f"({'+' if drift >= 0 else '-'}{_fmt(abs(drift))}); expected finish {time.strftime('%H:%M:%S', time.localtime(finish))}"
+            f"{' (over budget)' if finish - self._start > self.budget_s else ''}."
+        )
+
+
+def plan_time_budget(suites: Dict[str, list], unpack, to_test_id, budget_s: float,
+                     dab_version: Optional[str] = None, history: Optional[Dict[str, dict]] = None) -> TimeBudgetPlan:
+    """
+    Pick tests from suites (name -> test cases) so their predicted durations fit budget_s seconds.
+    unpack is DabTester.unpack_test_case; the returned plan's .suites holds the picked cases per suite,
+    in suite order.
+    """
+    history = load_history() if history is None else history
+    candidates: List[_Planned] = []
+    for suite, cases in suites.items():
+        for position, case in enumerate(cases):
+            try:
+                topic, _body, _func, expected, title, _is_negative, version = unpack(case)
+            except Exception:
+                topic = None
+            if not topic:
+                continue
+            p = _Planned(suite, position, case, to_test_id(f"{topic}/{title}"), topic)
+            past = history.get(p.test_id, {})
+            if past.get("durations"):
+                p.estimate_ms = statistics.median(past["durations"])
+                p.source = "history"
+            elif isinstance(expected, int) and expected > 0 and suite != "functional":
+                p.estimate_ms = expected + ESTIMATE_OVERHEAD_MS
+                p.source = "expected"
+            try:
+                newer = bool(dab_version and version and Version(str(version)) > Version(str(dab_version)))
+            except InvalidVersion:
+                newer = False
+            last = past.get("last_outcome")
+            if newer or last == "OPTIONAL_FAILED":
+                p.priority = 2
+            elif last in ("FAILED", "SKIPPED"):
+                p.priority = 0
+            candidates.append(p)
+
+    # Tests never measured borrow the median of measured tests on the same operation, or failing
+    # that (and with no expected latency to go on) of the measured tests in the same suite
+    by_topic: Dict[str, List[float]] = {}
+    by_suite: Dict[str, List[float]] = {}
+    for p in candidates:
+        if p.source == "history":
+            by_topic.setdefault(p.topic, []).append(p.estimate_ms)
+            by_suite.setdefault(p.suite, []).append(p.estimate_ms)
+    for p in candidates:
+        if p.source == "history":
+            continue
+        if p.topic in by_topic:
+            p.estimate_ms, p.source = statistics.median(by_topic[p.topic]), "topic"
+        elif p.source == "default" and p.suite in by_suite:
+            p.estimate_ms, p.source = statistics.median(by_suite[p.suite]), "suite"
+
+    picked, dropped = [], []
+    spent_ms = 0.0
+    budget_ms = budget_s * 1000
+    for p in sorted(candidates, key=lambda p: p.priority):
+        if spent_ms + p.estimate_ms <= budget_ms:
+            picked.append(p)
+            spent_ms += p.estimate_ms
+        else:
+            dropped.append(p)
+
+    picked.sort(key=lambda p: (list(suites).index(p.suite), p.position))
+    chosen: Dict[str, list] = {}
+    for p in picked:
+        chosen.setdefault(p.suite, []).append(p.case)
+    return TimeBudgetPlan(budget_s, chosen, picked, dropped)
@@ -0,0 +1,171 @@
+"""
+Condition-based waits for the functional tests.
+
+Instead of sleeping for a fixed time after a launch, exit, install or setting change, wait_until()
+polls one DAB request until a predicate on its response holds, or the budget (the old fixed wait)
+runs out. A device that gets there in 800 ms moves on after 800 ms; a slow one gets the same time it
+always had. Every wait logs how long it actually took against its budget.
+
+Waits with nothing on the device to poll (video buffering, a reset finishing, ...) go through
+settle(), which sleeps for the declared time and logs why.
+
+With a calibrated device profile in use (see util/wait_profile.py and --calibrate), waits of a known
+kind (launch, exit, install, uninstall, settings, reboot) get this device's p95 x margin as their
+budget instead of the fixed constant.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Callable, Optional, Tuple
+
+from dab_client import response_data
+from logger import LOGGER
+from util import clock
+from util.watchdog import check_budget
+
+DEFAULT_POLL_INTERVAL = 0.5   # seconds before the first re-poll
+DEFAULT_BACKOFF = 1.5         # each further poll interval is this many times the previous one
+MAX_POLL_INTERVAL = 3.0       # ... up to this many seconds
+NOT_IMPLEMENTED = 501         # the device cannot answer the polled operation at all; stop polling
+
+# util.wait_profile.WaitProfile of the device under test, or None to use the callers' constants
+_profile = None
+
+
+def use_profile(profile) -> None:
+    """Take wait budgets from profile (None = back to the fixed constants)."""
+    global _profile
+    _profile = profile
+
+
+def wait_budget(kind: Optional[str], default: float) -> float:
+    """Budget in seconds for a wait of kind: calibrated for this device when possible, else default."""
+    if kind is None or _profile is None:
+        return default
+    return _profile.budget(kind, default)
+
+
+def _parse(raw) -> dict:
+    # The body of a DabResponse is parsed once (response_data); anything unreadable is an empty answer
+    if isinstance(raw, dict):
+        return raw
+    try:
+        value = response_data(raw or "{}")
+        return value if isinstance(value, dict) else {}
+    except Exception:
+        return {}
+
+
+def _log(logs, line, error=False):
+    (LOGGER.warn if error else LOGGER.info)(line)
+    if logs is not None:
+        logs.append(line)
+
+
+def wait_until(tester, device_id, topic, body, predicate: Callable[[dict], bool], timeout: float,
+               backoff: float = DEFAULT_BACKOFF, interval: float = DEFAULT_POLL_INTERVAL,
+               label: Optional[str] = None, logs=None, kind: Optional[str] = None) -> Tuple[bool, dict]:
+    """
+    Poll topic with body until predicate(response dict) is true or timeout seconds have passed.
+    The first poll is immediate; later ones back off from interval by backoff, capped at MAX_POLL_INTERVAL.
+    kind names the wait for the device profile, which may replace timeout.
+    Returns (met, last response). A predicate that raises counts as not met.
+    """
+    timeout = wait_budget(kind, timeout)
+    label = label or f"{topic} condition"
+    body = body if isinstance(body, str) else json.dumps(body or {})
+    start = clock.monotonic()
+    deadline = start + max(0.0, timeout)
+    polls = 0
+    response: dict = {}
+    met = False
+    while True:
+        check_budget()
+        tester.execute_cmd(device_id, topic, body)
+        response = _parse(tester.dab_client.response())
+        polls += 1
+        try:
+            met = bool(predicate(response))
+        except Exception:
+            met = False
+        if met or response.get("status") == NOT_IMPLEMENTED:
+            break
+        left = deadline - clock.monotonic()
+        if left <= 0:
+            break
+        clock.sleep(min(interval, left), f"poll ({kind or 'condition'})")
+        interval = min(interval * backoff, MAX_POLL_INTERVAL)
+
+    elapsed = clock.monotonic() - start
+    if met:
+        _log(logs, f"[WAIT] {label}: met after {elapsed:.1f}s of {timeout:g}s budget ({polls} poll(s)).")
+    else:
+        _log(logs, f"[WAIT] {label}: not met after {elapsed:.1f}s of {timeout:g}s budget ({polls} poll(s)); last response: {json.dumps(response)}", error=True)
+    return met, response
+
+
+def settle(seconds: float, reason: str, logs=None, kind: Optional[str] = None) -> None:
+    """A fixed wait with nothing on the device to poll for; logged with its reason."""
+    seconds = wait_budget(kind, seconds)
+    _log(logs, f"[WAIT] {reason}: settling for {seconds:g}s (nothing to poll).")
+    check_budget()
+    clock.sleep(seconds, f"settle ({kind})" if kind else reason)
+
+
+# ---------------------------------------------------------------------------
+# Predicates and common waits
+# ---------------------------------------------------------------------------
+
+def app_state_is(*states: str) -> Callable[[dict], bool]:
+    """applications/get-state predicate: the state is one of states."""
+    wanted = {s.upper() for s in states}
+    return lambda r: r.get("status") == 200 and str(r.get("state", "")).upper() in wanted
+
+
+def app_state_is_not(*states: str) -> Callable[[dict], bool]:
+    """applications/get-state predicate: the device answered and the state is none of states."""
+    unwanted = {s.upper() for s in states}
+    return lambda r: r.get("status") == 200 and str(r.get("state", "")).upper() not in unwanted
+
+
+def app_listed(app_id: str, present: bool = True) -> Callable[[dict], bool]:
+    """applications/list predicate: app_id is (or, with present=False, is no longer) installed."""
+    def check(r):
+        if r.get("status") != 200:
+            return False
+        apps = r.get("applications") or []
+        listed = any((a.get("appId") if isinstance(a, dict) else a) == app_id for a in apps)
+        return listed == present
+    return check
+
+
+def setting_is(key: str, value) -> Callable[[dict], bool]:
+    """system/settings/get predicate: setting key reads back as value."""
+    return lambda r: r.get("status") == 200 and key in r and r.get(key) == value
+
+
+def wait_for_app_state(tester, device_id, app_id, states, timeout, logs=None, exclude=False) -> Tuple[bool, dict]:
+    """
+    Poll applications/get-state for app_id until its state is one of states (a name or a tuple),
+    or with exclude=True until it is none of them.
+    """
+    states = (states,) if isinstance(states, str) else tuple(states)
+    predicate = app_state_is_not(*states) if exclude else app_state_is(*states)
+    label = f"{app_id} {'leaves' if exclude else 'reaches'} {'/'.join(states)}"
+    kind = "launch" if states == ("FOREGROUND",) and not exclude else "exit"
+    return wait_until(tester, device_id, "applications/get-state", {"appId": app_id}, predicate, timeout,
+                      label=label, logs=logs, kind=kind)
+
+
+def wait_for_app_listed(tester, device_id, app_id, timeout, logs=None, present=True) -> Tuple[bool, dict]:
+    """Poll applications/list until app_id is installed (or, with present=False, gone)."""
+    label = f"{app_id} {'installed' if present else 'uninstalled'}"
+    return wait_until(tester, device_id, "applications/list", {}, app_listed(app_id, present), timeout,
+                      label=label, logs=logs, kind="install" if present else "uninstall")
+
+
+def wait_for_setting(tester, device_id, key, value, timeout, logs=None) -> Tuple[bool, dict]:
+    """Poll system/settings/get until setting key reads back as value."""
+    return wait_until(tester, device_id, "system/settings/get", {}, setting_is(key, value), timeout,
+                      label=f"setting {key} == {json.dumps(value)}", logs=logs, kind="settings")
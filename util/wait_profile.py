@@ -0,0 +1,250 @@
+"""
+Per-device wait calibration (--calibrate).
+
+The wait constants in functional.py are sized for the slowest device seen so far. A calibration pass
+times this device's launch, exit, install, uninstall, settings-apply and reboot with a few probe cycles
+and stores the samples under its device/info manufacturer, model and firmware. On later runs against
+the same model and firmware, every wait of one of those kinds gets p95 x PROFILE_MARGIN as its budget
+(util.wait.wait_budget()); a kind with no samples, or a device never calibrated, keeps the constants.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import config
+from dab_client import response_data
+from logger import LOGGER
+from util import clock
+from util.config_loader import ensure_app_available
+from util.wait import wait_until, app_state_is, app_state_is_not, app_listed, setting_is
+from util.reboot_watch import watch_reboot
+
+DEFAULT_PROFILE_PATH = "./config/wait_profiles.json"
+PROFILE_PERCENTILE = 95
+PROFILE_MARGIN = 1.5           # budget = p95 of the calibrated samples x this
+MIN_PROFILE_BUDGET = 2.0       # seconds; never budget less than this for a wait
+DEFAULT_CALIBRATION_CYCLES = 3
+PROBE_TIMEOUT = 120            # seconds one probe may take before it is given up
+REBOOT_PROBE_TIMEOUT = 600     # seconds a probe reboot may take
+REBOOT_DOWN_TIMEOUT = 60       # seconds to see the device go away after system/restart
+PROBE_POLL_INTERVAL = 0.25     # calibration polls at a fixed, fine interval
+
+WAIT_KINDS = ("launch", "exit", "install", "uninstall", "settings", "reboot")
+
+# Boolean settings a probe may flip and put back, in order of preference
+PROBE_SETTINGS = ("mute", "textToSpeech", "highContrastText", "lowLatencyMode", "memc")
+
+
+def percentile(samples: List[float], pct: float = PROFILE_PERCENTILE) -> float:
+    """Nearest-rank percentile; with a handful of samples this is the slowest one."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def device_key(info: dict) -> Optional[str]:
+    """'manufacturer/model/firmwareVersion' from a device/info response, or None when it lacks them."""
+    if not isinstance(info, dict) or not info.get("model") or not info.get("firmwareVersion"):
+        return None
+    return "/".join(str(info.get(k) or "?") for k in ("manufacturer", "model", "firmwareVersion"))
+
+
+class WaitProfile:
+    """Calibrated wait samples (seconds) of one device model + firmware."""
+
+    def __init__(self, key: str, samples: Dict[str, List[float]], measured: Optional[str] = None):
+        self.key = key
+        self.samples = {kind: list(values) for kind, values in samples.items() if values}
+        self.measured = measured
+
+    def budget(self, kind: str, default: float) -> float:
+        values = self.samples.get(kind)
+        if not values:
+            return default
+        return round(max(MIN_PROFILE_BUDGET, percentile(values) * PROFILE_MARGIN), 1)
+
+    def describe(self) -> str:
+        return ", ".join(f"{kind} {self.budget(kind, 0):g}s" for kind in WAIT_KINDS if kind in self.samples) or "no samples"
+
+
+class WaitProfiles:
+    """All calibrated profiles, stored as JSON: key -> {"measured": str, "samples": {kind: [s, ...]}}."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or DEFAULT_PROFILE_PATH
+        self._profiles: Dict[str, dict] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._profiles = data
+            except Exception as e:
+                LOGGER.warn(f"Could not read wait profiles from '{self.path}'; using the default waits. {type(e).__name__}: {e}")
+
+    def get(self, key: Optional[str]) -> Optional[WaitProfile]:
+        entry = self._profiles.get(key) if key else None
+        if not isinstance(entry, dict) or not isinstance(entry.get("samples"), dict):
+            return None
+        return WaitProfile(key, entry["samples"], entry.get("measured"))
+
+    def put(self, profile: WaitProfile) -> None:
+        self._profiles[profile.key] = {"measured": profile.measured, "samples": profile.samples}
+
+    def save(self) -> None:
+        """Write the profiles (temp file + rename). Never raises."""
+        try:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path + ".partial"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._profiles, f, indent=4, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            LOGGER.warn(f"Could not save wait profiles to '{self.path}': {type(e).__name__}: {e}")
+
+
+def _request(tester, device_id, topic, body="{}") -> dict:
+    tester.execute_cmd(device_id, topic, body if isinstance(body, str) else json.dumps(body))
+    try:
+        value = response_data(tester.dab_client.response() or "{}")
+        return value if isinstance(value, dict) else {}
+    except Exception:
+        return {}
+
+
+def read_device_key(tester, device_id) -> Optional[str]:
+    info = _request(tester, device_id, "device/info")
+    return device_key(info) if info.get("status") == 200 else None
+
+
+def load_for_device(tester, device_id, path: Optional[str] = None) -> Optional[WaitProfile]:
+    """The stored profile for this device's model + firmware, or None (then the constants apply)."""
+    key = read_device_key(tester, device_id)
+    if key is None:
+        LOGGER.warn("device/info did not name the model and firmware; using the default waits.")
+        return None
+    profile = WaitProfiles(path).get(key)
+    if profile is None:
+        LOGGER.info(f"No wait profile for '{key}'; using the default waits (run --calibrate to create one).")
+    else:
+        LOGGER.info(f"Using the wait profile for '{key}' measured {profile.measured}: {profile.describe()}.")
+    return profile
+
+
+# ---------------------------------------------------------------------------
+# Probes: each returns the seconds from sending the request to the device showing the new state,
+# or None when the operation is unavailable or the state never showed up
+# ---------------------------------------------------------------------------
+
+def _timed(tester, device_id, topic, body, poll_topic, poll_body, predicate, label, timeout=PROBE_TIMEOUT) -> Optional[float]:
+    start = clock.monotonic()
+    answer = _request(tester, device_id, topic, body)
+    if answer.get("status") != 200:
+        LOGGER.warn(f"[CALIBRATE] {label}: {topic} answered {answer.get('status')}; probe skipped.")
+        return None
+    met, _ = wait_until(tester, device_id, poll_topic, poll_body, predicate, timeout,
+                        backoff=1.0, interval=PROBE_POLL_INTERVAL, label=f"[CALIBRATE] {label}")
+    return round(clock.monotonic() - start, 2) if met else None
+
+
+def _probe_app(tester, device_id, app_id, samples) -> None:
+    body = {"appId": app_id}
+    launch = _timed(tester, device_id, "applications/launch", body, "applications/get-state", body,
+                    app_state_is("FOREGROUND"), f"launch {app_id}")
+    if launch is None:
+        return
+    samples["launch"].append(launch)
+    exited = _timed(tester, device_id, "applications/exit", body, "applications/get-state", body,
+                    app_state_is_not("FOREGROUND"), f"exit {app_id}")
+    if exited is not None:
+        samples["exit"].append(exited)
+
+
+def _probe_install(tester, device_id, app_id, install_payload, samples) -> None:
+    listing = _request(tester, device_id, "applications/list")
+    installed = app_listed(app_id)(listing)
+    # Leave the device as it was: an installed app is removed and put back, a missing one added and removed
+    steps = (("uninstall", "install") if installed else ("install", "uninstall"))
+    for step in steps:
+        if step == "install":
+            took = _timed(tester, device_id, "applications/install", install_payload, "applications/list", {},
+                          app_listed(app_id), f"install {app_id}")
+        else:
+            took = _timed(tester, device_id, "applications/uninstall", {"appId": app_id}, "applications/list", {},
+                          app_listed(app_id, present=False), f"uninstall {app_id}")
+        if took is None:
+            return
+        samples[step].append(took)
+
+
+def _probe_setting(tester, device_id, samples) -> None:
+    current = _request(tester, device_id, "system/settings/get")
+    key = next((k for k in PROBE_SETTINGS if isinstance(current.get(k), bool)), None)
+    if key is None:
+        LOGGER.warn(f"[CALIBRATE] No boolean setting among {', '.join(PROBE_SETTINGS)} to flip; settings probe skipped.")
+        return
+    original = current[key]
+    for value in (not original, original):
+        took = _timed(tester, device_id, "system/settings/set", {key: value}, "system/settings/get", {},
+                      setting_is(key, value), f"{key} -> {value}")
+        if took is None:
+            return
+        samples["settings"].append(took)
+
+
+def _probe_reboot(tester, device_id, samples) -> None:
+    start = clock.monotonic()
+    tester.dab_client.cancel(tester.dab_client.submit(device_id, "system/restart", "{}"))
+    watch = watch_reboot(tester, device_id, REBOOT_PROBE_TIMEOUT, since=start, down_window=REBOOT_DOWN_TIMEOUT,
+                         label="[CALIBRATE] reboot")
+    # Until the device has been seen gone, a healthy answer is from before the restart
+    if not watch.went_down:
+        LOGGER.warn("[CALIBRATE] The device never stopped answering after system/restart; reboot probe skipped.")
+        return
+    if watch.healthy:
+        samples["reboot"].append(watch.healthy_s)
+
+
+def calibrate(tester, device_id, cycles: int = DEFAULT_CALIBRATION_CYCLES, path: Optional[str] = None,
+              reboot: bool = True) -> Optional[WaitProfile]:
+    """Time cycles rounds of each probe on device_id and save the profile under its model + firmware."""
+    key = read_device_key(tester, device_id)
+    if key is None:
+        LOGGER.error("device/info did not name the model and firmware; cannot calibrate.")
+        return None
+
+    app_id = config.apps.get("youtube", "YouTube")
+    sample_app = config.apps.get("sample_app", "Sample_App")
+    try:
+        install_payload = ensure_app_available(app_id=sample_app)
+    except Exception as e:
+        install_payload = None
+        LOGGER.warn(f"[CALIBRATE] No install artifact for '{sample_app}'; install/uninstall probes skipped. {e}")
+
+    samples: Dict[str, List[float]] = {kind: [] for kind in WAIT_KINDS}
+    LOGGER.result(f"Calibrating waits for '{key}' with {cycles} probe cycle(s).")
+    for cycle in range(1, cycles + 1):
+        LOGGER.result(f"[CALIBRATE] Cycle {cycle}/{cycles}")
+        _probe_app(tester, device_id, app_id, samples)
+        if install_payload is not None:
+            _probe_install(tester, device_id, sample_app, install_payload, samples)
+        _probe_setting(tester, device_id, samples)
+        if reboot:
+            _probe_reboot(tester, device_id, samples)
+
+    profile = WaitProfile(key, samples, clock.now().strftime("%Y-%m-%d %H:%M:%S"))
+    for kind in WAIT_KINDS:
+        values = samples[kind]
+        if values:
+            LOGGER.result(f"  {kind:<9}: {len(values)} sample(s), p{PROFILE_PERCENTILE} {percentile(values):.1f}s -> budget {profile.budget(kind, 0):g}s")
+        else:
+            LOGGER.result(f"  {kind:<9}: no samples; the default waits stay in use")
+    profiles = WaitProfiles(path)
+    profiles.put(profile)
+    profiles.save()
+    LOGGER.ok(f"Wait profile for '{key}' saved to {profiles.path}.")
+    return profile
@@ -0,0 +1,93 @@
+"""
+Wall-time budgets for tests and suites.
+
+run_with_budget() runs one test in a worker thread and stops waiting for it once its budget is spent.
+A Python thread cannot be killed, so the overrun test is abandoned instead: the next time it sends a
+DAB request or asks the operator a question, check_budget() raises BudgetExceeded in it and it unwinds
+on its own while the runner has already moved on. Until then its log lines are dropped (is_abandoned()),
+and an answer it was already waiting for when abandoned is thrown away (read_operator()).
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from typing import Optional
+
+from util import clock
+
+DEFAULT_TEST_BUDGET = 900   # seconds one test may take before it is abandoned (0 / None = no limit)
+
+_abandoned = set()
+_abandoned_lock = threading.Lock()
+
+
+class BudgetExceeded(Exception):
+    """Raised inside a test whose wall-time budget ran out; the runner has already recorded it as SKIPPED."""
+
+
+def is_abandoned() -> bool:
+    """True in a test thread the watchdog has given up on."""
+    with _abandoned_lock:
+        return threading.get_ident() in _abandoned
+
+
+def check_budget() -> None:
+    """Raise BudgetExceeded if the calling test thread has been abandoned by the watchdog."""
+    if is_abandoned():
+        raise BudgetExceeded("Test wall-time budget exceeded; abandoning this test.")
+
+
+def read_operator(read, *args):
+    """
+    read(*args) (readchar, input, ...) for a test thread. A thread abandoned while it waited gets
+    BudgetExceeded instead of the answer, so the key is thrown away rather than acted on; the
+    operator answers the prompt of the test that is actually running.
+    """
+    check_budget()
+    answer = read(*args)
+    check_budget()
+    return answer
+
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until a clock.monotonic() deadline, or None when there is none."""
+    return None if deadline is None else deadline - clock.monotonic()
+
+
+def run_with_budget(fn, budget: Optional[float], *args, **kwargs):
+    """
+    Call fn(*args, **kwargs) and wait at most budget seconds for it (None / <= 0 = wait for as long as it takes,
+    in the calling thread). Returns (finished, value): value is fn's return value when finished, None when the
+    budget ran out. An exception raised by fn is re-raised here.
+    """
+    if not budget or budget <= 0:
+        return True, fn(*args, **kwargs)
+
+    outcome = {}
+
+    def target():
+        try:
+            outcome["value"] = fn(*args, **kwargs)
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            with _abandoned_lock:
+                outcome["done"] = True
+                _abandoned.discard(threading.get_ident())
+
+    # The worker runs in a copy of the caller's context, so it logs where the caller does (RunLogger.held())
+    worker = threading.Thread(target=contextvars.copy_context().run, args=(target,), name="dab-test-watchdog", daemon=True)
+    worker.start()
+    worker.join(budget)
+    with _abandoned_lock:
+        # Decided under the lock, so a thread that just finished is never marked (its ident may be reused)
+        overrun = not outcome.get("done")
+        if overrun:
+            _abandoned.add(worker.ident)
+    if overrun:
+        return False, None
+    worker.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return True, outcome.get("value")